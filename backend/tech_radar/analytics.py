@@ -0,0 +1,241 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any
+
+from pydantic import BaseModel
+
+from tech_radar.cache import VersionedCache
+from tech_radar.database import aggregate
+from tech_radar.models import StageTransitionRecord, Technology
+
+MILLISECONDS_PER_DAY = 24 * 60 * 60 * 1000
+
+# The stages of the adoption funnel, in order
+FUNNEL_STAGES = ("Assess", "Trial", "Adopt")
+
+
+class StageTime(BaseModel):
+    """How long technologies stayed in a stage before they left it."""
+
+    mean_days: float
+    stays: int
+
+
+class FunnelCounts(BaseModel):
+    """Technologies that were assessed, and then trialed and adopted after their assessment."""
+
+    assessed: int
+    trialed: int
+    adopted: int
+
+
+class StuckTechnology(BaseModel):
+    name: str
+    category: str
+    stage: str
+    since: datetime
+    days: int
+
+
+class RadarAnalytics(BaseModel):
+    time_in_stage: dict[str, StageTime]
+    transitions_per_month: dict[str, int]
+    funnel: dict[str, FunnelCounts]
+    stuck_days: int
+    stuck: list[StuckTechnology]
+
+
+def _first_match(array: str, condition: dict[str, Any]) -> dict[str, Any]:
+    return {"$arrayElemAt": [{"$filter": {"input": array, "as": "t", "cond": condition}}, 0]}
+
+
+def _time_in_stage_facet() -> list[dict[str, Any]]:
+    # Every transition ends a stay in its original stage, which began with the previous
+    # transition of the technology (or with its discovery, for the first transition)
+    previous = _first_match(
+        "$allTransitions",
+        {"$eq": ["$$t.sequence", {"$subtract": ["$transitions.sequence", 1]}]},
+    )
+    entered_at = {"$ifNull": [previous, {"transitionDate": "$history.discoveryDate"}]}
+    return [
+        {"$addFields": {"allTransitions": "$transitions"}},
+        {"$unwind": "$transitions"},
+        {"$addFields": {"enteredAt": entered_at}},
+        {
+            "$group": {
+                "_id": "$transitions.originalStage",
+                "meanMilliseconds": {
+                    "$avg": {
+                        "$subtract": [
+                            "$transitions.transitionDate",
+                            "$enteredAt.transitionDate",
+                        ]
+                    }
+                },
+                "stays": {"$sum": 1},
+            }
+        },
+    ]
+
+
+def _entered(stage: str, after: str | None) -> list[dict[str, Any]]:
+    """Stages setting the first date a technology entered a stage (after a date), or null."""
+    condition: dict[str, Any] = {"$eq": ["$$t.newStage", stage]}
+    if after is not None:
+        condition = {"$and": [condition, {"$gte": ["$$t.transitionDate", after]}]}
+    first_entry = {"$min": "$entries.transitionDate"}
+    if after is None:
+        # Technologies discovered in the stage entered it at their discovery
+        entered: dict[str, Any] = {
+            "$min": [
+                {"$cond": [{"$eq": ["$initialStage", stage]}, "$history.discoveryDate", None]},
+                first_entry,
+            ]
+        }
+    else:
+        entered = {"$cond": [{"$eq": [{"$ifNull": [after, None]}, None]}, None, first_entry]}
+    return [
+        {
+            "$addFields": {
+                "entries": {"$filter": {"input": "$transitions", "as": "t", "cond": condition}}
+            }
+        },
+        {"$addFields": {f"entered{stage}": entered}},
+    ]
+
+
+def _funnel_facet() -> list[dict[str, Any]]:
+    # The stage technologies were discovered in is the one their first transition left
+    initial_transition = _first_match("$transitions", {"$eq": ["$$t.sequence", 1]})
+    stages: list[dict[str, Any]] = [
+        {"$addFields": {"initialStage": {"$ifNull": [initial_transition, {}]}}},
+        {"$addFields": {"initialStage": {"$ifNull": ["$initialStage.originalStage", "$stage"]}}},
+    ]
+    previous = None
+    for stage in FUNNEL_STAGES:
+        stages += _entered(stage, previous)
+        previous = f"$entered{stage}"
+
+    def reached(stage: str) -> dict[str, Any]:
+        return {"$sum": {"$cond": [{"$eq": [{"$ifNull": [f"$entered{stage}", None]}, None]}, 0, 1]}}
+
+    stages.append(
+        {
+            "$group": {
+                "_id": "$category",
+                **{stage: reached(stage) for stage in FUNNEL_STAGES},
+            }
+        }
+    )
+    return stages
+
+
+async def _aggregate_histories() -> dict[str, Any]:
+    pipeline: list[dict[str, Any]] = [
+        {
+            "$lookup": {
+                "from": StageTransitionRecord.get_collection_name(),
+                "localField": "name",
+                "foreignField": "technology",
+                "as": "transitions",
+            }
+        },
+        {"$facet": {"time_in_stage": _time_in_stage_facet(), "funnel": _funnel_facet()}},
+    ]
+    [facets] = await aggregate(Technology, pipeline)
+    return facets
+
+
+async def _count_transitions_per_month() -> dict[str, int]:
+    groups = await aggregate(
+        StageTransitionRecord,
+        [
+            {
+                "$group": {
+                    "_id": {"$dateToString": {"format": "%Y-%m", "date": "$transitionDate"}},
+                    "count": {"$sum": 1},
+                }
+            }
+        ],
+    )
+    return {group["_id"]: group["count"] for group in sorted(groups, key=lambda g: g["_id"])}
+
+
+async def _find_stuck(stuck_days: int, now: datetime) -> list[StuckTechnology]:
+    cutoff = now - timedelta(days=stuck_days)
+    query = {
+        "$or": [
+            {"history.lastTransition.transitionDate": {"$lt": cutoff}},
+            {"history.lastTransition": None, "history.discoveryDate": {"$lt": cutoff}},
+        ]
+    }
+    projection = {"name": 1, "category": 1, "stage": 1, "history": 1}
+    stuck = []
+    async for document in Technology.get_pymongo_collection().find(query, projection):
+        history = document["history"]
+        last_transition = history.get("lastTransition") or {}
+        since = last_transition.get("transitionDate", history["discoveryDate"])
+        stuck.append(
+            StuckTechnology(
+                name=document["name"],
+                category=document["category"],
+                stage=document["stage"],
+                since=since,
+                days=(now - since).days,
+            )
+        )
+    return sorted(stuck, key=lambda technology: (-technology.days, technology.name))
+
+
+# Computed analytics by stuck_days, until the next write to the technologies collection. The
+# stuck technologies also depend on the current time, which the TTL of the entries bounds.
+analytics_cache: VersionedCache[int, RadarAnalytics] = VersionedCache(
+    max_entries=16, ttl_seconds=60
+)
+
+
+async def find_analytics(stuck_days: int, version: int | None = None) -> RadarAnalytics:
+    """
+    Compute the analytics of the radar from the histories of the technologies.
+
+    Everything is computed by aggregation pipelines: a single ``$lookup`` of the transitions
+    of each technology feeds a ``$facet`` of the time spent in each stage and of the adoption
+    funnel per category, and the transitions per month and stuck technologies are two more
+    queries.
+
+    Args:
+        stuck_days: Technologies that have been in their current stage for longer than this
+        many days are stuck
+        version: The current version of the technologies collection. When given, the
+        analytics are cached until the collection changes
+    """
+    if version is not None:
+        cached_analytics = analytics_cache.get(version, stuck_days)
+        if cached_analytics is not None:
+            return cached_analytics
+
+    facets, transitions_per_month, stuck = await asyncio.gather(
+        _aggregate_histories(),
+        _count_transitions_per_month(),
+        _find_stuck(stuck_days, datetime.now()),
+    )
+    analytics = RadarAnalytics(
+        time_in_stage={
+            group["_id"]: StageTime(
+                mean_days=group["meanMilliseconds"] / MILLISECONDS_PER_DAY, stays=group["stays"]
+            )
+            for group in sorted(facets["time_in_stage"], key=lambda g: g["_id"])
+        },
+        transitions_per_month=transitions_per_month,
+        funnel={
+            group["_id"]: FunnelCounts(
+                assessed=group["Assess"], trialed=group["Trial"], adopted=group["Adopt"]
+            )
+            for group in sorted(facets["funnel"], key=lambda g: g["_id"])
+        },
+        stuck_days=stuck_days,
+        stuck=stuck,
+    )
+    if version is not None:
+        analytics_cache.set(version, stuck_days, analytics)
+    return analytics
@@ -0,0 +1,92 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class VersionedCache(Generic[K, V]):
+    """
+    Bounded in-process LRU cache whose entries belong to a version of the underlying data.
+
+    Entries are only returned for the version they were stored with, and observing a newer
+    version drops everything stored before it. Since the version itself lives in the database,
+    every worker process notices writes made by any other worker. The TTL is a safety net for
+    writes that do not bump the version (e.g. manual edits of the database).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._version = -1
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _observe(self, version: int) -> bool:
+        if version > self._version:
+            self._entries.clear()
+            self._version = version
+        return version == self._version
+
+    def get(self, version: int, key: K) -> V | None:
+        if not self._observe(version):
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, version: int, key: K, value: V) -> None:
+        # A reader that started before a write must not cache its now outdated result
+        if not self._observe(version) or self.max_entries <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._version = -1
+        self._entries.clear()
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesces concurrent calls with the same key into a single in-flight task.
+
+    The first caller of a key starts the task, and the callers that arrive while it runs await
+    the same task and share its result (or exception). Once the task is done the key is free
+    again, so results are not kept: caching them is up to the caller. A caller that is cancelled
+    (e.g. by a disconnected client) does not cancel the task the others are waiting on.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[K, asyncio.Future[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def run(self, key: K, call: Callable[[], Awaitable[V]]) -> V:
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(call())
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Future[V]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
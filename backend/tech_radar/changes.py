@@ -0,0 +1,100 @@
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from pymongo import UpdateMany
+
+from tech_radar.events import ChangeEvent, change_broker
+from tech_radar.models import Technology, TechnologyTombstone
+from tech_radar.versions import bump_version, get_version
+
+# Writes mark the documents they change as pending until they are stamped with the collection
+# version of the write, see publish_changes
+PENDING_FIELD = "syncPending"
+
+
+def _changed_since(since: int) -> dict[str, Any]:
+    return {"$or": [{"syncVersion": {"$gt": since}}, {PENDING_FIELD: True}]}
+
+
+async def add_tombstones(names: Iterable[str]) -> None:
+    """Record the deletion of technologies, to be published with ``publish_changes``."""
+    operations = [
+        UpdateMany(
+            {"name": name},
+            {"$set": {PENDING_FIELD: True, "deletedAt": datetime.now()}},
+            upsert=True,
+        )
+        for name in names
+    ]
+    if operations:
+        await TechnologyTombstone.get_pymongo_collection().bulk_write(operations, ordered=False)
+
+
+async def publish_changes(names: Iterable[str], deleted: bool = False) -> int:
+    """
+    Bump the technologies collection version and stamp the changed technologies with it.
+
+    Every write marks the documents it changes (technologies or tombstones) as pending in
+    the same operation, and then publishes them with this function. Since the version is
+    bumped after the documents were written, a reader that read version V before querying the
+    changes sees every write with a version up to V, either already stamped or still pending.
+    Pending documents are returned to every reader, so writes may be delivered twice but
+    never missed.
+
+    Args:
+        names: The names of the created, updated or deleted technologies
+        deleted: Whether the technologies were deleted (and tombstones were added for them)
+
+    Returns:
+        The new version of the technologies collection
+    """
+    names = list(names)
+    version = await bump_version(Technology)
+    stamp = {"$max": {"syncVersion": version}, "$unset": {PENDING_FIELD: ""}}
+    query = {"name": {"$in": names}, PENDING_FIELD: True}
+    await Technology.get_pymongo_collection().update_many(query, stamp)
+    await TechnologyTombstone.get_pymongo_collection().update_many(query, stamp)
+
+    change_broker.publish_local(
+        ChangeEvent(type="delete" if deleted else "upsert", names=sorted(names), version=version)
+    )
+    return version
+
+
+async def find_changes(since: int) -> tuple[int, list[Technology], list[str]]:
+    """
+    Find the technologies changed and deleted since a version of the collection.
+
+    Both queries are served by the ``syncVersion`` and pending flag indexes, so their cost
+    depends on the number of changes rather than on the size of the radar.
+
+    Args:
+        since: The version returned by the previous call, 0 to fetch everything
+
+    Returns:
+        The current version (to pass as ``since`` next time), the created or updated
+        technologies and the names of the deleted technologies
+    """
+    # Read first, everything written up to this version is stamped or still pending
+    version = await get_version(Technology)
+
+    technologies_query = _changed_since(since) if since > 0 else {}
+    documents = Technology.get_pymongo_collection().find(
+        technologies_query, {"searchTerms": 0, "nameSearchTerms": 0}
+    )
+    technologies = [Technology.model_validate(document) async for document in documents]
+
+    tombstones = TechnologyTombstone.get_pymongo_collection().find(
+        _changed_since(since), {"name": 1}
+    )
+    deleted = {tombstone["name"] async for tombstone in tombstones}
+    if deleted:
+        # Technologies may be created again after they were deleted
+        deleted -= set(
+            await Technology.get_pymongo_collection().distinct(
+                "name", {"name": {"$in": list(deleted)}}
+            )
+        )
+
+    return version, technologies, sorted(deleted)
@@ -0,0 +1,159 @@
+import gzip
+from collections.abc import Mapping
+
+import brotli
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from tech_radar.etags import encoded_etag
+from tech_radar.negotiation import accepted_values
+
+# Levels that favor speed, since responses that are not cached are compressed per request
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+
+# The content encodings responses can be compressed with, preferred first
+ENCODINGS = ("br", "zstd", "gzip")
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Pick the content encoding of a response from its request's ``Accept-Encoding`` header.
+
+    The encoding the client gives the highest quality wins, and ties are broken by the order of
+    ``ENCODINGS``. Returns None when the response should not be compressed.
+    """
+    qualities = dict(accepted_values(accept_encoding))
+
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = qualities.get(encoding, qualities.get("*", 0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        compressed: bytes = brotli.compress(content, quality=BROTLI_QUALITY)
+        return compressed
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(content)
+    return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class Compressor:
+    """How responses are compressed, configured by the COMPRESSION_MINIMUM_SIZE setting."""
+
+    def __init__(self, minimum_size: int = 1024) -> None:
+        # Smaller bodies are sent as they are, compressing them saves less than it costs
+        self.minimum_size = minimum_size
+
+    def encoding_for(self, scope: Scope, content: bytes) -> str | None:
+        # Empty bodies (like the ones of 304 responses) are never compressed
+        if not content or len(content) < self.minimum_size:
+            return None
+        return negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+
+
+# The compressor of this worker
+compressor = Compressor()
+
+
+class CompressibleBody:
+    """
+    A serialized response body that keeps its compressed variants.
+
+    Cached bodies are compressed once per encoding, the first time a client asks for it, and
+    the compressed bytes are cached along with the body.
+    """
+
+    __slots__ = ("content", "_compressed")
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self._compressed: dict[str, bytes] = {}
+
+    def compressed(self, encoding: str) -> bytes:
+        compressed = self._compressed.get(encoding)
+        if compressed is None:
+            compressed = self._compressed[encoding] = compress(self.content, encoding)
+        return compressed
+
+
+def _set_encoding(headers: MutableHeaders, encoding: str, length: int) -> None:
+    headers["Content-Encoding"] = encoding
+    headers["Content-Length"] = str(length)
+    # The compressed bytes are another representation than the identity ones
+    etag = headers.get("ETag")
+    if etag is not None:
+        headers["ETag"] = encoded_etag(etag, encoding)
+
+
+class CompressibleResponse(Response):
+    """A response of a ``CompressibleBody``, compressed with the encoding the client accepts."""
+
+    def __init__(
+        self,
+        body: CompressibleBody,
+        media_type: str,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        super().__init__(body.content, media_type=media_type, headers=headers)
+        self.compressible_body = body
+        self.headers.add_vary_header("Accept-Encoding")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        encoding = compressor.encoding_for(scope, self.compressible_body.content)
+        if encoding is not None:
+            self.body = self.compressible_body.compressed(encoding)
+            _set_encoding(self.headers, encoding, len(self.body))
+        await super().__call__(scope, receive, send)
+
+
+class CompressionMiddleware:
+    """
+    Compress the responses that are not compressed already, like Starlette's
+    ``GZipMiddleware`` but with brotli and zstd too.
+
+    Streamed responses (NDJSON, events) are sent as they are, so each chunk still reaches the
+    client as soon as it is written.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            response_start, start = start, None
+            headers = MutableHeaders(raw=response_start["headers"])
+            body = message.get("body", b"")
+            if not message.get("more_body", False) and "content-encoding" not in headers:
+                encoding = compressor.encoding_for(scope, body)
+                if len(body) >= compressor.minimum_size:
+                    headers.add_vary_header("Accept-Encoding")
+                if encoding is not None:
+                    body = compress(body, encoding)
+                    _set_encoding(headers, encoding, len(body))
+                    message = {**message, "body": body}
+            await send(response_start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,100 @@
+from inspect import isawaitable
+from typing import Any
+
+from beanie.odm.documents import Document
+from pymongo.errors import OperationFailure
+
+
+async def aggregate(
+    document: type[Document], pipeline: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """
+    Run an aggregation pipeline directly on the raw pymongo collection of a document.
+
+    Beanie's ``Document.aggregate`` awaits ``collection.aggregate(...)``, which is only a
+    coroutine on pymongo's ``AsyncMongoClient``. Motor style clients (like the mongomock client
+    used in the tests) return the cursor synchronously, so Beanie fails on them. Going through
+    the raw collection lets the same pipeline run against both.
+
+    Args:
+        document: The Beanie document class whose collection should be aggregated
+        pipeline: The aggregation pipeline stages
+
+    Returns:
+        The raw documents produced by the pipeline
+    """
+    cursor: Any = document.get_pymongo_collection().aggregate(pipeline)
+    if isawaitable(cursor):
+        cursor = await cursor
+    documents: list[dict[str, Any]] = await cursor.to_list(None)
+    return documents
+
+
+async def watch_collections(documents: list[type[Document]]) -> Any | None:
+    """
+    Open a change stream of the collections of some documents, with full documents on updates.
+
+    Returns:
+        The (async iterable and async context manager) change stream, or None if the
+        database doesn't support change streams
+    """
+    database = documents[0].get_pymongo_collection().database
+    watch = getattr(database, "watch", None)
+    if not callable(watch):
+        # mongomock has no change streams (the attribute is a collection named "watch")
+        return None
+
+    collections = [document.get_collection_name() for document in documents]
+    try:
+        stream: Any = watch(
+            [{"$match": {"ns.coll": {"$in": collections}}}], full_document="updateLookup"
+        )
+        if isawaitable(stream):
+            stream = await stream
+    except OperationFailure:
+        # Change streams are only available on replica sets and sharded clusters
+        return None
+    return stream
+
+
+NAME_INDEX = "name_1"
+
+
+class DuplicateNamesError(RuntimeError):
+    """Raised when technologies share names, which the unique name index would reject."""
+
+    def __init__(self, names: list[str]) -> None:
+        super().__init__(
+            "The name index can't be made unique, rename or delete the duplicated technologies: "
+            + ", ".join(names)
+        )
+        self.names = names
+
+
+async def make_name_index_unique(collection: Any) -> None:
+    """
+    Drop the name index of databases created while it was not unique, so that ``init_beanie``
+    creates it again as a unique index. Does nothing once the index is unique.
+
+    Args:
+        collection: The raw technologies collection, before ``init_beanie`` creates its indexes
+
+    Raises:
+        DuplicateNamesError: If technologies share names, in which case the index is kept
+    """
+    index = (await collection.index_information()).get(NAME_INDEX)
+    if index is None or index.get("unique", False):
+        return
+
+    cursor: Any = collection.aggregate(
+        [
+            {"$group": {"_id": "$name", "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+        ]
+    )
+    if isawaitable(cursor):
+        cursor = await cursor
+    duplicates = sorted(group["_id"] for group in await cursor.to_list(None))
+    if duplicates:
+        raise DuplicateNamesError(duplicates)
+    await collection.drop_index(NAME_INDEX)
@@ -0,0 +1,51 @@
+import hashlib
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a strong ETag out of the values that identify a representation.
+
+    Args:
+        parts: Values that change whenever the representation changes (e.g. a collection
+        version and the query that produced the response)
+
+    Returns:
+        The quoted entity tag, ready to be used as the value of an ``ETag`` header
+    """
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    Build the ETag of a representation compressed with a content encoding.
+
+    The compressed and identity variants of a response hold different bytes, so their strong
+    ETags have to differ too: the encoding is appended to the opaque tag.
+    """
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def matching_etag(if_none_match: str | None, etag: str) -> str | None:
+    """
+    Find the entity tag of an ``If-None-Match`` header that matches an ETag.
+
+    ``If-None-Match`` uses the weak comparison, so a ``W/`` prefix sent by the client (or added
+    by a proxy that re-encoded the body) is ignored, and so are the content encodings appended
+    by ``encoded_etag``, as every encoding of a representation is still up to date.
+
+    Returns:
+        The matching entity tag as the client sent it, to be echoed in the 304 response, or
+        None when no entity tag matches
+    """
+    if if_none_match is None:
+        return None
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return etag
+        opaque = candidate.removeprefix("W/")
+        if opaque == etag or opaque.startswith(f"{etag[:-1]}-"):
+            return candidate
+    return None
@@ -0,0 +1,128 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Literal
+
+from pydantic import BaseModel
+from pymongo.errors import PyMongoError
+
+from tech_radar.database import watch_collections
+from tech_radar.models import Technology, TechnologyTombstone
+
+logger = logging.getLogger(__name__)
+
+ChangeType = Literal["upsert", "delete"]
+
+
+class ChangeEvent(BaseModel):
+    """Technologies changed by a write, published with the collection version of the write."""
+
+    type: ChangeType
+    names: list[str]
+    version: int
+
+
+class Subscription:
+    """The queue of events of a single subscriber."""
+
+    __slots__ = ("queue", "dropped")
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue: asyncio.Queue[ChangeEvent] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+    async def get(self, timeout_seconds: float) -> ChangeEvent | None:
+        """
+        Wait for the next event.
+
+        Returns:
+            The event, or None if no event arrived within the timeout
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout_seconds)
+        except TimeoutError:
+            return None
+
+
+class ChangeBroker:
+    """
+    Fan-out of technology change events to the subscribers of this worker.
+
+    Subscribers are idle queues, so a worker can hold thousands of them. Publishing never
+    blocks: a subscriber whose queue is full is too slow to keep up and is dropped, and its
+    client is expected to reconnect and catch up through ``GET /technologies/changes``.
+
+    Events of writes made by any worker are received through a MongoDB change stream of the
+    version stamps of the technologies and tombstones (see ``tech_radar.changes``). Databases
+    without change streams (like the mongomock client of the tests) fall back to publishing
+    the events of the writes of this worker only.
+    """
+
+    def __init__(self, queue_size: int = 64) -> None:
+        self.queue_size = queue_size
+        self.follows_change_stream = False
+        self._subscriptions: set[Subscription] = set()
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[Subscription]:
+        subscription = Subscription(self.queue_size)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event: ChangeEvent) -> None:
+        for subscription in list(self._subscriptions):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                subscription.dropped = True
+                self._subscriptions.discard(subscription)
+
+    def publish_local(self, event: ChangeEvent) -> None:
+        """Publish an event of a write made by this worker, unless the change stream does."""
+        if not self.follows_change_stream:
+            self.publish(event)
+
+    def _publish_change(self, change: dict[str, Any]) -> None:
+        stamp = change.get("updateDescription", {}).get("updatedFields", {}).get("syncVersion")
+        document = change.get("fullDocument")
+        if stamp is None or document is None:
+            return
+
+        deleted = change["ns"]["coll"] == TechnologyTombstone.get_collection_name()
+        self.publish(
+            ChangeEvent(
+                type="delete" if deleted else "upsert",
+                names=[document["name"]],
+                version=int(stamp),
+            )
+        )
+
+    async def follow(self, retry_interval_seconds: float = 1) -> None:
+        """Publish the events of all the workers from a change stream, until cancelled."""
+        while True:
+            try:
+                stream = await watch_collections([Technology, TechnologyTombstone])
+                if stream is None:
+                    logger.info("Change streams are not supported, publishing local events only")
+                    return
+
+                self.follows_change_stream = True
+                async with stream:
+                    async for change in stream:
+                        self._publish_change(change)
+            except PyMongoError:
+                logger.exception("Technology events change stream failed, reopening it")
+            finally:
+                self.follows_change_stream = False
+            await asyncio.sleep(retry_interval_seconds)
+
+
+# The broker of this worker
+change_broker = ChangeBroker()
@@ -0,0 +1,272 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pydantic import BaseModel
+
+from tech_radar.cache import VersionedCache
+from tech_radar.database import aggregate
+from tech_radar.models import History, StageTransition, StageTransitionRecord, Technology
+from tech_radar.queries import InvalidCursorError
+from tech_radar.snapshot import RadarSnapshot
+
+
+class RecordedStageTransition(StageTransition):
+    newStage: str
+
+
+def new_transition(
+    technology: str, original_stage: str, new_stage: str, adr_link: str, sequence: int = 0
+) -> StageTransitionRecord:
+    return StageTransitionRecord(
+        technology=technology,
+        originalStage=original_stage,
+        newStage=new_stage,
+        transitionDate=datetime.now(),
+        adrLink=adr_link,
+        sequence=sequence,
+    )
+
+
+def summary_update(record: StageTransitionRecord) -> dict[str, Any]:
+    """The ``$set`` and ``$inc`` of the history summary of the technology of a new transition."""
+    last_transition = StageTransition(
+        originalStage=record.originalStage,
+        transitionDate=record.transitionDate,
+        adrLink=record.adrLink,
+    )
+    return {
+        "$set": {"history.lastTransition": last_transition.model_dump()},
+        "$inc": {"history.transitionCount": 1},
+    }
+
+
+async def insert_transitions(records: list[StageTransitionRecord]) -> None:
+    if records:
+        await StageTransitionRecord.insert_many(records)
+
+
+async def delete_transitions(names: Iterable[str]) -> None:
+    await StageTransitionRecord.get_pymongo_collection().delete_many(
+        {"technology": {"$in": list(names)}}
+    )
+
+
+def encode_history_cursor(record: StageTransitionRecord) -> str:
+    position = {"date": record.transitionDate.isoformat(), "id": str(record.id)}
+    return urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_history_cursor(cursor: str) -> tuple[datetime, ObjectId]:
+    try:
+        position = json.loads(urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(position["date"]), ObjectId(position["id"])
+    except (ValueError, KeyError, TypeError, AttributeError, InvalidId) as err:
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'") from err
+
+
+class TransitionsPage(BaseModel):
+    transitions: list[RecordedStageTransition]
+    next_cursor: str | None
+
+
+async def find_transitions(name: str, limit: int, after: str | None = None) -> TransitionsPage:
+    """
+    Fetch a page of the stage transitions of a technology, newest first.
+
+    Served by the (technology, transitionDate, _id) index, each page starts right after the
+    transition the previous page ended with.
+
+    Raises:
+        InvalidCursorError: If the ``after`` cursor was not produced by this function
+    """
+    query: dict[str, Any] = {"technology": name}
+    if after is not None:
+        after_date, after_id = decode_history_cursor(after)
+        query["$or"] = [
+            {"transitionDate": {"$lt": after_date}},
+            {"transitionDate": after_date, "_id": {"$lt": after_id}},
+        ]
+
+    # One extra transition tells whether there is a next page
+    records = (
+        await StageTransitionRecord.find(query)
+        .sort("-transitionDate", "-_id")
+        .limit(limit + 1)
+        .to_list()
+    )
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        next_cursor = encode_history_cursor(records[-1])
+
+    return TransitionsPage(
+        transitions=[
+            RecordedStageTransition.model_validate(record, from_attributes=True)
+            for record in records
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+async def migrate_embedded_transitions() -> None:
+    """
+    Move the stage transitions that are still embedded in technology documents to their own
+    collection, replacing them with the history summary.
+
+    Transitions are upserted by technology and date, which the unique (technology,
+    transitionDate) index makes idempotent: an interrupted migration can run again, and workers
+    that start at the same time record each transition once.
+    """
+    collection = Technology.get_pymongo_collection()
+    records = StageTransitionRecord.get_pymongo_collection()
+    async for document in collection.find({"history.stageTransitions": {"$exists": True}}):
+        transitions = sorted(
+            document["history"]["stageTransitions"], key=lambda t: t["transitionDate"]
+        )
+        # The stage each transition moved to is where the next one started from
+        new_stages = [t["originalStage"] for t in transitions[1:]] + [document["stage"]]
+        # One upsert at a time, as only single-document upserts are retried by the server when
+        # a concurrent one inserts the same transition
+        for sequence, (t, new_stage) in enumerate(
+            zip(transitions, new_stages, strict=False), start=1
+        ):
+            await records.update_one(
+                {"technology": document["name"], "transitionDate": t["transitionDate"]},
+                {"$set": {**t, "newStage": new_stage, "sequence": sequence}},
+                upsert=True,
+            )
+
+        await collection.update_one(
+            {"_id": document["_id"]},
+            {
+                "$set": {
+                    "history.lastTransition": transitions[-1] if transitions else None,
+                    "history.transitionCount": len(transitions),
+                },
+                "$unset": {"history.stageTransitions": ""},
+            },
+        )
+
+
+async def _first_transitions(
+    match: dict[str, Any], newest_first: bool
+) -> dict[str, StageTransitionRecord]:
+    # Sorted along the (technology, transitionDate, _id) index (or backwards along it), so the
+    # first transition of each technology is found with a seek of the index rather than a scan
+    direction = -1 if newest_first else 1
+    documents = await aggregate(
+        StageTransitionRecord,
+        [
+            {"$match": match},
+            {"$sort": {"technology": -direction, "transitionDate": direction, "_id": direction}},
+            {"$group": {"_id": "$technology", "transition": {"$first": "$$ROOT"}}},
+        ],
+    )
+    return {
+        document["_id"]: StageTransitionRecord.model_validate(document["transition"])
+        for document in documents
+    }
+
+
+# Fields of the technologies that past radars are built from, the history summary is replaced
+_AS_OF_FIELDS = {
+    "name": 1,
+    "category": 1,
+    "stage": 1,
+    "tags": 1,
+    "detailsPage": 1,
+    "searchTerms": 1,
+    "nameSearchTerms": 1,
+    "updatedAt": 1,
+    "history.discoveryDate": 1,
+    "history.transitionCount": 1,
+}
+
+# Reconstructed radars by date, until the next write to the technologies collection (which
+# stage transitions are written along with), so all the pages of a past radar share one
+radar_as_of_cache: VersionedCache[datetime, RadarSnapshot] = VersionedCache(
+    max_entries=8, ttl_seconds=60
+)
+
+
+async def load_radar_as_of(as_of: datetime, version: int | None = None) -> RadarSnapshot:
+    """
+    Reconstruct the radar as it was at a past date.
+
+    Technologies discovered after the date are left out, and the others get the stage and the
+    history summary of their last transition before the date (or the stage their first
+    transition left, if it came later). Only stages are versioned: the categories, tags and
+    details pages are the current ones, and deleted technologies are gone with their history.
+
+    The technologies are read once, without their history, and the stage of each one takes a
+    single seek of the (technology, transitionDate) index instead of a replay of its history.
+    The cost still grows with the size of the radar, which is why radars are cached.
+
+    Args:
+        as_of: The date, times without a timezone are local like the stored dates
+        version: The current version of the technologies collection. When given, the radar
+        is cached until the collection changes
+
+    Returns:
+        A snapshot of the radar, to query like the live radar. It is shared with the other
+        requests of the same date and must not be modified
+    """
+    if as_of.tzinfo is not None:
+        as_of = as_of.astimezone().replace(tzinfo=None)
+    if version is not None:
+        cached_snapshot = radar_as_of_cache.get(version, as_of)
+        if cached_snapshot is not None:
+            return cached_snapshot
+
+    documents = [
+        document
+        async for document in Technology.get_pymongo_collection().find(
+            {"history.discoveryDate": {"$lte": as_of}}, _AS_OF_FIELDS
+        )
+    ]
+
+    last_transitions = await _first_transitions(
+        {"transitionDate": {"$lte": as_of}}, newest_first=True
+    )
+    transitioned_later = [
+        document["name"]
+        for document in documents
+        if document["name"] not in last_transitions
+        and document["history"].get("transitionCount", 0) > 0
+    ]
+    next_transitions = (
+        await _first_transitions(
+            {"technology": {"$in": transitioned_later}, "transitionDate": {"$gt": as_of}},
+            newest_first=False,
+        )
+        if transitioned_later
+        else {}
+    )
+
+    snapshot = RadarSnapshot()
+    for document in documents:
+        discovery_date = document["history"]["discoveryDate"]
+        last = last_transitions.get(document["name"])
+        if last is not None:
+            document["stage"] = last.newStage
+            history = History(
+                discoveryDate=discovery_date,
+                lastTransition=StageTransition.model_validate(last, from_attributes=True),
+                transitionCount=last.sequence,
+            )
+        else:
+            following = next_transitions.get(document["name"])
+            if following is not None:
+                document["stage"] = following.originalStage
+            history = History(discoveryDate=discovery_date)
+        document["history"] = history.model_dump()
+        snapshot.upsert(document)
+    snapshot.ready = True
+    if version is not None:
+        radar_as_of_cache.set(version, as_of, snapshot)
+    return snapshot
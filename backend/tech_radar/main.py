@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -8,10 +9,32 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pymongo import AsyncMongoClient
 
-from tech_radar.models import Technology
+from tech_radar.analytics import analytics_cache
+from tech_radar.compression import CompressionMiddleware, compressor
+from tech_radar.database import make_name_index_unique
+from tech_radar.events import change_broker
+from tech_radar.history import migrate_embedded_transitions, radar_as_of_cache
+from tech_radar.models import (
+    CollectionVersion,
+    StageTransitionRecord,
+    Technology,
+    TechnologyTombstone,
+)
+from tech_radar.queries import list_counts_cache
+from tech_radar.routes.analytics import router as analytics_router
 from tech_radar.routes.ping import router as ping_router
+from tech_radar.routes.technologies import list_cache, technology_cache
 from tech_radar.routes.technologies import router as technologies_router
+from tech_radar.serialization import response_serializer
 from tech_radar.settings import load_settings
+from tech_radar.snapshot import radar_snapshot
+
+
+async def migrate_database() -> None:
+    """Bring the documents stored by earlier versions of the API up to date."""
+    # The embedded transitions go first, before anything rewrites the technology documents
+    await migrate_embedded_transitions()
+    await Technology.backfill_search_terms()
 
 
 @asynccontextmanager
@@ -19,10 +42,46 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # Startup
     settings = load_settings()
     client: AsyncMongoClient[Technology] = AsyncMongoClient[Technology](str(settings.mongo_uri))
-    await init_beanie(database=client.get_database("tech_radar"), document_models=[Technology])
+    database = client.get_database("tech_radar")
+    # Before init_beanie, which creates the unique name index (the collection is named after
+    # the document class)
+    await make_name_index_unique(database.get_collection(Technology.__name__))
+    await init_beanie(
+        database=database,
+        document_models=[
+            Technology,
+            CollectionVersion,
+            TechnologyTombstone,
+            StageTransitionRecord,
+        ],
+    )
+    await migrate_database()
+    list_cache.max_entries = settings.list_cache_max_entries
+    list_cache.ttl_seconds = settings.list_cache_ttl_seconds
+    technology_cache.max_entries = settings.technology_cache_max_entries
+    technology_cache.ttl_seconds = settings.list_cache_ttl_seconds
+    analytics_cache.ttl_seconds = settings.list_cache_ttl_seconds
+    radar_as_of_cache.ttl_seconds = settings.list_cache_ttl_seconds
+    list_counts_cache.max_entries = settings.list_cache_max_entries
+    list_counts_cache.ttl_seconds = settings.list_cache_ttl_seconds
+    response_serializer.fast = settings.response_serialization == "fast"
+    compressor.minimum_size = settings.compression_minimum_size
+
+    snapshot_task = None
+    if settings.read_mode == "memory":
+        await radar_snapshot.load()
+        snapshot_task = asyncio.create_task(
+            radar_snapshot.follow(settings.snapshot_poll_interval_seconds)
+        )
+
+    change_broker.queue_size = settings.events_queue_size
+    events_task = asyncio.create_task(change_broker.follow())
 
     yield
-    # Shutdown (if needed)
+    # Shutdown
+    events_task.cancel()
+    if snapshot_task is not None:
+        snapshot_task.cancel()
 
 
 app = FastAPI(title="tech-radar backend", lifespan=lifespan)
@@ -43,6 +102,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compresses the responses the routes did not compress from their cache
+app.add_middleware(CompressionMiddleware)
 
 app.include_router(ping_router)
 app.include_router(technologies_router)
+app.include_router(analytics_router)
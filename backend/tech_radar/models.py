@@ -1,9 +1,12 @@
 from datetime import datetime
 from typing import Annotated
 
-from beanie import Indexed
+from beanie import Indexed, Insert, Replace, Save, before_event
 from beanie.odm.documents import Document
 from pydantic import BaseModel, Field
+from pymongo import IndexModel, UpdateMany
+
+from tech_radar.search import name_search_terms, search_terms
 
 
 class StageTransition(BaseModel):
@@ -13,14 +16,17 @@ class StageTransition(BaseModel):
 
 
 class History(BaseModel):
-    stageTransitions: list[StageTransition]
     discoveryDate: datetime
+    # Summary of the stage transitions, which are stored in their own collection (see
+    # StageTransitionRecord and GET /technologies/{name}/history)
+    lastTransition: StageTransition | None = None
+    transitionCount: int = 0
 
 
-category_field = Field(
-    ..., pattern="^(Observability|Development Tools|Frameworks|Data Management)$"
-)
-stage_field = Field(..., pattern="^(Hold|Assess|Trial|Adopt)$")
+CATEGORY_PATTERN = "^(Observability|Development Tools|Frameworks|Data Management)$"
+category_field = Field(..., pattern=CATEGORY_PATTERN)
+STAGE_PATTERN = "^(Hold|Assess|Trial|Adopt)$"
+stage_field = Field(..., pattern=STAGE_PATTERN)
 
 
 class Technology(Document):
@@ -30,6 +36,112 @@ class Technology(Document):
     tags: list[str]
     detailsPage: str | None
     history: History
+    # Internal search index fields (see tech_radar.search), they are never sent to clients
+    searchTerms: list[str] = Field(default_factory=list, exclude=True)
+    nameSearchTerms: list[str] = Field(default_factory=list, exclude=True)
+    updatedAt: datetime | None = None
+    # Incremented by every update, identifies the version of the technology in its ETag
+    revision: int = Field(default=0, exclude=True)
+    # Collection version of the last write and whether that write is still being published,
+    # see tech_radar.changes
+    syncVersion: int = Field(default=0, exclude=True)
+    syncPending: bool = Field(default=False, exclude=True)
+
+    @before_event(Insert, Replace, Save)
+    def update_search_terms(self) -> None:
+        self.searchTerms = search_terms(self.name, self.category, self.tags)
+        self.nameSearchTerms = name_search_terms(self.name)
+
+    @classmethod
+    async def backfill_search_terms(cls) -> None:
+        """Compute the search terms of technologies that were stored before search terms existed."""
+        # Only the search terms are set, the rest of the stored documents may predate the model
+        collection = cls.get_pymongo_collection()
+        operations = [
+            UpdateMany(
+                {"_id": document["_id"]},
+                {
+                    "$set": {
+                        "searchTerms": search_terms(
+                            document["name"], document["category"], document.get("tags", [])
+                        ),
+                        "nameSearchTerms": name_search_terms(document["name"]),
+                    }
+                },
+            )
+            async for document in collection.find(
+                {"nameSearchTerms": {"$exists": False}}, {"name": 1, "category": 1, "tags": 1}
+            )
+        ]
+        if operations:
+            await collection.bulk_write(operations)
+
+    class Settings:
+        indexes = [
+            [("category", 1)],
+            [("stage", 1)],
+            [("tags", 1)],
+            [("searchTerms", 1)],
+            [("syncVersion", 1)],
+            [("syncPending", 1)],
+        ]
+
+
+class TechnologySummary(BaseModel):
+    """A technology without its history, for list views that don't display it."""
+
+    name: str
+    category: str
+    stage: str
+    tags: list[str]
+    detailsPage: str | None
+
+
+class CollectionVersion(Document):
+    """
+    Write counter of a collection.
+
+    Every write route bumps the counter of the collection it changed, which lets read caches of
+    all the workers notice that their entries are stale.
+    """
+
+    collection: Annotated[str, Indexed(unique=True)]
+    version: int
+
+    class Settings:
+        name = "collection_versions"
+
+
+class TechnologyTombstone(Document):
+    """Record of a deleted technology, kept so mirrors of the radar can sync deletions."""
+
+    name: Annotated[str, Indexed(unique=True)]
+    deletedAt: datetime
+    syncVersion: int = 0
+    syncPending: bool = False
+
+    class Settings:
+        name = "technology_tombstones"
+        indexes = [[("syncVersion", 1)], [("syncPending", 1)]]
+
+
+class StageTransitionRecord(Document):
+    """A stage transition of a technology."""
+
+    technology: str
+    originalStage: str
+    newStage: str
+    transitionDate: datetime
+    adrLink: str
+    # Position of the transition in the history of its technology, 1 for the first one. This
+    # is the transitionCount of the technology right after the transition.
+    sequence: int = 0
 
     class Settings:
-        indexes = [[("name", 1)], [("category", 1)], [("stage", 1)], [("tags", 1)]]
+        name = "stage_transitions"
+        indexes = [
+            [("technology", 1), ("transitionDate", -1), ("_id", -1)],
+            # A technology can't have two transitions at the same time, which also keeps the
+            # migration of embedded transitions from recording one twice
+            IndexModel([("technology", 1), ("transitionDate", 1)], unique=True),
+        ]
@@ -0,0 +1,30 @@
+def quality(parameters: str) -> float:
+    """
+    Read the quality value (``q``) of an element of an ``Accept``-style header.
+
+    Args:
+        parameters: The parameters of the element, what follows its first ``;``
+
+    Returns:
+        The quality, 1 when it is not given and 0 when it is not a number
+    """
+    for parameter in parameters.split(";"):
+        name, _, value = parameter.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0
+    return 1
+
+
+def accepted_values(header: str | None) -> list[tuple[str, float]]:
+    """
+    Split an ``Accept``-style header (``Accept``, ``Accept-Encoding``) into its values, in
+    lowercase, along with their qualities, in the order of the header.
+    """
+    values = []
+    for element in (header or "").split(","):
+        value, _, parameters = element.partition(";")
+        values.append((value.strip().lower(), quality(parameters)))
+    return values
@@ -0,0 +1,454 @@
+import asyncio
+import json
+import re
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict
+
+from tech_radar.cache import VersionedCache
+from tech_radar.database import aggregate
+from tech_radar.models import Technology, TechnologySummary
+from tech_radar.search import query_terms
+
+SearchMode = Literal["prefix", "substring"]
+View = Literal["full", "summary"]
+
+# Fields fetched from the database for each view. The search terms are never sent to clients, and
+# the history (which only grows) is left out of summaries.
+_PROJECTIONS: dict[View, dict[str, Any]] = {
+    "full": {"searchTerms": 0, "nameSearchTerms": 0},
+    "summary": {"history": 0, "searchTerms": 0, "nameSearchTerms": 0},
+}
+
+
+def _projection(view: View) -> dict[str, Any]:
+    # Copied since mongomock adds the _id to the projection it's given
+    return dict(_PROJECTIONS[view])
+
+
+def _hydrate(document: dict[str, Any], view: View) -> Technology | TechnologySummary:
+    if view == "summary":
+        return TechnologySummary.model_validate(document)
+    technology: Technology = Technology.model_validate(document)
+    return technology
+
+
+# Field holding the relevance score of search results in the list aggregation
+RELEVANCE_FIELD = "_score"
+
+
+def _non_empty(values: list[str] | None) -> tuple[str, ...]:
+    return tuple(sorted({value for value in values or [] if len(value) > 0}))
+
+
+class TechnologyFilters(BaseModel):
+    """
+    Normalized filters of a technologies list query.
+
+    Empty values are dropped and the lists are de-duplicated and sorted, so two requests that
+    ask for the same thing produce equal (and hashable) filters.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    search: str | None = None
+    search_mode: SearchMode = "prefix"
+    categories: tuple[str, ...] = ()
+    stages: tuple[str, ...] = ()
+    tags: tuple[str, ...] = ()
+
+    @classmethod
+    def from_query(
+        cls,
+        search: str | None,
+        categories: list[str] | None,
+        stages: list[str] | None,
+        tags: list[str] | None,
+        search_mode: SearchMode = "prefix",
+    ) -> "TechnologyFilters":
+        return cls(
+            search=search or None,
+            search_mode=search_mode,
+            categories=_non_empty(categories),
+            stages=_non_empty(stages),
+            tags=_non_empty(tags),
+        )
+
+    def to_mongo(self) -> dict[str, Any]:
+        """
+        Build the MongoDB filter document.
+
+        All filters are combined with AND logic, values of the same filter with OR logic.
+        """
+        query_filters: dict[str, Any] = {}
+
+        # Text search across name, category, and tags
+        if self.search and self.search_mode == "prefix":
+            terms = query_terms(self.search)
+            if terms:
+                query_filters["searchTerms"] = {"$all": terms}
+        elif self.search:
+            # Unanchored regexes can't use indexes, so this scans the whole collection
+            search_regex = {"$regex": re.escape(self.search), "$options": "i"}
+            query_filters["$or"] = [
+                {"name": search_regex},
+                {"category": search_regex},
+                {"tags": search_regex},
+            ]
+
+        if self.categories:
+            query_filters["category"] = {"$in": list(self.categories)}
+
+        if self.stages:
+            query_filters["stage"] = {"$in": list(self.stages)}
+
+        if self.tags:
+            query_filters["tags"] = {"$in": list(self.tags)}
+
+        return query_filters
+
+    def ranking(self) -> dict[str, Any] | None:
+        """
+        Build the relevance score expression of a prefix search.
+
+        Every searched word that begins a word of the technology name scores a point, and a name
+        equal to the whole search outranks any partial match.
+
+        Returns:
+            The score expression, or None if the results should be ordered by name
+        """
+        if not self.search or self.search_mode != "prefix":
+            return None
+        terms = query_terms(self.search)
+        if not terms:
+            return None
+
+        name_terms = {"$ifNull": ["$nameSearchTerms", []]}
+        exact_name = {"$eq": [{"$toLower": "$name"}, self.search.strip().lower()]}
+        return {
+            "$add": [
+                {"$cond": [exact_name, len(terms) + 1, 0]},
+                *({"$cond": [{"$in": [term, name_terms]}, 1, 0]} for term in terms),
+            ]
+        }
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor was not produced by this API."""
+
+
+def encode_cursor(name: str, score: int | None = None) -> str:
+    position: dict[str, Any] = {"name": name}
+    if score is not None:
+        position["score"] = score
+    return urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, int | None]:
+    try:
+        position = json.loads(urlsafe_b64decode(cursor.encode()))
+        score = position.get("score")
+        return str(position["name"]), None if score is None else int(score)
+    except (ValueError, KeyError, TypeError, AttributeError) as err:
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'") from err
+
+
+# Technologies of a list response when the client doesn't ask for a limit, and the largest limit
+# it can ask for. Streams are not limited, they hold a single batch in memory (see iter_documents)
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+
+class Page(BaseModel):
+    """
+    Keyset pagination of the technologies list.
+
+    Technologies are ordered by their unique name (or by search relevance, then name), and each
+    page starts right after the technology the previous page ended with, so fetching a page
+    never has to skip over earlier results. A page without a limit holds every technology that
+    comes after it.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    limit: int | None = None
+    after: str | None = None
+    after_score: int | None = None
+
+    @classmethod
+    def from_query(cls, limit: int | None, after: str | None) -> "Page":
+        if after is None:
+            return cls(limit=limit)
+        after_name, after_score = decode_cursor(after)
+        return cls(limit=limit, after=after_name, after_score=after_score)
+
+    def apply(self, query_filters: dict[str, Any]) -> dict[str, Any]:
+        """Restrict MongoDB filters to the technologies that come after the previous page."""
+        if self.after is None:
+            return query_filters
+        return {**query_filters, "name": {"$gt": self.after}}
+
+    def apply_ranked(self, query_filters: dict[str, Any]) -> dict[str, Any]:
+        """Same as ``apply`` for results ordered by their relevance ``_score``."""
+        if self.after is None or self.after_score is None:
+            return self.apply(query_filters)
+        return {
+            **query_filters,
+            "$or": [
+                {RELEVANCE_FIELD: {"$lt": self.after_score}},
+                {RELEVANCE_FIELD: self.after_score, "name": {"$gt": self.after}},
+            ],
+        }
+
+
+class TechnologyListResult(BaseModel):
+    technologies: list[Technology | TechnologySummary]
+    # The raw documents of the technologies instead, see find_technologies
+    documents: list[dict[str, Any]] = []
+    total_count: int
+    next_cursor: str | None
+    category_counts: dict[str, int]
+    stage_counts: dict[str, int]
+    tag_counts: dict[str, int]
+    category_stage_counts: dict[str, dict[str, int]]
+    available_tags: list[str]
+
+
+def _count_by(field: str) -> dict[str, Any]:
+    return {"$group": {"_id": f"${field}", "count": {"$sum": 1}}}
+
+
+def _to_counts(groups: list[dict[str, Any]]) -> dict[str, int]:
+    return {group["_id"]: group["count"] for group in sorted(groups, key=lambda g: g["_id"])}
+
+
+def _sum_counts(counts: Iterable[tuple[str, int]]) -> dict[str, int]:
+    sums: dict[str, int] = {}
+    for value, count in counts:
+        sums[value] = sums.get(value, 0) + count
+    return dict(sorted(sums.items()))
+
+
+# The available tags only change on writes, so they are fetched once per collection version
+# instead of by every list query
+available_tags_cache: VersionedCache[str, list[str]] = VersionedCache(max_entries=1, ttl_seconds=60)
+
+
+async def find_available_tags(version: int | None = None) -> list[str]:
+    """
+    Find all the tags used by technologies in the whole collection, served by the tags index.
+
+    Args:
+        version: The current version of the technologies collection. When given, the tags
+        are cached until the collection changes
+    """
+    if version is not None:
+        cached_tags = available_tags_cache.get(version, "tags")
+        if cached_tags is not None:
+            return cached_tags
+
+    tags = sorted(await Technology.distinct("tags"))
+    if version is not None:
+        available_tags_cache.set(version, "tags", tags)
+    return tags
+
+
+async def _find_page(filters: TechnologyFilters, page: Page, view: View) -> list[dict[str, Any]]:
+    ranking = filters.ranking()
+    # One extra technology tells whether there is a next page
+    limit = None if page.limit is None else page.limit + 1
+    if ranking is None:
+        # Walks the unique name index from the end of the previous page
+        cursor = (
+            Technology.get_pymongo_collection()
+            .find(page.apply(filters.to_mongo()), _projection(view))
+            .sort("name", 1)
+        )
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        return [document async for document in cursor]
+
+    # Relevance is computed per technology, so ranked searches sort the technologies matching
+    # the search terms. The $limit right after the $sort keeps only the top of the page in memory.
+    pipeline: list[dict[str, Any]] = [
+        {"$match": filters.to_mongo()},
+        {"$addFields": {RELEVANCE_FIELD: ranking}},
+        {"$match": page.apply_ranked({})},
+        {"$sort": {RELEVANCE_FIELD: -1, "name": 1}},
+    ]
+    if limit is not None:
+        pipeline.append({"$limit": limit})
+    pipeline.append({"$project": _projection(view)})
+    return await aggregate(Technology, pipeline)
+
+
+class ListCounts(BaseModel):
+    """The numbers of technologies matching the filters of a list, by category x stage and tag."""
+
+    category_stage: list[tuple[str, str, int]]
+    tags: dict[str, int]
+
+
+# Counts of the matching technologies by filters, shared by all the pages of a list
+list_counts_cache: VersionedCache[TechnologyFilters, ListCounts] = VersionedCache(
+    max_entries=256, ttl_seconds=60
+)
+
+
+async def _count_matches(filters: TechnologyFilters, version: int | None) -> ListCounts:
+    if version is not None:
+        cached_counts = list_counts_cache.get(version, filters)
+        if cached_counts is not None:
+            return cached_counts
+
+    pipeline: list[dict[str, Any]] = [
+        {"$match": filters.to_mongo()},
+        {
+            "$facet": {
+                "category_stage": [
+                    {
+                        "$group": {
+                            "_id": {"category": "$category", "stage": "$stage"},
+                            "count": {"$sum": 1},
+                        }
+                    }
+                ],
+                "tags": [{"$unwind": "$tags"}, _count_by("tags")],
+            }
+        },
+    ]
+    [facets] = await aggregate(Technology, pipeline)
+    counts = ListCounts(
+        category_stage=sorted(
+            (group["_id"]["category"], group["_id"]["stage"], group["count"])
+            for group in facets["category_stage"]
+        ),
+        tags=_to_counts(facets["tags"]),
+    )
+    if version is not None:
+        list_counts_cache.set(version, filters, counts)
+    return counts
+
+
+async def find_technologies(
+    filters: TechnologyFilters,
+    page: Page | None = None,
+    version: int | None = None,
+    view: View = "full",
+    hydrate: bool = True,
+) -> TechnologyListResult:
+    """
+    Fetch a page of the technologies matching the filters together with the list metadata.
+
+    The page is a query on the unique name index that starts after the previous page (ranked
+    searches sort the technologies matching their search terms instead), so its cost grows with
+    the size of the page rather than with the number of matching technologies. The counts of
+    the matching technologies per category, stage, tag and category x stage are a separate
+    aggregation that only returns the counts, cached for all the pages of the same filters. The
+    available tags are taken from the whole collection (see ``find_available_tags``) so the
+    client can always offer every tag as a filter option.
+
+    Args:
+        filters: The filters the technologies should match
+        page: The page to fetch, everything is fetched by default
+        version: The current version of the technologies collection, used for caching
+        view: full technologies, or summaries without the history (which is then not even
+        fetched from the database)
+        hydrate: Whether to validate the documents into models. Otherwise the raw documents
+        are returned in ``documents``, for the fast serialization path (see
+        ``tech_radar.serialization``)
+    """
+    page = page or Page()
+    documents, counts, available_tags = await asyncio.gather(
+        _find_page(filters, page, view),
+        _count_matches(filters, version),
+        find_available_tags(version),
+    )
+
+    next_cursor = None
+    if page.limit is not None and len(documents) > page.limit:
+        documents = documents[: page.limit]
+        last = documents[-1]
+        next_cursor = encode_cursor(last["name"], last.get(RELEVANCE_FIELD))
+
+    groups = counts.category_stage
+    category_stage_counts: dict[str, dict[str, int]] = {}
+    for category, stage, count in groups:
+        category_stage_counts.setdefault(category, {})[stage] = count
+
+    metadata: dict[str, Any] = {
+        "total_count": sum(count for _, _, count in groups),
+        "next_cursor": next_cursor,
+        "category_counts": _sum_counts((category, count) for category, _, count in groups),
+        "stage_counts": _sum_counts((stage, count) for _, stage, count in groups),
+        "tag_counts": counts.tags,
+        "category_stage_counts": category_stage_counts,
+        "available_tags": available_tags,
+    }
+    if not hydrate:
+        # Constructed without validation, which would turn the documents into models
+        return TechnologyListResult.model_construct(
+            technologies=[], documents=documents, **metadata
+        )
+    return TechnologyListResult(technologies=[_hydrate(doc, view) for doc in documents], **metadata)
+
+
+# Documents fetched per round trip when streaming, large enough to keep the number of round trips
+# low while bounding the memory held by each stream
+STREAM_BATCH_SIZE = 500
+
+
+async def iter_documents(
+    filters: TechnologyFilters, page: Page | None = None, view: View = "full"
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Iterate over the raw documents of the technologies matching the filters, ordered by name
+    (searches are not ranked by relevance).
+
+    Unlike ``find_technologies`` the documents are pulled from a cursor batch by batch, so only a
+    single batch is held in memory at any time.
+    """
+    page = page or Page()
+    cursor = (
+        Technology.get_pymongo_collection()
+        .find(page.apply(filters.to_mongo()), _projection(view), batch_size=STREAM_BATCH_SIZE)
+        .sort("name", 1)
+    )
+    if page.limit is not None:
+        cursor = cursor.limit(page.limit)
+
+    async for document in cursor:
+        yield document
+
+
+async def iter_technologies(
+    filters: TechnologyFilters, page: Page | None = None, view: View = "full"
+) -> AsyncIterator[Technology | TechnologySummary]:
+    """Same as ``iter_documents``, with the documents validated into models."""
+    async for document in iter_documents(filters, page, view):
+        yield _hydrate(document, view)
+
+
+async def find_technology(name: str) -> Technology | None:
+    """Find a single technology by its unique name."""
+    document = await Technology.get_pymongo_collection().find_one(
+        {"name": name}, _projection("full")
+    )
+    if document is None:
+        return None
+    technology: Technology = Technology.model_validate(document)
+    return technology
+
+
+async def find_technologies_by_name(
+    names: Iterable[str], view: View = "full"
+) -> list[Technology | TechnologySummary]:
+    """Find the technologies with the given names with a single query, ordered by name."""
+    cursor = (
+        Technology.get_pymongo_collection()
+        .find({"name": {"$in": list(names)}}, _projection(view))
+        .sort("name", 1)
+    )
+    return [_hydrate(document, view) async for document in cursor]
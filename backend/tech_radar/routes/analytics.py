@@ -0,0 +1,45 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from tech_radar.analytics import RadarAnalytics, find_analytics
+from tech_radar.models import Technology
+from tech_radar.routes.safe_endpoint import safe_endpoint
+from tech_radar.versions import get_version
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+@router.get("/", response_model=RadarAnalytics)
+@safe_endpoint
+async def get_analytics(
+    stuck_days: Annotated[
+        int,
+        Query(ge=1, description="Days in the same stage after which a technology is stuck"),
+    ] = 180,
+) -> RadarAnalytics:
+    """
+    Retrieve analytics of the radar computed from the stage transition histories.
+
+    Args:
+        stuck_days: Optional number of days (180 by default) a technology can stay in its
+        current stage before it is reported as stuck
+
+    Returns:
+        RadarAnalytics containing:
+            - time_in_stage: Mean number of days technologies stayed in each stage before
+              leaving it, and the number of such stays
+            - transitions_per_month: Number of stage transitions per month (YYYY-MM)
+            - funnel: Per category, the number of technologies that were assessed, and of
+              those the ones that were trialed and then adopted afterwards
+            - stuck_days: The given stuck_days
+            - stuck: Technologies in their current stage for longer than stuck_days, the
+              longest first
+
+    Note:
+        The analytics are computed by MongoDB aggregation pipelines and cached until the next
+        write to the technologies collection, so dashboards that refresh them periodically
+        don't recompute them over the whole history. Stuck technologies may be reported up to
+        a cache TTL late.
+    """
+    return await find_analytics(stuck_days, await get_version(Technology))
@@ -1,46 +1,206 @@
-import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Annotated, Any
 
 from beanie.exceptions import RevisionIdWasChanged
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
-from pymongo.errors import DuplicateKeyError
+from fastapi import APIRouter, Body, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from pymongo import ReturnDocument, UpdateMany
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
+from tech_radar.cache import SingleFlight, VersionedCache
+from tech_radar.changes import PENDING_FIELD, add_tombstones, find_changes, publish_changes
+from tech_radar.compression import CompressibleBody, CompressibleResponse
+from tech_radar.etags import make_etag, matching_etag
+from tech_radar.events import Subscription, change_broker
+from tech_radar.history import (
+    TransitionsPage,
+    delete_transitions,
+    find_transitions,
+    insert_transitions,
+    load_radar_as_of,
+    new_transition,
+    summary_update,
+)
 from tech_radar.models import (
+    CATEGORY_PATTERN,
+    STAGE_PATTERN,
     History,
-    StageTransition,
+    StageTransitionRecord,
     Technology,
+    TechnologySummary,
     category_field,
     stage_field,
 )
+from tech_radar.queries import (
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    InvalidCursorError,
+    Page,
+    SearchMode,
+    TechnologyFilters,
+    View,
+    find_technologies,
+    find_technologies_by_name,
+    find_technology,
+    iter_documents,
+    iter_technologies,
+)
 from tech_radar.routes.safe_endpoint import safe_endpoint
+from tech_radar.search import search_terms
+from tech_radar.serialization import (
+    MEDIA_TYPES,
+    dumps,
+    encode,
+    encode_model,
+    negotiate_media_type,
+    response_serializer,
+    technology_json,
+)
+from tech_radar.snapshot import radar_snapshot
+from tech_radar.versions import get_version
 
 router = APIRouter(prefix="/technologies", tags=["technologies"])
 
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+# Serialized list responses (and their compressed variants), invalidated by the technologies
+# collection version
+list_cache: VersionedCache[
+    tuple[TechnologyFilters, Page, View, datetime | None, str], CompressibleBody
+] = VersionedCache(max_entries=256, ttl_seconds=60)
+
+# Lists being serialized by version and cache key, shared by the identical requests that arrive
+# before they are cached
+list_flights: SingleFlight[
+    tuple[int, tuple[TechnologyFilters, Page, View, datetime | None, str]], CompressibleBody
+] = SingleFlight()
+
+# Serialized single technologies and their ETags by name and media type, invalidated like the
+# list cache
+technology_cache: VersionedCache[tuple[str, str], tuple[str, CompressibleBody]] = VersionedCache(
+    max_entries=1024, ttl_seconds=60
+)
+
 
 class TechnologyMetadata(BaseModel):
     total_count: int
+    next_cursor: str | None = None
     categories: list[str]
     stages: list[str]
     available_tags: list[str]
+    category_counts: dict[str, int]
+    stage_counts: dict[str, int]
+    tag_counts: dict[str, int]
+    category_stage_counts: dict[str, dict[str, int]]
 
 
 class TechnologyResponse(BaseModel):
-    technologies: list[Technology]
+    technologies: list[Technology | TechnologySummary]
     metadata: TechnologyMetadata
 
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _ndjson_line(technology: Technology | TechnologySummary) -> bytes:
+    return technology.model_dump_json(by_alias=True).encode() + b"\n"
+
+
+async def _stream_ndjson(
+    filters: TechnologyFilters, page: Page, view: View, as_of: datetime | None
+) -> AsyncIterator[bytes]:
+    hydrate = not response_serializer.fast
+    if as_of is not None:
+        snapshot = await load_radar_as_of(as_of, await get_version(Technology))
+        result = snapshot.find_technologies(filters, page, view, hydrate)
+        for technology in result.technologies:
+            yield _ndjson_line(technology)
+        for document in result.documents:
+            yield dumps(technology_json(document, view)) + b"\n"
+    elif hydrate:
+        async for technology in iter_technologies(filters, page, view):
+            yield _ndjson_line(technology)
+    else:
+        async for document in iter_documents(filters, page, view):
+            yield dumps(technology_json(document, view)) + b"\n"
+
+
+async def _serialize_technologies(
+    version: int,
+    filters: TechnologyFilters,
+    page: Page,
+    view: View,
+    as_of: datetime | None,
+    media_type: str,
+) -> CompressibleBody:
+    """Query and serialize a list response, and cache it for its version."""
+    hydrate = not response_serializer.fast
+    if as_of is not None:
+        snapshot = await load_radar_as_of(as_of, version)
+        result = snapshot.find_technologies(filters, page, view, hydrate)
+    elif radar_snapshot.ready:
+        result = radar_snapshot.find_technologies(filters, page, view, hydrate)
+    else:
+        result = await find_technologies(filters, page, version, view, hydrate)
+
+    metadata = TechnologyMetadata(
+        total_count=result.total_count,
+        next_cursor=result.next_cursor,
+        categories=list(result.category_counts),
+        stages=list(result.stage_counts),
+        available_tags=result.available_tags,
+        category_counts=result.category_counts,
+        stage_counts=result.stage_counts,
+        tag_counts=result.tag_counts,
+        category_stage_counts=result.category_stage_counts,
+    )
+
+    if result.documents:
+        body = encode(
+            {
+                "technologies": [technology_json(document, view) for document in result.documents],
+                "metadata": metadata.model_dump(),
+            },
+            media_type,
+        )
+    else:
+        response = TechnologyResponse(technologies=result.technologies, metadata=metadata)
+        body = encode_model(response, media_type)
+    compressible_body = CompressibleBody(body)
+    list_cache.set(version, (filters, page, view, as_of, media_type), compressible_body)
+    return compressible_body
+
+
 @router.get("/", response_model=TechnologyResponse)
 @safe_endpoint
 async def get_technologies(
     search: Annotated[
         str | None, Query(description="Search across name, category, and tags")
     ] = None,
+    search_mode: Annotated[
+        SearchMode, Query(description="prefix (indexed, ranked) or substring (full scan)")
+    ] = "prefix",
     categories: Annotated[list[str] | None, Query(description="Filter by categories")] = None,
     stages: Annotated[list[str] | None, Query(description="Filter by stages")] = None,
     tags: Annotated[list[str] | None, Query(description="Filter by tags")] = None,
-) -> TechnologyResponse:
+    limit: Annotated[
+        int | None,
+        Query(ge=1, le=MAX_PAGE_LIMIT, description="Maximum number of technologies to return"),
+    ] = None,
+    after: Annotated[
+        str | None, Query(description="The next_cursor of the previous page to continue from")
+    ] = None,
+    view: Annotated[
+        View, Query(description="full technologies or summaries without their history")
+    ] = "full",
+    as_of: Annotated[
+        datetime | None, Query(description="Return the radar as it was at this date")
+    ] = None,
+    accept: Annotated[str | None, Header()] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """
     Retrieve a list of technologies with optional filtering and search capabilities.
 
@@ -51,76 +211,339 @@ async def get_technologies(
     Args:
         search: Optional text search that matches against technology name, category,
         and tags (case-insensitive)
+        search_mode: How the search is matched:
+            - prefix (default): every searched word must begin a word of the name, category
+              or tags. Served by an index and ordered by relevance (matches on the name first)
+            - substring: the search may appear anywhere, like a plain "contains"
         categories: Optional list of categories to filter by (OR operation)
         stages: Optional list of stages to filter by (OR operation)
         tags: Optional list of tags to filter by (OR operation)
+        limit: Optional maximum number of technologies to return, up to 1000. Defaults to
+        100, except for streams which return all the matching technologies when omitted
+        after: Optional cursor (the next_cursor from the metadata of the previous page)
+        to fetch the page that follows
+        view: Optional shape of the returned technologies:
+            - full (default): complete Technology objects
+            - summary: technologies without their history, for list views that fetch
+              the history separately when needed
+        as_of: Optional past date to return the radar as it was at, with the stages (and
+        history summaries) the technologies had then. Filters apply to these stages
+        accept: Optional accepted media types. Send application/x-ndjson to stream the
+        technologies instead, or application/msgpack (or application/cbor) for a binary
+        response. The format with the highest quality wins, JSON by default
+        if_none_match: Optional ETag of a response the client already has
 
     Returns:
         TechnologyResponse containing:
-            - technologies: List of Technology objects matching the filters
-            - metadata: TechnologyMetadata with total count and available filter options
+            - technologies: List of Technology (or summary) objects matching the filters
+            - metadata: TechnologyMetadata with total count of the matching technologies,
+              the cursor of the next page (if there is one), available filter options and
+              the number of matching technologies per category, stage, tag and
+              category x stage
+
+        Or an empty 304 (Not Modified) response if the client's ETag is still up to date.
+
+        Or, for application/x-ndjson, a stream of the matching Technology objects, one
+        JSON document per line and without metadata.
+
+        Or, for application/msgpack and application/cbor, the same response as
+        MessagePack or CBOR, with the dates encoded as native timestamps.
+
+    Raises:
+        HTTPException (400): If the after cursor is invalid
 
     Note:
         All filters are applied with AND logic between different filter types,
         but OR logic within the same filter type (e.g., multiple categories).
+
+        Technologies are sorted by name, except for prefix searches which are sorted by
+        relevance first.
+
+        Serialized responses are cached per filters combination until the next write
+        to the technologies collection (see ``list_cache``), along with their compressed
+        variants (see ``tech_radar.compression``). Identical requests that miss the cache
+        at the same time share a single query (see ``list_flights``). In the "memory" read
+        mode the list is answered from the in-memory replica of the radar (see
+        ``tech_radar.snapshot``), which may lag writes by up to a poll interval.
+
+        Unless the RESPONSE_SERIALIZATION setting is "models", lists (and streams) are
+        serialized straight from the raw documents (see ``tech_radar.serialization``), and
+        no models are built for them.
+
+        Point-in-time queries (``as_of``) are answered from the stage transitions collection
+        (see ``tech_radar.history.load_radar_as_of``). Only stages are versioned: categories,
+        tags and details pages are the current ones, and deleted technologies are left out.
     """
-    # Build query filters
-    query_filters: dict[str, Any] = {}
-
-    # Text search across name, category, and tags
-    if search:
-        search_regex = {"$regex": search, "$options": "i"}
-        query_filters["$or"] = [
-            {"name": search_regex},
-            {"category": search_regex},
-            {"tags": search_regex},
-        ]
-
-    if categories is not None:
-        categories = [c for c in categories if len(c) > 0]
-        if len(categories) > 0:
-            query_filters["category"] = {"$in": categories}
-
-    if stages is not None:
-        stages = [s for s in stages if len(s) > 0]
-        if stages:
-            query_filters["stage"] = {"$in": stages}
-
-    if tags is not None:
-        tags = [t for t in tags if len(t) > 0]
-        if tags:
-            query_filters["tags"] = {"$in": tags}
-
-    technologies_task = Technology.find(query_filters).to_list()
-    categories_task = Technology.distinct(Technology.category, query_filters)
-    stages_task = Technology.distinct(Technology.stage, query_filters)
-
-    # TODO: There seams to be some bug with beanie that throws an exception on this query.
-    #       As a workaround I am fetching everything instead for now.
-    # pipeline = [
-    #     {"$unwind": "$tags"},  # Flatten the arrays
-    #     {"$group": {"_id": None, "allTags": {"$addToSet": "$tags"}}},
-    #     {"$project": {"_id": 0, "allTags": 1}},
-    # ]
-    # tags_task = Technology.aggregate(pipeline).to_list()
-    all_technologies = await Technology.find_all().to_list()
-    all_tags = {tag for tech in all_technologies for tag in tech.tags}
-
-    technologies, all_categories, all_stages = await asyncio.gather(
-        technologies_task,
-        categories_task,
-        stages_task,
-        # tags_task,
+    filters = TechnologyFilters.from_query(search, categories, stages, tags, search_mode)
+    try:
+        page = Page.from_query(limit, after)
+    except InvalidCursorError as err:
+        raise HTTPException(status_code=400, detail=str(err)) from err
+
+    media_type = negotiate_media_type(accept, (*MEDIA_TYPES, NDJSON_MEDIA_TYPE))
+    if media_type == NDJSON_MEDIA_TYPE:
+        return StreamingResponse(
+            _stream_ndjson(filters, page, view, as_of),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={"Vary": "Accept"},
+        )
+
+    # Responses hold their whole page in memory, unlike streams
+    if page.limit is None:
+        page = page.model_copy(update={"limit": DEFAULT_PAGE_LIMIT})
+    # In the memory read mode the list is answered without any database round trip
+    version = radar_snapshot.version if radar_snapshot.ready else await get_version(Technology)
+    headers = {
+        "ETag": make_etag(version, filters, page, view, as_of, media_type),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept",
+    }
+    matched_etag = matching_etag(if_none_match, headers["ETag"])
+    if matched_etag is not None:
+        return Response(status_code=304, headers={**headers, "ETag": matched_etag})
+
+    cache_key = (filters, page, view, as_of, media_type)
+    cached_body = list_cache.get(version, cache_key)
+    if cached_body is not None:
+        return CompressibleResponse(cached_body, media_type=media_type, headers=headers)
+
+    compressible_body = await list_flights.run(
+        (version, cache_key),
+        lambda: _serialize_technologies(version, filters, page, view, as_of, media_type),
     )
+    return CompressibleResponse(compressible_body, media_type=media_type, headers=headers)
 
-    metadata = TechnologyMetadata(
-        total_count=len(technologies),
-        categories=sorted(list(all_categories)),
-        stages=sorted(list(all_stages)),
-        available_tags=sorted(list(all_tags)),
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+# Idle streams send a comment at this interval, which keeps proxies from closing them and lets
+# the server notice disconnected clients
+EVENT_STREAM_KEEP_ALIVE_SECONDS = 15
+
+
+async def _event_stream(subscription: Subscription) -> AsyncIterator[bytes]:
+    # Sent first, so clients know the stream is open (and when it reconnected)
+    yield b"retry: 1000\n\n"
+    while not subscription.dropped:
+        event = await subscription.get(EVENT_STREAM_KEEP_ALIVE_SECONDS)
+        if event is None:
+            yield b": keep-alive\n\n"
+            continue
+        yield (
+            f"id: {event.version}\nevent: {event.type}\ndata: {event.model_dump_json()}\n\n"
+        ).encode()
+
+
+async def _subscribe_to_events() -> AsyncIterator[bytes]:
+    async with change_broker.subscribe() as subscription:
+        async for message in _event_stream(subscription):
+            yield message
+
+
+@router.get("/events", response_class=StreamingResponse)
+@safe_endpoint
+async def get_technology_events() -> StreamingResponse:
+    """
+    Stream the changes of technologies as Server-Sent Events.
+
+    Each write sends an ``upsert`` or ``delete`` event whose data holds the names of the
+    changed technologies and the collection version of the write, so open clients can refresh
+    what changed (e.g. with ``GET /technologies/changes``) instead of polling the list.
+
+    Returns:
+        A ``text/event-stream`` response that stays open until the client disconnects
+
+    Note:
+        Events are buffered per client in a bounded queue. A client that doesn't keep up is
+        disconnected, and should reconnect and catch up with ``GET /technologies/changes``
+        from the last version it received (the ``id`` of the events).
+    """
+    return StreamingResponse(
+        _subscribe_to_events(),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+class TechnologyChangesResponse(BaseModel):
+    token: int
+    upserts: list[Technology]
+    deleted: list[str]
+
+
+@router.get("/changes", response_model=TechnologyChangesResponse)
+@safe_endpoint
+async def get_technology_changes(
+    since: Annotated[
+        int, Query(ge=0, description="The token of the previous sync, 0 for a full sync")
+    ] = 0,
+) -> TechnologyChangesResponse:
+    """
+    Retrieve the technologies created, updated or deleted since a previous sync.
+
+    Lets mirrors of the radar stay current without downloading it all again: a first call
+    with ``since=0`` returns everything, and every next call passes the token of the
+    previous one and gets only what changed in between.
+
+    Args:
+        since: The token returned by the previous call, or 0 for a full sync
+
+    Returns:
+        TechnologyChangesResponse containing:
+            - token: The token to pass as ``since`` in the next call
+            - upserts: The created or updated technologies
+            - deleted: The names of the deleted technologies
+
+    Note:
+        Changes are delivered at least once: a write that is still in progress during a sync
+        is returned by it and by the next sync too, so applying the changes must be
+        idempotent (replace technologies by name).
+    """
+    token, upserts, deleted = await find_changes(since)
+    return TechnologyChangesResponse(token=token, upserts=upserts, deleted=deleted)
+
+
+class TechnologyBatchResponse(BaseModel):
+    technologies: list[Technology | TechnologySummary]
+    not_found: list[str]
+
+
+@router.get("/batch", response_model=TechnologyBatchResponse)
+@safe_endpoint
+async def get_technologies_batch(
+    names: Annotated[
+        list[str], Query(max_length=1000, description="Names of the technologies to fetch")
+    ],
+    view: Annotated[
+        View, Query(description="full technologies or summaries without their history")
+    ] = "full",
+    accept: Annotated[str | None, Header()] = None,
+) -> Response:
+    """
+    Retrieve many technologies by name with a single query on the unique name index.
+
+    Args:
+        names: Names of the technologies to fetch (up to 1000)
+        view: full technologies (default) or summaries without their history
+        accept: Optional accepted media types, application/msgpack or application/cbor for
+        a binary response instead of JSON
+
+    Returns:
+        TechnologyBatchResponse containing:
+            - technologies: The found technologies, ordered by name
+            - not_found: The requested names that matched no technology
+    """
+    technologies = await find_technologies_by_name(set(names), view)
+    found = {technology.name for technology in technologies}
+    response = TechnologyBatchResponse(
+        technologies=technologies,
+        not_found=sorted({name for name in names if name not in found}),
+    )
+    media_type = negotiate_media_type(accept)
+    return Response(
+        content=encode_model(response, media_type),
+        media_type=media_type,
+        headers={"Vary": "Accept"},
     )
 
-    return TechnologyResponse(technologies=technologies, metadata=metadata)
+
+@router.get("/{name}", response_model=Technology)
+@safe_endpoint
+async def get_technology(
+    name: str,
+    accept: Annotated[str | None, Header()] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """
+    Retrieve a single technology by its unique name.
+
+    Args:
+        name: The unique name of the technology
+        accept: Optional accepted media types, application/msgpack or application/cbor for
+        a binary response instead of JSON
+        if_none_match: Optional ETag of a previously fetched version of the technology
+
+    Returns:
+        The technology, or 304 Not Modified if it did not change since the ETag in
+        ``If-None-Match`` was issued
+
+    Raises:
+        HTTPException (404): If no technology with the specified name exists
+
+    Note:
+        The ETag is derived from the technology's revision, which every update increments.
+        Serialized technologies are cached per worker until the next write to the
+        technologies collection (see ``technology_cache``).
+    """
+    media_type = negotiate_media_type(accept)
+    version = await get_version(Technology)
+    cached = technology_cache.get(version, (name, media_type))
+    if cached is None:
+        technology = await find_technology(name)
+        if technology is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Technology with the name '{name}' does not exists",
+            )
+        cached = (
+            make_etag(technology.id, technology.revision, media_type),
+            CompressibleBody(encode_model(technology, media_type)),
+        )
+        technology_cache.set(version, (name, media_type), cached)
+
+    etag, body = cached
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+    matched_etag = matching_etag(if_none_match, etag)
+    if matched_etag is not None:
+        return Response(status_code=304, headers={**headers, "ETag": matched_etag})
+    return CompressibleResponse(body, media_type=media_type, headers=headers)
+
+
+@router.get("/{name}/history", response_model=TransitionsPage)
+@safe_endpoint
+async def get_technology_history(
+    name: str,
+    limit: Annotated[
+        int, Query(ge=1, le=1000, description="Maximum number of transitions to return")
+    ] = 100,
+    after: Annotated[
+        str | None, Query(description="The next_cursor of the previous page to continue from")
+    ] = None,
+) -> TransitionsPage:
+    """
+    Retrieve the stage transitions of a technology, newest first.
+
+    The transitions are stored in their own collection, technologies only hold a summary
+    of them (the last transition and the number of transitions) so they stay small.
+
+    Args:
+        name: The unique name of the technology
+        limit: Maximum number of transitions to return (100 by default)
+        after: The next_cursor of the previous page, to fetch the page that follows it
+
+    Returns:
+        TransitionsPage containing:
+            - transitions: The stage transitions, each with the stage it moved to
+            - next_cursor: Cursor of the next page, None on the last page
+
+    Raises:
+        HTTPException (400): If the cursor is invalid
+        HTTPException (404): If no technology with the specified name exists
+    """
+    try:
+        page = await find_transitions(name, limit, after)
+    except InvalidCursorError as err:
+        raise HTTPException(status_code=400, detail=str(err)) from err
+
+    if not page.transitions and not await Technology.find_one(Technology.name == name).exists():
+        raise HTTPException(
+            status_code=404,
+            detail=f"Technology with the name '{name}' does not exists",
+        )
+    return page
+
+
+# Paths of collection endpoints that a technology with the same name couldn't be reached under
+RESERVED_NAMES = frozenset({"batch", "bulk", "changes", "events"})
 
 
 class PutTechnologyRequest(BaseModel):
@@ -130,6 +553,26 @@ class PutTechnologyRequest(BaseModel):
     tags: list[str] = Field(default=[])
     detailsPage: str | None = Field(default=None)
 
+    @field_validator("name")
+    @classmethod
+    def name_is_not_reserved(cls, name: str) -> str:
+        if name in RESERVED_NAMES:
+            raise ValueError(f"'{name}' is reserved by the API, technologies can't be named it")
+        return name
+
+
+def _new_technology(put_request: PutTechnologyRequest) -> Technology:
+    return Technology(
+        name=put_request.name,
+        category=put_request.category,
+        stage=put_request.stage,
+        tags=put_request.tags,
+        detailsPage=put_request.detailsPage,
+        history=History(discoveryDate=datetime.now()),
+        updatedAt=datetime.now(),
+        syncPending=True,
+    )
+
 
 @router.put("/", response_model=Technology)
 @safe_endpoint
@@ -155,17 +598,7 @@ async def put_technology(put_request: PutTechnologyRequest) -> Technology:
     Raises:
         HTTPException (409): If a technology with the same name already exists
     """
-    technology = Technology(
-        name=put_request.name,
-        category=put_request.category,
-        stage=put_request.stage,
-        tags=put_request.tags,
-        detailsPage=put_request.detailsPage,
-        history=History(
-            discoveryDate=datetime.now(),
-            stageTransitions=[],
-        ),
-    )
+    technology = _new_technology(put_request)
     try:
         await technology.save()
     except (DuplicateKeyError, RevisionIdWasChanged) as err:
@@ -173,10 +606,194 @@ async def put_technology(put_request: PutTechnologyRequest) -> Technology:
             status_code=409,
             detail=f"Technology with the name '{put_request.name}' already exists",
         ) from err
+    await publish_changes([technology.name])
 
     return technology
 
 
+class BulkItemResult(BaseModel):
+    index: int
+    name: str | None
+    status: int
+    detail: str | None = None
+
+
+class BulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[BulkItemResult]
+
+
+# Technologies inserted per insert_many call, keeping each command well below MongoDB's
+# message size limit
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+def _validation_error_detail(err: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in error['loc']) or 'body'}: {error['msg']}"
+        for error in err.errors()
+    )
+
+
+async def _insert_chunk(chunk: list[tuple[int, Technology]]) -> list[BulkItemResult]:
+    for _, technology in chunk:
+        technology.update_search_terms()
+
+    failures: dict[int, BulkItemResult] = {}
+    try:
+        await Technology.insert_many([technology for _, technology in chunk], ordered=False)
+    except BulkWriteError as err:
+        for write_error in err.details["writeErrors"]:
+            index, technology = chunk[write_error["index"]]
+            if write_error["code"] == DUPLICATE_KEY_ERROR_CODE:
+                failures[index] = BulkItemResult(
+                    index=index,
+                    name=technology.name,
+                    status=409,
+                    detail=f"Technology with the name '{technology.name}' already exists",
+                )
+            else:
+                failures[index] = BulkItemResult(
+                    index=index, name=technology.name, status=500, detail=write_error["errmsg"]
+                )
+
+    return [
+        failures.get(index, BulkItemResult(index=index, name=technology.name, status=200))
+        for index, technology in chunk
+    ]
+
+
+@router.put("/bulk", response_model=BulkResponse)
+@safe_endpoint
+async def put_technologies_bulk(
+    items: Annotated[list[dict[str, Any]], Body(max_length=10_000)],
+) -> BulkResponse:
+    """
+    Create many new technologies in the tech radar at once.
+
+    Each item is validated and created like with ``PUT /technologies/``, but all the valid
+    items are inserted with unordered ``insert_many`` calls (in chunks of
+    ``BULK_INSERT_CHUNK_SIZE``), so loading a whole radar takes a handful of round trips.
+    An invalid or duplicate item fails on its own without aborting the rest of the batch.
+
+    Args:
+        items: List of PutTechnologyRequest objects (up to 10,000)
+
+    Returns:
+        BulkResponse containing:
+            - succeeded: Number of created technologies
+            - failed: Number of items that were not created
+            - results: The result of each item, in the order of the request, with the status
+              code the single item endpoint would have answered (200, 409 for duplicate
+              names or 422 for invalid items) and the error detail of failed items
+    """
+    results: dict[int, BulkItemResult] = {}
+    technologies: list[tuple[int, Technology]] = []
+    for index, item in enumerate(items):
+        try:
+            technologies.append((index, _new_technology(PutTechnologyRequest.model_validate(item))))
+        except ValidationError as err:
+            name = item.get("name")
+            results[index] = BulkItemResult(
+                index=index,
+                name=name if isinstance(name, str) else None,
+                status=422,
+                detail=_validation_error_detail(err),
+            )
+
+    for start in range(0, len(technologies), BULK_INSERT_CHUNK_SIZE):
+        chunk = technologies[start : start + BULK_INSERT_CHUNK_SIZE]
+        for result in await _insert_chunk(chunk):
+            results[result.index] = result
+
+    succeeded = [result.name for result in results.values() if result.status == 200]
+    if succeeded:
+        await publish_changes(name for name in succeeded if name is not None)
+
+    return BulkResponse(
+        succeeded=len(succeeded),
+        failed=len(results) - len(succeeded),
+        results=[results[index] for index in sorted(results)],
+    )
+
+
+class BulkDeleteResponse(BaseModel):
+    deleted: int
+    not_found: list[str]
+
+
+@router.delete("/", response_model=BulkDeleteResponse)
+@safe_endpoint
+async def delete_technologies_bulk(
+    names: Annotated[list[str] | None, Query(description="Delete technologies by name")] = None,
+    search: Annotated[
+        str | None, Query(description="Search across name, category, and tags")
+    ] = None,
+    search_mode: Annotated[
+        SearchMode, Query(description="prefix (indexed) or substring (full scan)")
+    ] = "prefix",
+    categories: Annotated[list[str] | None, Query(description="Filter by categories")] = None,
+    stages: Annotated[list[str] | None, Query(description="Filter by stages")] = None,
+    tags: Annotated[list[str] | None, Query(description="Filter by tags")] = None,
+) -> BulkDeleteResponse:
+    """
+    Delete many technologies from the tech radar at once.
+
+    The technologies to delete are selected by name and/or by the same filters as
+    ``GET /technologies/`` (all of them combined with AND logic), and are removed with a
+    single ``delete_many``.
+
+    Args:
+        names: Optional names of the technologies to delete
+        search, search_mode, categories, stages, tags: Optional filters, see
+        ``get_technologies``
+
+    Returns:
+        BulkDeleteResponse containing:
+            - deleted: Number of deleted technologies
+            - not_found: The requested names that matched no technology (always empty when
+              deleting by filters only)
+
+    Raises:
+        HTTPException (400): If neither names nor filters are given, as deleting the whole
+        radar by accident would be irreversible
+
+    Warning:
+        This operation is irreversible. All technology data including
+        stage transition history will be permanently lost.
+    """
+    requested_names = sorted({name for name in names or [] if len(name) > 0})
+    query_filters = TechnologyFilters.from_query(
+        search, categories, stages, tags, search_mode
+    ).to_mongo()
+    if not requested_names and not query_filters:
+        raise HTTPException(
+            status_code=400,
+            detail="Either names or filters of the technologies to delete are required",
+        )
+
+    collection = Technology.get_pymongo_collection()
+    not_found: list[str] = []
+    if requested_names:
+        query_filters["name"] = {"$in": requested_names}
+        # Names that don't exist at all are not found. Names of technologies that exist but
+        # don't match the filters are simply not deleted.
+        existing = set(await collection.distinct("name", {"name": {"$in": requested_names}}))
+        not_found = [name for name in requested_names if name not in existing]
+
+    deleted_names = await collection.distinct("name", query_filters)
+    # Only the collected names are deleted: a technology that starts matching the filters in
+    # between must not be deleted without its tombstone, change event and transitions
+    result = await collection.delete_many({**query_filters, "name": {"$in": deleted_names}})
+    if result.deleted_count > 0:
+        await delete_transitions(deleted_names)
+        await add_tombstones(deleted_names)
+        await publish_changes(deleted_names, deleted=True)
+
+    return BulkDeleteResponse(deleted=result.deleted_count, not_found=not_found)
+
+
 @router.delete("/{name}")
 @safe_endpoint
 async def delete_technology(name: str) -> None:
@@ -199,18 +816,20 @@ async def delete_technology(name: str) -> None:
         This operation is irreversible. All technology data including
         stage transition history will be permanently lost.
     """
-    tech = Technology.find_one(Technology.name == name)
-    if not await tech.exists():
+    result = await Technology.get_pymongo_collection().delete_one({"name": name})
+    if result.deleted_count == 0:
         raise HTTPException(
             status_code=404,
             detail=f"Technology with the name '{name}' does not exists",
         )
 
-    await tech.delete()
+    await delete_transitions([name])
+    await add_tombstones([name])
+    await publish_changes([name], deleted=True)
 
 
 class NewStageTransition(BaseModel):
-    newStage: str
+    newStage: str = Field(pattern=STAGE_PATTERN)
     adrLink: str
 
 
@@ -219,6 +838,229 @@ class UpdateTechnologyRequest(BaseModel):
     tags: list[str]
     detailsPage: str | None
     stageTransition: NewStageTransition | None
+    expectedStage: str | None = Field(None, pattern=STAGE_PATTERN)
+
+
+class BulkUpdateItem(BaseModel):
+    """
+    Update of a single technology in a bulk update.
+
+    Only the given fields are changed, so ``{"name": ..., "stageTransition": ...}`` moves a
+    technology to a new stage and leaves everything else as is.
+    """
+
+    name: str
+    category: str | None = Field(None, pattern=CATEGORY_PATTERN)
+    tags: list[str] | None = None
+    detailsPage: str | None = None
+    stageTransition: NewStageTransition | None = None
+
+
+# Fields a bulk update reads before writing, they are also the fields the update is conditioned on
+_BULK_UPDATE_GUARD_FIELDS = {
+    "name": 1,
+    "stage": 1,
+    "category": 1,
+    "tags": 1,
+    "history.transitionCount": 1,
+}
+
+
+def _transition_count(document: dict[str, Any]) -> int:
+    count: int = document.get("history", {}).get("transitionCount", 0)
+    return count
+
+
+def _bulk_update_target(item: BulkUpdateItem, current: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "stage": current["stage"]
+        if item.stageTransition is None
+        else item.stageTransition.newStage,
+        "category": current["category"] if item.category is None else item.category,
+        "tags": current["tags"] if item.tags is None else item.tags,
+    }
+
+
+def _bulk_update_applied(
+    item: BulkUpdateItem, current: dict[str, Any], changed: dict[str, Any]
+) -> bool:
+    """Whether a technology read again after the bulk write holds the update of the item."""
+    expected_count = _transition_count(current) + (item.stageTransition is not None)
+    return {
+        field: changed.get(field) for field in ("stage", "category", "tags")
+    } == _bulk_update_target(item, current) and _transition_count(changed) == expected_count
+
+
+def _bulk_update_transition(
+    item: BulkUpdateItem, current: dict[str, Any]
+) -> StageTransitionRecord | None:
+    if item.stageTransition is None:
+        return None
+    return new_transition(
+        item.name,
+        current["stage"],
+        item.stageTransition.newStage,
+        item.stageTransition.adrLink,
+        sequence=_transition_count(current) + 1,
+    )
+
+
+def _bulk_update_operation(
+    item: BulkUpdateItem, current: dict[str, Any], transition: StageTransitionRecord | None
+) -> UpdateMany:
+    target = _bulk_update_target(item, current)
+    update: dict[str, Any] = {
+        "$set": {
+            **target,
+            **({"detailsPage": item.detailsPage} if "detailsPage" in item.model_fields_set else {}),
+            "searchTerms": search_terms(item.name, target["category"], target["tags"]),
+            "updatedAt": datetime.now(),
+            PENDING_FIELD: True,
+        },
+        "$inc": {"revision": 1},
+    }
+    if transition is not None:
+        summary = summary_update(transition)
+        update["$set"].update(summary["$set"])
+        update["$inc"].update(summary["$inc"])
+
+    # The update only applies if the technology wasn't changed since it was read, otherwise the
+    # stage transition history (and the search terms) would be computed from stale values.
+    # UpdateMany rather than UpdateOne since mongomock can't run UpdateOne in bulk writes with
+    # recent pymongo versions, the unique name makes them equivalent here.
+    guard = {field: current[field] for field in ("name", "stage", "category", "tags")}
+    # Also keeps the sequence of the recorded transition exact
+    guard["history.transitionCount"] = _transition_count(current)
+    return UpdateMany(guard, update)
+
+
+@router.post("/bulk", response_model=BulkResponse)
+@safe_endpoint
+async def update_technologies_bulk(
+    items: Annotated[list[dict[str, Any]], Body(max_length=10_000)],
+) -> BulkResponse:
+    """
+    Update many technologies at once, e.g. move them between stages in a radar review.
+
+    The current state of all the technologies is read with a single query, and then all the
+    updates are applied with a single unordered ``bulk_write``. Each update is an atomic
+    ``$set`` (and ``$inc`` of the transition count) conditioned on the technology being
+    unchanged since it was read, so concurrent updates are never lost. The stage transitions
+    of the applied updates are then recorded with a single insert.
+
+    Args:
+        items: List of BulkUpdateItem objects (up to 10,000), each containing:
+            - name: The unique name of the technology to update
+            - category, tags, detailsPage: Optional new values of these fields
+            - stageTransition: Optional stage transition, like in ``POST /technologies/{name}``
+
+    Returns:
+        BulkResponse containing:
+            - succeeded: Number of updated technologies
+            - failed: Number of items that were not applied
+            - results: The result of each item, in the order of the request: 200, 404 for
+              unknown technologies, 409 for technologies changed concurrently (or updated
+              more than once in the request) and 422 for invalid items
+    """
+    results: dict[int, BulkItemResult] = {}
+    updates: dict[str, tuple[int, BulkUpdateItem]] = {}
+    for index, raw_item in enumerate(items):
+        try:
+            item = BulkUpdateItem.model_validate(raw_item)
+        except ValidationError as err:
+            name = raw_item.get("name")
+            results[index] = BulkItemResult(
+                index=index,
+                name=name if isinstance(name, str) else None,
+                status=422,
+                detail=_validation_error_detail(err),
+            )
+            continue
+        if item.name in updates:
+            results[index] = BulkItemResult(
+                index=index,
+                name=item.name,
+                status=409,
+                detail=f"Technology '{item.name}' is updated more than once in the request",
+            )
+            continue
+        updates[item.name] = (index, item)
+
+    collection = Technology.get_pymongo_collection()
+    current = {
+        document["name"]: document
+        async for document in collection.find(
+            {"name": {"$in": list(updates)}}, dict(_BULK_UPDATE_GUARD_FIELDS)
+        )
+    }
+
+    applied: list[tuple[int, BulkUpdateItem]] = []
+    for name, (index, item) in updates.items():
+        if name in current:
+            applied.append((index, item))
+        else:
+            results[index] = BulkItemResult(
+                index=index,
+                name=name,
+                status=404,
+                detail=f"Technology with the name '{name}' does not exists",
+            )
+
+    if applied:
+        transitions = {
+            item.name: _bulk_update_transition(item, current[item.name]) for _, item in applied
+        }
+        write_result = await collection.bulk_write(
+            [
+                _bulk_update_operation(item, current[item.name], transitions[item.name])
+                for _, item in applied
+            ],
+            ordered=False,
+        )
+        conflicts: set[str] = set()
+        if write_result.matched_count < len(applied):
+            # bulk_write only reports totals, so the technologies are read again to find which
+            # updates lost to a concurrent change
+            changed = {
+                document["name"]: document
+                async for document in collection.find(
+                    {"name": {"$in": [item.name for _, item in applied]}},
+                    dict(_BULK_UPDATE_GUARD_FIELDS),
+                )
+            }
+            conflicts = {
+                item.name
+                for _, item in applied
+                if not _bulk_update_applied(item, current[item.name], changed.get(item.name, {}))
+            }
+        for index, item in applied:
+            results[index] = (
+                BulkItemResult(
+                    index=index,
+                    name=item.name,
+                    status=409,
+                    detail=f"Technology '{item.name}' was changed by another request",
+                )
+                if item.name in conflicts
+                else BulkItemResult(index=index, name=item.name, status=200)
+            )
+        await insert_transitions(
+            [
+                transition
+                for name, transition in transitions.items()
+                if transition is not None and name not in conflicts
+            ]
+        )
+
+    succeeded = [result.name for result in results.values() if result.status == 200]
+    if succeeded:
+        await publish_changes(name for name in succeeded if name is not None)
+
+    return BulkResponse(
+        succeeded=len(succeeded),
+        failed=len(results) - len(succeeded),
+        results=[results[index] for index in sorted(results)],
+    )
 
 
 @router.post("/{name}")
@@ -243,47 +1085,82 @@ async def update_technology(
             - stageTransition: Optional stage transition containing:
                 - newStage: The new stage to transition to
                 - adrLink: Link to the Architecture Decision Record for this transition
+            - expectedStage: Optional stage the technology must currently be in
 
     Returns:
         None
 
     Raises:
         HTTPException (404): If no technology with the specified name exists
+        HTTPException (409): If the technology is not in the expected stage anymore
 
     Note:
-        Stage transitions are tracked in the technology's history. The original stage,
-        transition date, and ADR link are preserved for audit purposes.
+        Stage transitions are recorded in the stage transitions collection (see
+        ``GET /technologies/{name}/history``). The original stage, transition date, and ADR
+        link are preserved for audit purposes.
+
+        The update is a single atomic ``find_one_and_update`` that updates the history
+        summary instead of rewriting the history. A transition is conditioned on the stage it leaves
+        (the ``expectedStage``, or else the stage read right before the update), so of two
+        concurrent transitions from the same stage only one applies and the other gets a 409.
     """
-    tech = await Technology.find_one(Technology.name == name)
-    if tech is None:
+    collection = Technology.get_pymongo_collection()
+    expected_stage = update_request.expectedStage
+    if update_request.stageTransition is not None and expected_stage is None:
+        # The transition records the stage it leaves, which has to be read first
+        current = await collection.find_one({"name": name}, {"stage": 1})
+        if current is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Technology with the name '{name}' does not exists",
+            )
+        expected_stage = current["stage"]
+
+    query: dict[str, Any] = {"name": name}
+    if expected_stage is not None:
+        query["stage"] = expected_stage
+    update: dict[str, Any] = {
+        "$set": {
+            "category": update_request.category,
+            "tags": update_request.tags,
+            "detailsPage": update_request.detailsPage,
+            "searchTerms": search_terms(name, update_request.category, update_request.tags),
+            "updatedAt": datetime.now(),
+            PENDING_FIELD: True,
+        }
+    }
+    update["$inc"] = {"revision": 1}
+    transition = None
+    if update_request.stageTransition is not None:
+        update["$set"]["stage"] = update_request.stageTransition.newStage
+        transition = new_transition(
+            name,
+            str(expected_stage),
+            update_request.stageTransition.newStage,
+            update_request.stageTransition.adrLink,
+        )
+        summary = summary_update(transition)
+        update["$set"].update(summary["$set"])
+        update["$inc"].update(summary["$inc"])
+
+    updated = await collection.find_one_and_update(
+        query,
+        update,
+        {"_id": 1, "history.transitionCount": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    if updated is None:
+        if expected_stage is not None and await collection.find_one({"name": name}, {"_id": 1}):
+            raise HTTPException(
+                status_code=409,
+                detail=f"Technology '{name}' is no longer in the '{expected_stage}' stage",
+            )
         raise HTTPException(
             status_code=404,
             detail=f"Technology with the name '{name}' does not exists",
         )
 
-    await tech.set(
-        {
-            Technology.category: update_request.category,
-            Technology.stage: (
-                tech.stage
-                if update_request.stageTransition is None
-                else update_request.stageTransition.newStage
-            ),
-            Technology.tags: update_request.tags,
-            Technology.detailsPage: update_request.detailsPage,
-            Technology.history.stageTransitions: [
-                *tech.history.stageTransitions,
-                *(
-                    []
-                    if update_request.stageTransition is None
-                    else [
-                        StageTransition(
-                            originalStage=tech.stage,
-                            adrLink=update_request.stageTransition.adrLink,
-                            transitionDate=datetime.now(),
-                        )
-                    ]
-                ),
-            ],
-        }
-    )
+    if transition is not None:
+        transition.sequence = updated["history"]["transitionCount"]
+        await insert_transitions([transition])
+    await publish_changes([name])
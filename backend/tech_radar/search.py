@@ -0,0 +1,42 @@
+import re
+
+# Longer words are only indexed (and searched) by their first characters, which bounds the number
+# of prefixes stored for every technology
+MAX_PREFIX_LENGTH = 20
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split a text into its lowercase words."""
+    return _WORD_PATTERN.findall(text.lower())
+
+
+def _prefixes(words: list[str]) -> list[str]:
+    return sorted(
+        {
+            word[:length]
+            for word in words
+            for length in range(1, min(len(word), MAX_PREFIX_LENGTH) + 1)
+        }
+    )
+
+
+def search_terms(name: str, category: str, tags: list[str]) -> list[str]:
+    """
+    Compute the indexed search terms of a technology.
+
+    The terms are all the prefixes of the words of the name, category and tags, so a search
+    for any beginning of any of these words is a plain equality lookup on a multikey index.
+    """
+    return _prefixes(tokenize(" ".join([name, category, *tags])))
+
+
+def name_search_terms(name: str) -> list[str]:
+    """Compute the prefixes of the words of a technology name, used to rank search results."""
+    return _prefixes(tokenize(name))
+
+
+def query_terms(search: str) -> list[str]:
+    """Normalize a search query into the terms it should be matched by."""
+    return sorted({word[:MAX_PREFIX_LENGTH] for word in tokenize(search)})
@@ -0,0 +1,162 @@
+from collections.abc import Collection
+from datetime import datetime
+from typing import Any
+
+import cbor2
+import msgpack
+import orjson
+from bson import ObjectId
+from pydantic import BaseModel
+
+from tech_radar.negotiation import accepted_values
+from tech_radar.queries import View
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+CBOR_MEDIA_TYPE = "application/cbor"
+# The media types responses can be encoded to, JSON first
+MEDIA_TYPES = (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, CBOR_MEDIA_TYPE)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """Encode JSON-ready data (which may hold datetimes and ObjectIds) to compact JSON bytes."""
+    return orjson.dumps(value, default=_default)
+
+
+def _local(value: datetime) -> datetime:
+    # Stored dates are naive local times, binary formats encode absolute timestamps
+    return value if value.tzinfo is not None else value.astimezone()
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return msgpack.Timestamp.from_datetime(_local(value))
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
+
+
+def _cbor_encode_datetime(encoder: Any, value: datetime) -> None:
+    encoder.encode_datetime(_local(value))
+
+
+def _cbor_default(encoder: Any, value: Any) -> None:
+    if not isinstance(value, ObjectId):
+        raise TypeError(f"Object of type {type(value).__name__} is not CBOR serializable")
+    encoder.encode(str(value))
+
+
+def negotiate_media_type(accept: str | None, media_types: Collection[str] = MEDIA_TYPES) -> str:
+    """
+    Pick the media type of a response from its request's ``Accept`` header.
+
+    JSON is the default: it answers requests without an ``Accept`` header, wildcards, and
+    requests that prefer no format over JSON. Formats of equal quality are picked in the order
+    of the header, and media types the client gives a quality of 0 are never picked.
+
+    Args:
+        accept: The ``Accept`` header of the request
+        media_types: The media types the endpoint can answer with (e.g. the encodings plus a
+        streaming format)
+    """
+    best, best_quality = JSON_MEDIA_TYPE, 0.0
+    for media_type, quality in accepted_values(accept):
+        if media_type == "application/x-msgpack":
+            media_type = MSGPACK_MEDIA_TYPE
+        elif media_type in ("*/*", "application/*"):
+            media_type = JSON_MEDIA_TYPE
+        if media_type in media_types and quality > best_quality:
+            best, best_quality = media_type, quality
+    return best
+
+
+def encode(value: Any, media_type: str) -> bytes:
+    """
+    Encode JSON-ready data (which may hold datetimes and ObjectIds) to a negotiated media type.
+
+    MessagePack encodes datetimes with its timestamp extension type, and CBOR as epoch-based
+    date/times (tag 1), so clients decode them as native datetimes without parsing strings.
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        packed: bytes = msgpack.packb(value, default=_msgpack_default)
+        return packed
+    if media_type == CBOR_MEDIA_TYPE:
+        return cbor2.dumps(
+            value,
+            datetime_as_timestamp=True,
+            encoders={datetime: _cbor_encode_datetime},
+            default=_cbor_default,
+        )
+    return dumps(value)
+
+
+def encode_model(model: BaseModel, media_type: str) -> bytes:
+    if media_type == JSON_MEDIA_TYPE:
+        return model.model_dump_json(by_alias=True).encode()
+    return encode(model.model_dump(by_alias=True), media_type)
+
+
+def _history_json(history: dict[str, Any]) -> dict[str, Any]:
+    last_transition = history.get("lastTransition")
+    return {
+        "discoveryDate": history["discoveryDate"],
+        "lastTransition": None
+        if last_transition is None
+        else {
+            "originalStage": last_transition["originalStage"],
+            "transitionDate": last_transition["transitionDate"],
+            "adrLink": last_transition["adrLink"],
+        },
+        "transitionCount": history.get("transitionCount", 0),
+    }
+
+
+def technology_json(document: dict[str, Any], view: View) -> dict[str, Any]:
+    """
+    Shape a raw technology document like the serialized ``Technology`` (or
+    ``TechnologySummary``) model, without validating it.
+
+    The documents are written by this API, so they are trusted to match the models. The
+    ``test_serialization`` tests keep both representations equal.
+    """
+    summary = {
+        "name": document["name"],
+        "category": document["category"],
+        "stage": document["stage"],
+        "tags": document["tags"],
+        "detailsPage": document.get("detailsPage"),
+    }
+    if view == "summary":
+        return summary
+    return {
+        "_id": str(document["_id"]),
+        **summary,
+        "history": _history_json(document["history"]),
+        "updatedAt": document.get("updatedAt"),
+    }
+
+
+class ResponseSerializer:
+    """
+    How large list responses are serialized.
+
+    The "models" path validates every document into a ``Technology`` and serializes the models
+    with pydantic. The "fast" path shapes the raw documents with ``technology_json`` and encodes
+    them with orjson, skipping the pydantic work on data that came straight from the database.
+    Both produce the same JSON, the toggle exists to compare them in benchmarks.
+    """
+
+    def __init__(self, fast: bool = True) -> None:
+        self.fast = fast
+
+
+# The serializer of this worker, configured by the RESPONSE_SERIALIZATION setting
+response_serializer = ResponseSerializer()
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field, MongoDsn
 from pydantic_settings import BaseSettings
 
@@ -6,6 +8,33 @@ class Settings(BaseSettings):
     """Server config settings."""
 
     mongo_uri: MongoDsn = Field(validation_alias="MONGO_URI")
+    list_cache_max_entries: int = Field(default=256, validation_alias="LIST_CACHE_MAX_ENTRIES")
+    list_cache_ttl_seconds: float = Field(default=60, validation_alias="LIST_CACHE_TTL_SECONDS")
+    # 0 disables the cache of single technologies
+    technology_cache_max_entries: int = Field(
+        default=1024, validation_alias="TECHNOLOGY_CACHE_MAX_ENTRIES"
+    )
+
+    # "memory" answers list queries from an in-memory replica of the radar (see
+    # tech_radar.snapshot) instead of querying the database
+    read_mode: Literal["database", "memory"] = Field(
+        default="database", validation_alias="READ_MODE"
+    )
+    snapshot_poll_interval_seconds: float = Field(
+        default=1, validation_alias="SNAPSHOT_POLL_INTERVAL_SECONDS"
+    )
+
+    # "models" validates list responses into models before serializing them, "fast" serializes
+    # the raw documents (see tech_radar.serialization)
+    response_serialization: Literal["models", "fast"] = Field(
+        default="fast", validation_alias="RESPONSE_SERIALIZATION"
+    )
+
+    # Responses smaller than this many bytes are not compressed
+    compression_minimum_size: int = Field(default=1024, validation_alias="COMPRESSION_MINIMUM_SIZE")
+
+    # Events buffered per event stream client before it is dropped as too slow
+    events_queue_size: int = Field(default=64, validation_alias="EVENTS_QUEUE_SIZE")
 
 
 def load_settings() -> Settings:
@@ -0,0 +1,318 @@
+import asyncio
+import logging
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from pymongo.errors import PyMongoError
+
+from tech_radar.database import watch_collections
+from tech_radar.models import CollectionVersion, Technology, TechnologySummary
+from tech_radar.queries import (
+    Page,
+    TechnologyFilters,
+    TechnologyListResult,
+    View,
+    encode_cursor,
+)
+from tech_radar.search import query_terms
+from tech_radar.versions import get_version
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    """
+    An indexed technology, kept as the raw document the database returned.
+
+    Listing only reads a handful of fields, so models are only built for the responses that
+    need them (see ``hydrate``) instead of being held for the whole radar.
+    """
+
+    __slots__ = (
+        "document",
+        "name",
+        "category",
+        "stage",
+        "tags",
+        "search_terms",
+        "name_search_terms",
+    )
+
+    def __init__(self, document: dict[str, Any]) -> None:
+        # The search terms are only needed as sets, for the indexes and the ranking
+        self.search_terms = frozenset(document.pop("searchTerms", ()))
+        self.name_search_terms = frozenset(document.pop("nameSearchTerms", ()))
+        self.document = document
+        self.name: str = document["name"]
+        self.category: str = document["category"]
+        self.stage: str = document["stage"]
+        self.tags: list[str] = document["tags"]
+
+    def hydrate(self, view: View) -> Technology | TechnologySummary:
+        if view == "summary":
+            return TechnologySummary.model_validate(self.document)
+        technology: Technology = Technology.model_validate(self.document)
+        return technology
+
+
+def _union(index: dict[str, set[str]], values: Iterable[str]) -> set[str]:
+    names: set[str] = set()
+    for value in values:
+        names |= index.get(value, set())
+    return names
+
+
+class RadarSnapshot:
+    """
+    In-memory replica of the technologies collection.
+
+    The whole radar is loaded once, indexed by name, category, stage, tag and search term, and
+    then kept current by following a MongoDB change stream of the technologies and their
+    collection version. Deployments without change streams (standalone servers, or the
+    mongomock client of the tests) fall back to polling the collection version and reloading
+    the radar when it changed.
+
+    List queries are then answered from memory with the same results as
+    ``tech_radar.queries.find_technologies``, so their latency no longer depends on the
+    database. Writes become visible once the snapshot caught up with them, which usually
+    takes milliseconds with change streams and up to the poll interval otherwise.
+    """
+
+    def __init__(self) -> None:
+        self.ready = False
+        self.version = 0
+        self._entries: dict[str, _Entry] = {}
+        self._names_by_id: dict[Any, str] = {}
+        self._by_category: dict[str, set[str]] = {}
+        self._by_stage: dict[str, set[str]] = {}
+        self._by_tag: dict[str, set[str]] = {}
+        self._by_search_term: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self.ready = False
+        self.version = 0
+        self._entries.clear()
+        self._names_by_id.clear()
+        self._by_category.clear()
+        self._by_stage.clear()
+        self._by_tag.clear()
+        self._by_search_term.clear()
+
+    async def load(self) -> None:
+        """Load the whole radar from the database, replacing the current contents."""
+        # The version is read first, so the loaded technologies are at least as recent as it
+        version = await get_version(Technology)
+        documents = [document async for document in Technology.get_pymongo_collection().find({})]
+
+        self.clear()
+        for document in documents:
+            self.upsert(document)
+        self.version = version
+        self.ready = True
+
+    def upsert(self, document: dict[str, Any]) -> None:
+        """Index a raw technology document, which the snapshot takes ownership of."""
+        name = document["name"]
+        self.remove(name)
+        if document["_id"] in self._names_by_id:
+            # Renamed technologies would otherwise be left under their old name
+            self.remove(self._names_by_id[document["_id"]])
+
+        entry = _Entry(document)
+        self._entries[name] = entry
+        self._names_by_id[document["_id"]] = name
+        self._by_category.setdefault(entry.category, set()).add(name)
+        self._by_stage.setdefault(entry.stage, set()).add(name)
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag, set()).add(name)
+        for term in entry.search_terms:
+            self._by_search_term.setdefault(term, set()).add(name)
+
+    def remove(self, name: str) -> None:
+        entry = self._entries.pop(name, None)
+        if entry is None:
+            return
+
+        self._names_by_id.pop(entry.document["_id"], None)
+        self._by_category[entry.category].discard(name)
+        self._by_stage[entry.stage].discard(name)
+        for tag in entry.tags:
+            self._by_tag[tag].discard(name)
+        for term in entry.search_terms:
+            self._by_search_term[term].discard(name)
+
+    def _matching(self, filters: TechnologyFilters) -> list[_Entry]:
+        candidates: set[str] | None = None
+
+        def narrow(names: set[str]) -> None:
+            nonlocal candidates
+            candidates = names if candidates is None else candidates & names
+
+        if filters.search and filters.search_mode == "prefix":
+            for term in query_terms(filters.search):
+                narrow(self._by_search_term.get(term, set()))
+        if filters.categories:
+            narrow(_union(self._by_category, filters.categories))
+        if filters.stages:
+            narrow(_union(self._by_stage, filters.stages))
+        if filters.tags:
+            narrow(_union(self._by_tag, filters.tags))
+
+        entries = [
+            self._entries[name] for name in (self._entries if candidates is None else candidates)
+        ]
+        if filters.search and filters.search_mode == "substring":
+            search = re.compile(re.escape(filters.search), re.IGNORECASE)
+            entries = [
+                entry
+                for entry in entries
+                if search.search(entry.name)
+                or search.search(entry.category)
+                or any(search.search(tag) for tag in entry.tags)
+            ]
+        return entries
+
+    def find_technologies(
+        self,
+        filters: TechnologyFilters,
+        page: Page | None = None,
+        view: View = "full",
+        hydrate: bool = True,
+    ) -> TechnologyListResult:
+        """Same as ``tech_radar.queries.find_technologies``, answered from memory."""
+        page = page or Page()
+        entries = self._matching(filters)
+
+        terms = (
+            query_terms(filters.search)
+            if filters.search and filters.search_mode == "prefix"
+            else []
+        )
+        exact_name = (filters.search or "").strip().lower()
+
+        def score(entry: _Entry) -> int | None:
+            # Same as TechnologyFilters.ranking
+            if not terms:
+                return None
+            matches = sum(1 for term in terms if term in entry.name_search_terms)
+            if entry.name.lower() == exact_name:
+                matches += len(terms) + 1
+            return matches
+
+        scored = sorted(
+            ((score(entry), entry) for entry in entries),
+            key=lambda scored_entry: (-(scored_entry[0] or 0), scored_entry[1].name),
+        )
+        if page.after is not None:
+            after, after_score = page.after, page.after_score
+            scored = [
+                (entry_score, entry)
+                for entry_score, entry in scored
+                if (
+                    entry.name > after
+                    if entry_score is None or after_score is None
+                    else entry_score < after_score
+                    or (entry_score == after_score and entry.name > after)
+                )
+            ]
+
+        next_cursor = None
+        if page.limit is not None and len(scored) > page.limit:
+            scored = scored[: page.limit]
+            last_score, last = scored[-1]
+            next_cursor = encode_cursor(last.name, last_score)
+
+        category_stage_counts: dict[str, dict[str, int]] = {}
+        category_counts: dict[str, int] = {}
+        stage_counts: dict[str, int] = {}
+        tag_counts: dict[str, int] = {}
+        for entry in entries:
+            stages = category_stage_counts.setdefault(entry.category, {})
+            stages[entry.stage] = stages.get(entry.stage, 0) + 1
+            category_counts[entry.category] = category_counts.get(entry.category, 0) + 1
+            stage_counts[entry.stage] = stage_counts.get(entry.stage, 0) + 1
+            for tag in entry.tags:
+                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+
+        metadata: dict[str, Any] = {
+            "total_count": len(entries),
+            "next_cursor": next_cursor,
+            "category_counts": dict(sorted(category_counts.items())),
+            "stage_counts": dict(sorted(stage_counts.items())),
+            "tag_counts": dict(sorted(tag_counts.items())),
+            "category_stage_counts": {
+                category: dict(sorted(stages.items()))
+                for category, stages in sorted(category_stage_counts.items())
+            },
+            "available_tags": sorted(tag for tag, names in self._by_tag.items() if names),
+        }
+        if not hydrate:
+            # Shared with the entries, the documents must not be changed by the caller
+            return TechnologyListResult.model_construct(
+                technologies=[], documents=[entry.document for _, entry in scored], **metadata
+            )
+        return TechnologyListResult(
+            technologies=[entry.hydrate(view) for _, entry in scored], **metadata
+        )
+
+    def _apply_change(self, change: dict[str, Any]) -> None:
+        collection = change["ns"]["coll"]
+        operation = change["operationType"]
+        if collection == CollectionVersion.get_collection_name():
+            document = change.get("fullDocument")
+            if document is not None and document["collection"] == Technology.get_collection_name():
+                self.version = max(self.version, int(document["version"]))
+        elif operation == "delete":
+            name = self._names_by_id.get(change["documentKey"]["_id"])
+            if name is not None:
+                self.remove(name)
+        elif change.get("fullDocument") is not None:
+            self.upsert(change["fullDocument"])
+
+    async def _follow_change_stream(self) -> bool:
+        """
+        Apply the changes of the technologies and their version until the stream ends.
+
+        Returns:
+            False if the database doesn't support change streams
+        """
+        stream = await watch_collections([Technology, CollectionVersion])
+        if stream is None:
+            return False
+
+        # Changes made while the stream was opened are covered by reloading once it is open
+        await self.load()
+        async with stream:
+            async for change in stream:
+                if change["operationType"] in ("drop", "dropDatabase", "rename", "invalidate"):
+                    return True
+                self._apply_change(change)
+        return True
+
+    async def _poll(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                if await get_version(Technology) != self.version:
+                    await self.load()
+            except PyMongoError:
+                logger.exception("Failed to refresh the radar snapshot")
+
+    async def follow(self, poll_interval_seconds: float = 1) -> None:
+        """Keep the snapshot current until cancelled."""
+        while True:
+            try:
+                if not await self._follow_change_stream():
+                    logger.info("Change streams are not supported, polling for radar changes")
+                    await self._poll(poll_interval_seconds)
+            except PyMongoError:
+                logger.exception("Radar change stream failed, reopening it")
+                await asyncio.sleep(poll_interval_seconds)
+
+
+# The snapshot of this worker, only loaded when the app runs in the "memory" read mode
+radar_snapshot = RadarSnapshot()
@@ -0,0 +1,32 @@
+from beanie.odm.documents import Document
+from pymongo import ReturnDocument
+
+from tech_radar.models import CollectionVersion
+
+
+async def get_version(document: type[Document]) -> int:
+    """
+    Return the current write version of the collection of a document.
+
+    Collections that were never written to through the API are at version 0.
+    """
+    version = await CollectionVersion.get_pymongo_collection().find_one(
+        {"collection": document.get_collection_name()}, {"version": 1}
+    )
+    return 0 if version is None else int(version["version"])
+
+
+async def bump_version(document: type[Document]) -> int:
+    """
+    Atomically increment the write version of the collection of a document.
+
+    Returns:
+        The new version of the collection
+    """
+    version = await CollectionVersion.get_pymongo_collection().find_one_and_update(
+        {"collection": document.get_collection_name()},
+        {"$inc": {"version": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    return int(version["version"])
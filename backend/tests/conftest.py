@@ -12,8 +12,19 @@ from httpx import ASGITransport, AsyncClient
 from mongomock_motor import AsyncMongoMockClient
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from tech_radar.analytics import analytics_cache
+from tech_radar.history import radar_as_of_cache
 from tech_radar.main import app
-from tech_radar.models import History, Technology
+from tech_radar.models import (
+    CollectionVersion,
+    History,
+    StageTransitionRecord,
+    Technology,
+    TechnologyTombstone,
+)
+from tech_radar.queries import available_tags_cache, list_counts_cache
+from tech_radar.routes.technologies import list_cache, technology_cache
+from tech_radar.snapshot import radar_snapshot
 
 
 @pytest.fixture(scope="session")
@@ -29,10 +40,28 @@ async def mock_db() -> AsyncGenerator[AsyncIOMotorDatabase[Any], None]:
     """Initialize mock database for testing."""
     client: AsyncMongoMockClient[Technology] = AsyncMongoMockClient()
     database: AsyncIOMotorDatabase[Technology] = client.get_database("test_tech_radar")
-    await init_beanie(database=database, document_models=[Technology])  # type: ignore[arg-type]  # I'm not sure what is the problem but everything is working
+    await init_beanie(
+        database=database,  # type: ignore[arg-type]  # I'm not sure what is the problem but everything is working
+        document_models=[
+            Technology,
+            CollectionVersion,
+            TechnologyTombstone,
+            StageTransitionRecord,
+        ],
+    )
+    list_cache.clear()
+    technology_cache.clear()
+    radar_snapshot.clear()
+    available_tags_cache.clear()
+    list_counts_cache.clear()
+    analytics_cache.clear()
+    radar_as_of_cache.clear()
     yield database
     # Cleanup after each test
     await Technology.delete_all()
+    await CollectionVersion.delete_all()
+    await TechnologyTombstone.delete_all()
+    await StageTransitionRecord.delete_all()
 
 
 @pytest.fixture
@@ -59,7 +88,7 @@ async def sample_technologies(mock_db: AsyncIOMotorDatabase[Any]) -> list[Techno
             stage="Adopt",
             tags=["frontend", "javascript", "ui"],
             detailsPage="https://react.dev",
-            history=History(discoveryDate=datetime(2023, 1, 1), stageTransitions=[]),
+            history=History(discoveryDate=datetime(2023, 1, 1)),
         ),
         Technology(
             name="Docker",
@@ -67,7 +96,7 @@ async def sample_technologies(mock_db: AsyncIOMotorDatabase[Any]) -> list[Techno
             stage="Adopt",
             tags=["containerization", "devops"],
             detailsPage="https://docker.com",
-            history=History(discoveryDate=datetime(2023, 2, 1), stageTransitions=[]),
+            history=History(discoveryDate=datetime(2023, 2, 1)),
         ),
         Technology(
             name="Kubernetes",
@@ -75,7 +104,7 @@ async def sample_technologies(mock_db: AsyncIOMotorDatabase[Any]) -> list[Techno
             stage="Trial",
             tags=["orchestration", "devops", "cloud"],
             detailsPage="https://kubernetes.io",
-            history=History(discoveryDate=datetime(2023, 3, 1), stageTransitions=[]),
+            history=History(discoveryDate=datetime(2023, 3, 1)),
         ),
         Technology(
             name="GraphQL",
@@ -83,7 +112,7 @@ async def sample_technologies(mock_db: AsyncIOMotorDatabase[Any]) -> list[Techno
             stage="Assess",
             tags=["api", "query-language"],
             detailsPage="https://graphql.org",
-            history=History(discoveryDate=datetime(2023, 4, 1), stageTransitions=[]),
+            history=History(discoveryDate=datetime(2023, 4, 1)),
         ),
         Technology(
             name="Rust",
@@ -91,7 +120,7 @@ async def sample_technologies(mock_db: AsyncIOMotorDatabase[Any]) -> list[Techno
             stage="Hold",
             tags=["systems", "performance"],
             detailsPage="https://rust-lang.org",
-            history=History(discoveryDate=datetime(2023, 5, 1), stageTransitions=[]),
+            history=History(discoveryDate=datetime(2023, 5, 1)),
         ),
     ]
 
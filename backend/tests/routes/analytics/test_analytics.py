@@ -0,0 +1,112 @@
+"""Tests for the radar analytics endpoint."""
+
+from datetime import datetime
+from typing import Any
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import StageTransitionRecord, Technology
+
+
+async def _transition(async_client: AsyncClient, name: str, new_stage: str, date: datetime) -> None:
+    """Transition a technology, as if it happened at a past date."""
+    response: Response = await async_client.post(
+        "/technologies/bulk",
+        json=[{"name": name, "stageTransition": {"newStage": new_stage, "adrLink": "a"}}],
+    )
+    assert response.json()["succeeded"] == 1
+
+    await StageTransitionRecord.get_pymongo_collection().update_many(
+        {"technology": name, "newStage": new_stage}, {"$set": {"transitionDate": date}}
+    )
+    await Technology.get_pymongo_collection().update_many(
+        {"name": name}, {"$set": {"history.lastTransition.transitionDate": date}}
+    )
+
+
+async def _analytics(async_client: AsyncClient, **params: Any) -> dict[str, Any]:
+    response: Response = await async_client.get("/analytics/", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    data: dict[str, Any] = response.json()
+    return data
+
+
+class TestAnalytics:
+    """Test cases for GET /analytics."""
+
+    async def test_analytics(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        # GraphQL was discovered in Assess on 2023-04-01, Kubernetes in Trial on 2023-03-01
+        await _transition(async_client, "GraphQL", "Trial", datetime(2023, 5, 1))
+        await _transition(async_client, "GraphQL", "Adopt", datetime(2023, 7, 1))
+        await _transition(async_client, "Kubernetes", "Hold", datetime(2023, 4, 1))
+
+        data = await _analytics(async_client)
+
+        assert data["time_in_stage"] == {
+            "Assess": {"mean_days": 30, "stays": 1},
+            "Trial": {"mean_days": 46, "stays": 2},
+        }
+        assert data["transitions_per_month"] == {"2023-04": 1, "2023-05": 1, "2023-07": 1}
+        assert data["funnel"] == {
+            "Data Management": {"assessed": 0, "trialed": 0, "adopted": 0},
+            "Development Tools": {"assessed": 0, "trialed": 0, "adopted": 0},
+            "Frameworks": {"assessed": 1, "trialed": 1, "adopted": 1},
+        }
+        assert data["stuck_days"] == 180
+        assert len(data["stuck"]) == 5
+        graphql = next(tech for tech in data["stuck"] if tech["name"] == "GraphQL")
+        assert graphql["stage"] == "Adopt"
+        assert graphql["since"] == "2023-07-01T00:00:00"
+        # Discovered first and never transitioned
+        assert data["stuck"][0]["name"] == "React"
+
+    async def test_funnel_requires_assessment_first(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        # React was discovered in Adopt, its later assessment does not make it adopted
+        await _transition(async_client, "React", "Assess", datetime(2023, 6, 1))
+
+        data = await _analytics(async_client)
+
+        assert data["funnel"]["Frameworks"] == {"assessed": 2, "trialed": 0, "adopted": 0}
+
+    async def test_stuck_days(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        data = await _analytics(async_client, stuck_days=100_000)
+
+        assert data["stuck_days"] == 100_000
+        assert data["stuck"] == []
+
+    async def test_analytics_are_recomputed_after_writes(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        before = await _analytics(async_client)
+        await _transition(async_client, "Rust", "Assess", datetime(2023, 8, 1))
+        after = await _analytics(async_client)
+
+        assert before["transitions_per_month"] == {}
+        assert after["transitions_per_month"] == {"2023-08": 1}
+
+    async def test_invalid_stuck_days(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        response: Response = await async_client.get("/analytics/?stuck_days=0")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
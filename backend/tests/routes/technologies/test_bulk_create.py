@@ -0,0 +1,109 @@
+"""Tests for creating many technologies at once."""
+
+from typing import Any
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+import tech_radar.routes.technologies as technologies_routes
+from tech_radar.models import Technology
+
+
+def _technology(name: str, **overrides: Any) -> dict[str, Any]:
+    return {
+        "name": name,
+        "category": "Frameworks",
+        "stage": "Assess",
+        "tags": ["bulk"],
+        "detailsPage": "https://example.com",
+        **overrides,
+    }
+
+
+class TestBulkCreate:
+    """Test cases for PUT /technologies/bulk."""
+
+    async def test_creates_all_technologies(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        response: Response = await async_client.put(
+            "/technologies/bulk", json=[_technology("Alpha"), _technology("Beta Tool")]
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["succeeded"] == 2
+        assert data["failed"] == 0
+        assert [result["status"] for result in data["results"]] == [200, 200]
+
+        # The created technologies are searchable like the ones created one by one
+        list_response = await async_client.get("/technologies/?search=too")
+        assert [tech["name"] for tech in list_response.json()["technologies"]] == ["Beta Tool"]
+
+    async def test_failures_do_not_abort_the_batch(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.put(
+            "/technologies/bulk",
+            json=[
+                _technology("Alpha"),
+                _technology("React"),
+                _technology("Beta", stage="Unknown"),
+                _technology("Alpha"),
+                _technology("Gamma"),
+            ],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["succeeded"] == 2
+        assert data["failed"] == 3
+        assert [(result["name"], result["status"]) for result in data["results"]] == [
+            ("Alpha", 200),
+            ("React", 409),
+            ("Beta", 422),
+            ("Alpha", 409),
+            ("Gamma", 200),
+        ]
+        assert "stage" in data["results"][2]["detail"]
+
+        assert await Technology.find(Technology.name == "Alpha").count() == 1
+        assert await Technology.find(Technology.name == "Gamma").count() == 1
+        react = await Technology.find_one(Technology.name == "React")
+        assert react is not None
+        assert react.stage == "Adopt"
+
+    async def test_inserts_in_chunks(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        monkeypatch: Any,
+    ) -> None:
+        monkeypatch.setattr(technologies_routes, "BULK_INSERT_CHUNK_SIZE", 2)
+
+        response: Response = await async_client.put(
+            "/technologies/bulk",
+            json=[_technology(name) for name in ["A", "B", "A", "C", "D"]],
+        )
+
+        data = response.json()
+        assert [result["status"] for result in data["results"]] == [200, 200, 409, 200, 200]
+        assert await Technology.count() == 4
+
+    async def test_invalidates_list_cache(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        first = await async_client.get("/technologies/")
+        assert first.json()["metadata"]["total_count"] == 0
+
+        await async_client.put("/technologies/bulk", json=[_technology("Alpha")])
+
+        second = await async_client.get(
+            "/technologies/", headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert second.status_code == status.HTTP_200_OK
+        assert second.json()["metadata"]["total_count"] == 1
@@ -0,0 +1,117 @@
+"""Tests for deleting many technologies at once."""
+
+from datetime import datetime
+from typing import Any
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pytest_mock import MockerFixture
+
+from tech_radar.models import History, Technology
+
+
+class TestBulkDelete:
+    """Test cases for DELETE /technologies/."""
+
+    async def test_delete_by_names(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.delete(
+            "/technologies/", params={"names": ["React", "Rust", "Unknown"]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"deleted": 2, "not_found": ["Unknown"]}
+        assert {tech.name for tech in await Technology.find_all().to_list()} == {
+            "Docker",
+            "Kubernetes",
+            "GraphQL",
+        }
+
+    async def test_delete_by_filters(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.delete(
+            "/technologies/", params={"tags": "devops", "stages": "Adopt"}
+        )
+
+        assert response.json() == {"deleted": 1, "not_found": []}
+        assert await Technology.find_one(Technology.name == "Docker") is None
+        assert await Technology.find_one(Technology.name == "Kubernetes") is not None
+
+    async def test_names_and_filters_are_combined(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.delete(
+            "/technologies/", params={"names": ["React", "Docker"], "categories": "Frameworks"}
+        )
+
+        assert response.json() == {"deleted": 1, "not_found": []}
+        assert await Technology.find_one(Technology.name == "Docker") is not None
+
+    async def test_technologies_matching_after_the_selection_are_kept(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        mocker: MockerFixture,
+    ) -> None:
+        collection = Technology.get_pymongo_collection()
+        distinct = collection.distinct
+
+        async def distinct_then_insert(*args: Any, **kwargs: Any) -> list[str]:
+            names: list[str] = await distinct(*args, **kwargs)
+            # A matching technology is created between the selection and the deletion
+            await Technology(
+                name="Podman",
+                category="Development Tools",
+                stage="Adopt",
+                tags=["devops"],
+                detailsPage=None,
+                history=History(discoveryDate=datetime.now()),
+            ).insert()
+            return names
+
+        mocker.patch.object(collection, "distinct", side_effect=distinct_then_insert)
+
+        response: Response = await async_client.delete("/technologies/", params={"tags": "devops"})
+
+        assert response.json() == {"deleted": 2, "not_found": []}
+        assert await Technology.find_one(Technology.name == "Podman") is not None
+
+    async def test_delete_without_selection_is_rejected(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.delete("/technologies/")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert await Technology.count() == len(sample_technologies)
+
+    async def test_invalidates_list_cache(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        first = await async_client.get("/technologies/")
+
+        await async_client.delete("/technologies/", params={"names": ["React"]})
+
+        second = await async_client.get(
+            "/technologies/", headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert second.status_code == status.HTTP_200_OK
+        assert second.json()["metadata"]["total_count"] == len(sample_technologies) - 1
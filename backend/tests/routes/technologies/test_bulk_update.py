@@ -0,0 +1,143 @@
+"""Tests for updating many technologies at once."""
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import StageTransitionRecord, Technology
+
+
+class TestBulkUpdate:
+    """Test cases for POST /technologies/bulk."""
+
+    async def test_stage_transitions(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.post(
+            "/technologies/bulk",
+            json=[
+                {"name": "GraphQL", "stageTransition": {"newStage": "Trial", "adrLink": "adr/1"}},
+                {"name": "Rust", "stageTransition": {"newStage": "Assess", "adrLink": "adr/2"}},
+            ],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["succeeded"] == 2
+
+        graphql = await Technology.find_one(Technology.name == "GraphQL")
+        assert graphql is not None
+        assert graphql.stage == "Trial"
+        # Fields that were not given are left as is
+        assert graphql.category == "Frameworks"
+        assert graphql.tags == ["api", "query-language"]
+        assert graphql.history.transitionCount == 1
+        [transition] = await StageTransitionRecord.find(
+            StageTransitionRecord.technology == "GraphQL"
+        ).to_list()
+        assert transition.originalStage == "Assess"
+        assert transition.newStage == "Trial"
+        assert transition.adrLink == "adr/1"
+
+    async def test_field_updates(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.post(
+            "/technologies/bulk",
+            json=[{"name": "Docker", "tags": ["shipping"], "detailsPage": None}],
+        )
+
+        assert response.json()["results"] == [
+            {"index": 0, "name": "Docker", "status": 200, "detail": None}
+        ]
+        docker = await Technology.find_one(Technology.name == "Docker")
+        assert docker is not None
+        assert docker.tags == ["shipping"]
+        assert docker.detailsPage is None
+        assert docker.stage == "Adopt"
+        assert docker.history.transitionCount == 0
+
+        # The search terms follow the new tags
+        search_response = await async_client.get("/technologies/?search=ship")
+        assert [tech["name"] for tech in search_response.json()["technologies"]] == ["Docker"]
+
+    async def test_failures_do_not_abort_the_batch(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.post(
+            "/technologies/bulk",
+            json=[
+                {"name": "Unknown", "tags": []},
+                {"name": "React", "category": "Not a category"},
+                {"name": "Rust", "tags": ["systems"]},
+                {"name": "Rust", "tags": ["again"]},
+                {"name": "Docker", "tags": ["containers"]},
+            ],
+        )
+
+        data = response.json()
+        assert [(result["name"], result["status"]) for result in data["results"]] == [
+            ("Unknown", 404),
+            ("React", 422),
+            ("Rust", 200),
+            ("Rust", 409),
+            ("Docker", 200),
+        ]
+        assert data["succeeded"] == 2
+        assert data["failed"] == 3
+
+        rust = await Technology.find_one(Technology.name == "Rust")
+        assert rust is not None
+        assert rust.tags == ["systems"]
+
+    async def test_invalid_stage_transitions_are_rejected(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.post(
+            "/technologies/bulk",
+            json=[{"name": "Rust", "stageTransition": {"newStage": "Bogus", "adrLink": "a"}}],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [(result["name"], result["status"]) for result in response.json()["results"]] == [
+            ("Rust", 422)
+        ]
+        rust = await Technology.find_one(Technology.name == "Rust")
+        assert rust is not None
+        assert rust.stage == "Hold"
+        assert await StageTransitionRecord.count() == 0
+
+        # The technology and the changes feed can still be read
+        assert (await async_client.get("/technologies/Rust")).status_code == status.HTTP_200_OK
+        changes = await async_client.get("/technologies/changes")
+        assert changes.status_code == status.HTTP_200_OK
+
+    async def test_invalidates_list_cache(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        first = await async_client.get("/technologies/")
+
+        await async_client.post(
+            "/technologies/bulk",
+            json=[{"name": "Rust", "stageTransition": {"newStage": "Adopt", "adrLink": "adr"}}],
+        )
+
+        second = await async_client.get(
+            "/technologies/", headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert second.status_code == status.HTTP_200_OK
+        assert second.json()["metadata"]["stage_counts"]["Adopt"] == 3
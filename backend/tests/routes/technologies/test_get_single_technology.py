@@ -0,0 +1,98 @@
+"""Tests for fetching technologies by name."""
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import Technology
+
+
+def _update(stage: str) -> dict[str, object]:
+    return {
+        "category": "Frameworks",
+        "tags": ["frontend"],
+        "detailsPage": None,
+        "stageTransition": {"newStage": stage, "adrLink": "adr"},
+    }
+
+
+class TestGetTechnology:
+    """Test cases for GET /technologies/{name}."""
+
+    async def test_get_technology(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get("/technologies/React")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["name"] == "React"
+        assert data["history"]["transitionCount"] == 0
+        assert "searchTerms" not in data
+        assert "revision" not in data
+        assert response.headers["ETag"]
+
+    async def test_get_nonexistent_technology(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        response: Response = await async_client.get("/technologies/NonExistentTech")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_etag_follows_revision(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        first: Response = await async_client.get("/technologies/React")
+        etag = first.headers["ETag"]
+
+        # Writes to other technologies don't change the ETag
+        await async_client.post("/technologies/Rust", json=_update("Assess"))
+        not_modified = await async_client.get(
+            "/technologies/React", headers={"If-None-Match": etag}
+        )
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+        await async_client.post("/technologies/React", json=_update("Hold"))
+        modified = await async_client.get("/technologies/React", headers={"If-None-Match": etag})
+        assert modified.status_code == status.HTTP_200_OK
+        assert modified.headers["ETag"] != etag
+        assert modified.json()["stage"] == "Hold"
+
+
+class TestGetTechnologiesBatch:
+    """Test cases for GET /technologies/batch."""
+
+    async def test_get_batch(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/batch", params={"names": ["Rust", "React", "Unknown", "Rust"]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [tech["name"] for tech in data["technologies"]] == ["React", "Rust"]
+        assert data["not_found"] == ["Unknown"]
+
+    async def test_get_batch_summaries(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/batch", params={"names": ["Docker"], "view": "summary"}
+        )
+
+        [docker] = response.json()["technologies"]
+        assert docker["name"] == "Docker"
+        assert "history" not in docker
@@ -263,8 +263,8 @@ class TestGetTechnologiesEndpointEndpoint:
             # Check history structure
             history = tech["history"]
             assert "discoveryDate" in history
-            assert "stageTransitions" in history
-            assert isinstance(history["stageTransitions"], list)
+            assert history["transitionCount"] == 0
+            assert history["lastTransition"] is None
 
     async def test_empty_query_parameters_should_return_all_technologies(
         self,
@@ -297,6 +297,52 @@ class TestGetTechnologiesEndpointEndpoint:
         # Should return all technologies when invalid parameters are ignored
         assert len(data["technologies"]) == 5
 
+    async def test_available_tags_include_tags_of_filtered_out_technologies(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?stages=Hold")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+
+        assert len(data["technologies"]) == 1
+        expected_tags: set[str] = {tag for tech in sample_technologies for tag in tech.tags}
+        assert data["metadata"]["available_tags"] == sorted(expected_tags)
+
+    async def test_metadata_counts(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?tags=devops&tags=api")
+
+        assert response.status_code == status.HTTP_200_OK
+        metadata = response.json()["metadata"]
+
+        assert metadata["category_counts"] == {
+            "Data Management": 1,
+            "Development Tools": 1,
+            "Frameworks": 1,
+        }
+        assert metadata["stage_counts"] == {"Adopt": 1, "Assess": 1, "Trial": 1}
+        assert metadata["tag_counts"] == {
+            "api": 1,
+            "cloud": 1,
+            "containerization": 1,
+            "devops": 2,
+            "orchestration": 1,
+            "query-language": 1,
+        }
+        assert metadata["category_stage_counts"] == {
+            "Data Management": {"Trial": 1},
+            "Development Tools": {"Adopt": 1},
+            "Frameworks": {"Assess": 1},
+        }
+
 
 class TestTechnologiesEndpointPerformance:
     """Performance-related tests for the technologies endpoint."""
@@ -0,0 +1,166 @@
+import asyncio
+from typing import Any
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pytest_mock import MockerFixture
+
+import tech_radar.routes.technologies as technologies_routes
+from tech_radar.models import Technology
+from tech_radar.queries import TechnologyListResult, find_technologies
+from tech_radar.routes.technologies import list_cache, list_flights
+
+
+class TestTechnologiesListCache:
+    """Test cases for the cached GET /technologies endpoint."""
+
+    async def test_repeated_reads_are_served_from_cache(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        mocker: MockerFixture,
+    ) -> None:
+        find_spy = mocker.spy(technologies_routes, "find_technologies")
+
+        first: Response = await async_client.get("/technologies/?stages=Adopt&stages=Trial")
+        second: Response = await async_client.get("/technologies/?stages=Trial&stages=Adopt")
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.content == first.content
+        assert find_spy.call_count == 1
+
+    async def test_writes_invalidate_cached_reads(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        before: Response = await async_client.get("/technologies/")
+        assert before.json()["metadata"]["total_count"] == 5
+
+        create_data = {"name": "Svelte", "category": "Frameworks", "stage": "Assess"}
+        await async_client.put("/technologies/", json=create_data)
+        after_create: Response = await async_client.get("/technologies/")
+        assert after_create.json()["metadata"]["total_count"] == 6
+
+        update_data = {
+            "category": "Frameworks",
+            "tags": ["frontend"],
+            "detailsPage": None,
+            "stageTransition": None,
+        }
+        await async_client.post("/technologies/Svelte", json=update_data)
+        after_update: Response = await async_client.get("/technologies/")
+        assert "frontend" in after_update.json()["metadata"]["available_tags"]
+
+        await async_client.delete("/technologies/Svelte")
+        after_delete: Response = await async_client.get("/technologies/")
+        assert after_delete.json()["metadata"]["total_count"] == 5
+
+
+class TestTechnologiesListConditionalRequests:
+    """Test cases for ETag / If-None-Match support of the GET /technologies endpoint."""
+
+    async def test_matching_etag_returns_not_modified(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        mocker: MockerFixture,
+    ) -> None:
+        first: Response = await async_client.get("/technologies/?stages=Adopt")
+        etag = first.headers["ETag"]
+        find_spy = mocker.spy(technologies_routes, "find_technologies")
+
+        second: Response = await async_client.get(
+            "/technologies/?stages=Adopt", headers={"If-None-Match": etag}
+        )
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+        find_spy.assert_not_called()
+
+    async def test_etag_depends_on_filters(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        adopt: Response = await async_client.get("/technologies/?stages=Adopt")
+
+        response: Response = await async_client.get(
+            "/technologies/?stages=Hold", headers={"If-None-Match": adopt.headers["ETag"]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != adopt.headers["ETag"]
+
+    async def test_etag_changes_after_write(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        before: Response = await async_client.get("/technologies/")
+        await async_client.delete("/technologies/React")
+
+        after: Response = await async_client.get(
+            "/technologies/", headers={"If-None-Match": before.headers["ETag"]}
+        )
+
+        assert after.status_code == status.HTTP_200_OK
+        assert after.json()["metadata"]["total_count"] == 4
+
+
+class TestTechnologiesListCoalescing:
+    """Test cases for sharing the queries of identical concurrent list requests."""
+
+    @pytest.fixture
+    def slow_find(self, mocker: MockerFixture) -> Any:
+        async def slow_find_technologies(*args: Any, **kwargs: Any) -> TechnologyListResult:
+            # Keep the query in flight while the other requests arrive
+            await asyncio.sleep(0.01)
+            return await find_technologies(*args, **kwargs)
+
+        return mocker.patch.object(
+            technologies_routes, "find_technologies", side_effect=slow_find_technologies
+        )
+
+    async def test_identical_requests_share_one_query(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        slow_find: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Without the cache, so only the coalescing keeps the requests from querying
+        monkeypatch.setattr(list_cache, "max_entries", 0)
+
+        responses: list[Response] = await asyncio.gather(
+            *(async_client.get("/technologies/?stages=Adopt") for _ in range(20))
+        )
+
+        assert all(response.status_code == status.HTTP_200_OK for response in responses)
+        assert len({response.content for response in responses}) == 1
+        assert slow_find.call_count == 1
+        assert len(list_flights) == 0
+
+    async def test_different_requests_do_not_share_queries(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        slow_find: Any,
+    ) -> None:
+        adopt, hold = await asyncio.gather(
+            async_client.get("/technologies/?stages=Adopt"),
+            async_client.get("/technologies/?stages=Hold"),
+        )
+
+        assert adopt.json() != hold.json()
+        assert slow_find.call_count == 2
@@ -0,0 +1,130 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pytest_mock import MockerFixture
+
+import tech_radar.queries as queries
+import tech_radar.routes.technologies as technologies_routes
+from tech_radar.models import Technology
+
+
+class TestTechnologiesPagination:
+    """Test cases for the keyset pagination of the GET /technologies endpoint."""
+
+    async def test_pages_cover_all_technologies_in_name_order(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        names: list[str] = []
+        url = "/technologies/?limit=2"
+        while True:
+            response: Response = await async_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+
+            assert len(data["technologies"]) <= 2
+            assert data["metadata"]["total_count"] == 5
+            names.extend(tech["name"] for tech in data["technologies"])
+
+            next_cursor = data["metadata"]["next_cursor"]
+            if next_cursor is None:
+                break
+            url = f"/technologies/?limit=2&after={next_cursor}"
+
+        assert names == sorted(tech.name for tech in sample_technologies)
+
+    async def test_pagination_with_filters(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?categories=Frameworks&limit=2")
+        data = response.json()
+
+        assert [tech["name"] for tech in data["technologies"]] == ["GraphQL", "React"]
+        assert data["metadata"]["total_count"] == 3
+        assert data["metadata"]["categories"] == ["Frameworks"]
+
+        next_cursor = data["metadata"]["next_cursor"]
+        response = await async_client.get(
+            f"/technologies/?categories=Frameworks&limit=2&after={next_cursor}"
+        )
+        data = response.json()
+
+        assert [tech["name"] for tech in data["technologies"]] == ["Rust"]
+        assert data["metadata"]["next_cursor"] is None
+
+    async def test_last_full_page_has_no_next_cursor(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?limit=5")
+
+        assert len(response.json()["technologies"]) == 5
+        assert response.json()["metadata"]["next_cursor"] is None
+
+    async def test_invalid_cursor(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?limit=2&after=not-a-cursor")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Invalid cursor" in response.json()["detail"]
+
+    async def test_invalid_limit(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?limit=0")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    async def test_limit_above_maximum(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?limit=1001")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    async def test_default_limit(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(technologies_routes, "DEFAULT_PAGE_LIMIT", 2)
+
+        response: Response = await async_client.get("/technologies/")
+
+        data = response.json()
+        assert [tech["name"] for tech in data["technologies"]] == ["Docker", "GraphQL"]
+        assert data["metadata"]["total_count"] == 5
+        assert data["metadata"]["next_cursor"] is not None
+
+    async def test_pages_share_their_counts(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        mocker: MockerFixture,
+    ) -> None:
+        aggregate_spy = mocker.spy(queries, "aggregate")
+
+        first: Response = await async_client.get("/technologies/?limit=2")
+        next_cursor = first.json()["metadata"]["next_cursor"]
+        second: Response = await async_client.get(f"/technologies/?limit=2&after={next_cursor}")
+
+        first_metadata = {**first.json()["metadata"], "next_cursor": None}
+        assert {**second.json()["metadata"], "next_cursor": None} == first_metadata
+        assert first_metadata["total_count"] == 5
+        # The pages are name index queries, only the counts are an aggregation
+        assert aggregate_spy.call_count == 1
@@ -2,6 +2,7 @@
 
 from typing import Any
 
+import pytest
 from fastapi import status
 from httpx import AsyncClient, Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
@@ -50,7 +51,7 @@ class TestTechnologyWorkflow:
         tech_data = get_response.json()["technologies"][0]
         assert tech_data["category"] == "Data Management"
         assert tech_data["stage"] == "Trial"
-        assert len(tech_data["history"]["stageTransitions"]) == 1
+        assert tech_data["history"]["transitionCount"] == 1
 
         # 5. Delete technology
         delete_response: Response = await async_client.delete("/technologies/Lifecycle Test Tech")
@@ -101,9 +102,42 @@ class TestTechnologyWorkflow:
         tech_data = get_response.json()["technologies"][0]
 
         assert tech_data["stage"] == "Adopt"
-        assert len(tech_data["history"]["stageTransitions"]) == 2
+        assert tech_data["history"]["transitionCount"] == 2
+        assert tech_data["history"]["lastTransition"]["originalStage"] == "Trial"
 
-        # Verify transition history
-        transitions: list[dict[str, Any]] = tech_data["history"]["stageTransitions"]
-        assert transitions[0]["originalStage"] == "Assess"
-        assert transitions[1]["originalStage"] == "Trial"
+        # Verify transition history, newest first
+        history_response: Response = await async_client.get(
+            "/technologies/Stage Progression Tech/history"
+        )
+        transitions: list[dict[str, Any]] = history_response.json()["transitions"]
+        assert [(t["originalStage"], t["newStage"]) for t in transitions] == [
+            ("Trial", "Adopt"),
+            ("Assess", "Trial"),
+        ]
+
+
+class TestReservedNames:
+    """Test that technologies can't take the names of collection endpoints."""
+
+    @pytest.mark.parametrize("name", ["batch", "bulk", "changes", "events"])
+    async def test_reserved_names_are_rejected(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology], name: str
+    ) -> None:
+        technology = {"name": name, "category": "Frameworks", "stage": "Assess"}
+
+        response: Response = await async_client.put("/technologies/", json=technology)
+        bulk_response: Response = await async_client.put("/technologies/bulk", json=[technology])
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert "reserved" in str(response.json()["detail"])
+        assert bulk_response.json()["results"][0]["status"] == 422
+        assert await Technology.count() == 0
+
+    async def test_names_only_containing_reserved_words_are_allowed(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        technology = {"name": "Bulk Loader", "category": "Frameworks", "stage": "Assess"}
+
+        response: Response = await async_client.put("/technologies/", json=technology)
+
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,142 @@
+"""Tests for point-in-time queries of the radar."""
+
+from datetime import datetime
+from typing import Any
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pytest_mock import MockerFixture
+
+from tech_radar import history
+from tech_radar.models import StageTransitionRecord, Technology
+
+
+async def _date_transitions(name: str, dates: list[datetime]) -> None:
+    """Move the transitions of a technology (oldest first) to fixed dates."""
+    collection = StageTransitionRecord.get_pymongo_collection()
+    for sequence, date in enumerate(dates, start=1):
+        await collection.update_many(
+            {"technology": name, "sequence": sequence}, {"$set": {"transitionDate": date}}
+        )
+
+
+async def _radar_as_of(async_client: AsyncClient, as_of: str, **params: Any) -> dict[str, Any]:
+    response: Response = await async_client.get("/technologies/", params={"as_of": as_of, **params})
+    assert response.status_code == status.HTTP_200_OK
+    data: dict[str, Any] = response.json()
+    return data
+
+
+class TestRadarAsOf:
+    """Test cases for the as_of parameter of GET /technologies."""
+
+    async def test_stages_as_of_dates(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        for new_stage in ["Assess", "Trial"]:
+            response: Response = await async_client.post(
+                "/technologies/bulk",
+                json=[{"name": "Rust", "stageTransition": {"newStage": new_stage, "adrLink": "a"}}],
+            )
+            assert response.json()["succeeded"] == 1
+        await _date_transitions("Rust", [datetime(2024, 1, 1), datetime(2025, 1, 1)])
+
+        stages: dict[str, dict[str, str]] = {}
+        for as_of in ["2023-04-15", "2023-06-01", "2024-06-01", "2025-06-01"]:
+            data = await _radar_as_of(async_client, as_of)
+            stages[as_of] = {tech["name"]: tech["stage"] for tech in data["technologies"]}
+
+        # Rust was discovered in May 2023
+        assert "Rust" not in stages["2023-04-15"]
+        assert len(stages["2023-04-15"]) == 4
+        assert stages["2023-06-01"]["Rust"] == "Hold"
+        assert stages["2024-06-01"]["Rust"] == "Assess"
+        assert stages["2025-06-01"]["Rust"] == "Trial"
+        assert stages["2025-06-01"]["React"] == "Adopt"
+
+    async def test_history_summary_as_of_date(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        for new_stage in ["Trial", "Adopt"]:
+            response: Response = await async_client.post(
+                "/technologies/GraphQL",
+                json={
+                    "category": "Frameworks",
+                    "tags": ["api"],
+                    "detailsPage": None,
+                    "stageTransition": {"newStage": new_stage, "adrLink": f"adr/{new_stage}"},
+                },
+            )
+            assert response.status_code == status.HTTP_200_OK
+        await _date_transitions("GraphQL", [datetime(2024, 1, 1), datetime(2025, 1, 1)])
+
+        data = await _radar_as_of(async_client, "2024-06-01T00:00:00")
+        graphql = next(tech for tech in data["technologies"] if tech["name"] == "GraphQL")
+
+        assert graphql["stage"] == "Trial"
+        assert graphql["history"]["transitionCount"] == 1
+        assert graphql["history"]["lastTransition"]["adrLink"] == "adr/Trial"
+        assert graphql["history"]["lastTransition"]["originalStage"] == "Assess"
+
+    async def test_filters_apply_to_past_stages(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.post(
+            "/technologies/bulk",
+            json=[{"name": "React", "stageTransition": {"newStage": "Hold", "adrLink": "a"}}],
+        )
+        assert response.json()["succeeded"] == 1
+        await _date_transitions("React", [datetime(2024, 1, 1)])
+
+        before = await _radar_as_of(async_client, "2023-12-01", stages="Adopt")
+        after = await _radar_as_of(async_client, "2024-02-01", stages="Adopt")
+
+        assert [tech["name"] for tech in before["technologies"]] == ["Docker", "React"]
+        assert [tech["name"] for tech in after["technologies"]] == ["Docker"]
+        assert after["metadata"]["total_count"] == 1
+
+    async def test_pages_share_the_reconstructed_radar(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        mocker: MockerFixture,
+    ) -> None:
+        first_transitions = mocker.spy(history, "_first_transitions")
+
+        first_page = await _radar_as_of(async_client, "2100-01-01", limit=3)
+        second_page = await _radar_as_of(
+            async_client, "2100-01-01", limit=3, after=first_page["metadata"]["next_cursor"]
+        )
+        technologies = first_page["technologies"] + second_page["technologies"]
+        assert len(technologies) == len(sample_technologies)
+        assert first_transitions.call_count == 1
+        assert {tech["name"]: tech["stage"] for tech in technologies}["Rust"] == "Hold"
+
+        # A write rebuilds the radar, with the technology moved to its new stage
+        response: Response = await async_client.post(
+            "/technologies/bulk",
+            json=[{"name": "Rust", "stageTransition": {"newStage": "Assess", "adrLink": "a"}}],
+        )
+        assert response.json()["succeeded"] == 1
+        data = await _radar_as_of(async_client, "2100-01-01", search="Rust")
+        assert [tech["stage"] for tech in data["technologies"]] == ["Assess"]
+
+    async def test_invalid_as_of(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?as_of=yesterday")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
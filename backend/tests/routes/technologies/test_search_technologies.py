@@ -0,0 +1,92 @@
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import Technology
+
+
+class TestSearchTechnologies:
+    """Test cases for the search modes of the GET /technologies endpoint."""
+
+    async def test_prefix_search_does_not_match_inside_words(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?search=ops")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["technologies"] == []
+
+    async def test_substring_search_matches_inside_words(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/?search=ops&search_mode=substring"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        names = {tech["name"] for tech in response.json()["technologies"]}
+        assert names == {"Docker", "Kubernetes"}
+
+    async def test_substring_search_escapes_regex_characters(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/?search=.*&search_mode=substring"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["technologies"] == []
+
+    async def test_results_are_ranked_by_name_matches(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        for name, tags in [("Reactor", []), ("Preact", ["react"]), ("React Native", [])]:
+            create_data = {"name": name, "category": "Frameworks", "stage": "Assess", "tags": tags}
+            await async_client.put("/technologies/", json=create_data)
+
+        response: Response = await async_client.get("/technologies/?search=react")
+        names = [tech["name"] for tech in response.json()["technologies"]]
+
+        assert names == ["React", "React Native", "Reactor", "Preact"]
+
+        # Ranked results can be paginated too
+        paged_names: list[str] = []
+        url = "/technologies/?search=react&limit=1"
+        while url:
+            data = (await async_client.get(url)).json()
+            paged_names.extend(tech["name"] for tech in data["technologies"])
+            next_cursor = data["metadata"]["next_cursor"]
+            url = f"/technologies/?search=react&limit=1&after={next_cursor}" if next_cursor else ""
+
+        assert paged_names == names
+
+    async def test_search_reflects_updated_tags(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        update_data = {
+            "category": "Observability",
+            "tags": ["monitoring"],
+            "detailsPage": None,
+            "stageTransition": None,
+        }
+        await async_client.post("/technologies/Rust", json=update_data)
+
+        response: Response = await async_client.get("/technologies/?search=monitor")
+
+        assert [tech["name"] for tech in response.json()["technologies"]] == ["Rust"]
+        assert "searchTerms" not in response.json()["technologies"][0]
@@ -0,0 +1,81 @@
+import json
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import Technology
+
+
+class TestStreamTechnologies:
+    """Test cases for the NDJSON streaming mode of the GET /technologies endpoint."""
+
+    async def test_technologies_are_streamed_one_per_line(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        technologies = [json.loads(line) for line in response.text.splitlines()]
+        assert [tech["name"] for tech in technologies] == sorted(
+            tech.name for tech in sample_technologies
+        )
+        assert "discoveryDate" in technologies[0]["history"]
+
+    async def test_stream_applies_filters_and_pagination(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/?categories=Frameworks&limit=2",
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        names = [json.loads(line)["name"] for line in response.text.splitlines()]
+        assert names == ["GraphQL", "React"]
+
+    async def test_stream_of_empty_collection(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/", headers={"Accept": "application/x-ndjson"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text == ""
+
+    async def test_refused_stream_is_not_sent(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/", headers={"Accept": "application/x-ndjson;q=0, application/json"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        assert len(response.json()["technologies"]) == len(sample_technologies)
+
+    async def test_stream_is_sent_when_preferred(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/", headers={"Accept": "application/json;q=0.5, application/x-ndjson"}
+        )
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert len(response.text.splitlines()) == len(sample_technologies)
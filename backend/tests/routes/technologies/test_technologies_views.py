@@ -0,0 +1,66 @@
+import json
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import Technology
+
+
+class TestTechnologiesViews:
+    """Test cases for the view query parameter of the GET /technologies endpoint."""
+
+    async def test_summary_view_leaves_out_history(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?view=summary&stages=Adopt")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+
+        assert data["metadata"]["total_count"] == 2
+        assert data["technologies"][0] == {
+            "name": "Docker",
+            "category": "Development Tools",
+            "stage": "Adopt",
+            "tags": ["containerization", "devops"],
+            "detailsPage": "https://docker.com",
+        }
+
+    async def test_full_view_is_the_default(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        default: Response = await async_client.get("/technologies/")
+        full: Response = await async_client.get("/technologies/?view=full")
+        summary: Response = await async_client.get("/technologies/?view=summary")
+
+        assert default.json() == full.json()
+        assert "history" in full.json()["technologies"][0]
+        assert summary.headers["ETag"] != full.headers["ETag"]
+
+    async def test_summary_view_when_streaming(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/?view=summary", headers={"Accept": "application/x-ndjson"}
+        )
+
+        technologies = [json.loads(line) for line in response.text.splitlines()]
+        assert len(technologies) == 5
+        assert all("history" not in tech for tech in technologies)
+
+    async def test_invalid_view(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        response: Response = await async_client.get("/technologies/?view=compact")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
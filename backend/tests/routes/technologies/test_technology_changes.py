@@ -0,0 +1,121 @@
+"""Tests for syncing the technologies that changed since a previous sync."""
+
+from typing import Any
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import Technology
+from tech_radar.versions import bump_version
+
+
+async def _sync(async_client: AsyncClient, since: int) -> dict[str, Any]:
+    response: Response = await async_client.get("/technologies/changes", params={"since": since})
+    assert response.status_code == status.HTTP_200_OK
+    data: dict[str, Any] = response.json()
+    return data
+
+
+async def _initial_token(async_client: AsyncClient) -> int:
+    # The sample technologies are inserted directly, as if the radar was at version 0 before
+    # a write through the API
+    await bump_version(Technology)
+    token: int = (await _sync(async_client, 0))["token"]
+    assert token > 0
+    return token
+
+
+class TestTechnologyChanges:
+    """Test cases for GET /technologies/changes."""
+
+    async def test_full_sync(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        data = await _sync(async_client, 0)
+
+        assert {tech["name"] for tech in data["upserts"]} == {
+            tech.name for tech in sample_technologies
+        }
+        assert data["deleted"] == []
+
+    async def test_only_changes_are_returned(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        token = await _initial_token(async_client)
+
+        await async_client.put(
+            "/technologies/",
+            json={
+                "name": "Zig",
+                "category": "Frameworks",
+                "stage": "Assess",
+                "tags": [],
+                "detailsPage": None,
+            },
+        )
+        await async_client.post(
+            "/technologies/bulk",
+            json=[{"name": "Rust", "stageTransition": {"newStage": "Trial", "adrLink": "adr"}}],
+        )
+        await async_client.delete("/technologies/React")
+        await async_client.delete("/technologies/", params={"tags": "devops", "stages": "Trial"})
+
+        data = await _sync(async_client, token)
+        assert data["token"] > token
+        assert sorted(tech["name"] for tech in data["upserts"]) == ["Rust", "Zig"]
+        assert data["upserts"][0]["updatedAt"] is not None
+        assert data["deleted"] == ["Kubernetes", "React"]
+
+        # Nothing changed since the last sync
+        data = await _sync(async_client, data["token"])
+        assert data["upserts"] == []
+        assert data["deleted"] == []
+
+    async def test_recreated_technology_is_not_deleted(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        token = await _initial_token(async_client)
+
+        await async_client.delete("/technologies/Docker")
+        await async_client.put(
+            "/technologies/bulk",
+            json=[
+                {
+                    "name": "Docker",
+                    "category": "Development Tools",
+                    "stage": "Hold",
+                    "tags": [],
+                    "detailsPage": None,
+                }
+            ],
+        )
+
+        data = await _sync(async_client, token)
+        assert [tech["name"] for tech in data["upserts"]] == ["Docker"]
+        assert data["deleted"] == []
+
+    async def test_pending_writes_are_returned(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        token = await _initial_token(async_client)
+
+        # A write that did not publish its changes yet
+        await Technology.get_pymongo_collection().update_one(
+            {"name": "GraphQL"}, {"$set": {"stage": "Trial", "syncPending": True}}
+        )
+
+        data = await _sync(async_client, token)
+        assert [tech["name"] for tech in data["upserts"]] == ["GraphQL"]
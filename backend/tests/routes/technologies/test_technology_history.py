@@ -0,0 +1,87 @@
+"""Tests for the stage transition history of technologies."""
+
+from fastapi import status
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import StageTransitionRecord, Technology
+
+
+async def _transition(async_client: AsyncClient, name: str, new_stage: str) -> None:
+    response: Response = await async_client.post(
+        "/technologies/bulk",
+        json=[{"name": name, "stageTransition": {"newStage": new_stage, "adrLink": new_stage}}],
+    )
+    assert response.json()["succeeded"] == 1
+
+
+class TestTechnologyHistory:
+    """Test cases for GET /technologies/{name}/history."""
+
+    async def test_history_pages(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        for stage in ["Assess", "Trial", "Adopt", "Hold", "Trial"]:
+            await _transition(async_client, "Rust", stage)
+
+        new_stages: list[str] = []
+        cursor = None
+        while True:
+            params = {"limit": 2} if cursor is None else {"limit": 2, "after": cursor}
+            response: Response = await async_client.get("/technologies/Rust/history", params=params)
+            assert response.status_code == status.HTTP_200_OK
+            page = response.json()
+            assert len(page["transitions"]) <= 2
+            new_stages += [transition["newStage"] for transition in page["transitions"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert new_stages == ["Trial", "Hold", "Adopt", "Trial", "Assess"]
+
+    async def test_history_of_technology_without_transitions(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get("/technologies/React/history")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"transitions": [], "next_cursor": None}
+
+    async def test_history_of_nonexistent_technology(
+        self, async_client: AsyncClient, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        response: Response = await async_client.get("/technologies/NonExistentTech/history")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_invalid_cursor(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/React/history", params={"after": "not-a-cursor"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_history_is_deleted_with_technology(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        await _transition(async_client, "Rust", "Assess")
+        await _transition(async_client, "React", "Hold")
+
+        await async_client.delete("/technologies/Rust")
+
+        records = await StageTransitionRecord.find_all().to_list()
+        assert [record.technology for record in records] == ["React"]
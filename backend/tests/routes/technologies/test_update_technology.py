@@ -6,7 +6,7 @@ from fastapi import status
 from httpx import AsyncClient, Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from tech_radar.models import Technology
+from tech_radar.models import StageTransitionRecord, Technology
 
 
 class TestUpdateTechnologiesEndpoint:
@@ -64,9 +64,9 @@ class TestUpdateTechnologiesEndpoint:
         tech_data = get_response.json()["technologies"][0]
 
         assert tech_data["stage"] == "Hold"
-        assert len(tech_data["history"]["stageTransitions"]) == 1
+        assert tech_data["history"]["transitionCount"] == 1
 
-        transition: dict[str, Any] = tech_data["history"]["stageTransitions"][0]
+        transition: dict[str, Any] = tech_data["history"]["lastTransition"]
         assert transition["originalStage"] == "Adopt"  # Original stage from sample data
         assert transition["adrLink"] == "https://example.com/adr/react-hold"
 
@@ -105,3 +105,99 @@ class TestUpdateTechnologiesEndpoint:
         response: Response = await async_client.post("/technologies/React", json=update_data)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    async def test_stage_transitions_are_appended(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        """Test consecutive stage transitions are all kept in the history."""
+        for new_stage in ["Trial", "Adopt"]:
+            update_data = {
+                "category": "Frameworks",
+                "tags": ["api"],
+                "detailsPage": None,
+                "stageTransition": {"newStage": new_stage, "adrLink": f"adr/{new_stage}"},
+            }
+            response: Response = await async_client.post("/technologies/GraphQL", json=update_data)
+            assert response.status_code == status.HTTP_200_OK
+
+        graphql = await Technology.find_one(Technology.name == "GraphQL")
+        assert graphql is not None
+        assert graphql.stage == "Adopt"
+        assert graphql.history.transitionCount == 2
+        records = await StageTransitionRecord.find(
+            StageTransitionRecord.technology == "GraphQL"
+        ).to_list()
+        assert sorted((r.originalStage, r.newStage) for r in records) == [
+            ("Assess", "Trial"),
+            ("Trial", "Adopt"),
+        ]
+
+    async def test_update_technology_expected_stage_conflict(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        """Test a stage transition from a stage the technology already left."""
+        update_data: dict[str, Any] = {
+            "category": "Frameworks",
+            "tags": ["api"],
+            "detailsPage": None,
+            "stageTransition": {"newStage": "Trial", "adrLink": "adr/trial"},
+            "expectedStage": "Assess",
+        }
+
+        first: Response = await async_client.post("/technologies/GraphQL", json=update_data)
+        second: Response = await async_client.post("/technologies/GraphQL", json=update_data)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_409_CONFLICT
+        graphql = await Technology.find_one(Technology.name == "GraphQL")
+        assert graphql is not None
+        assert graphql.history.transitionCount == 1
+        assert await StageTransitionRecord.count() == 1
+
+    async def test_update_technology_invalid_expected_stage(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        """Test that an expected stage that is not a stage is rejected."""
+        update_data: dict[str, Any] = {
+            "category": "Frameworks",
+            "tags": ["api"],
+            "detailsPage": None,
+            "stageTransition": {"newStage": "Trial", "adrLink": "adr/trial"},
+            "expectedStage": "Nonsense",
+        }
+
+        response: Response = await async_client.post("/technologies/GraphQL", json=update_data)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        assert await StageTransitionRecord.count() == 0
+
+    async def test_update_technology_invalid_new_stage(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        """Test that a transition to something that is not a stage is rejected."""
+        update_data: dict[str, Any] = {
+            "category": "Frameworks",
+            "tags": ["api"],
+            "detailsPage": None,
+            "stageTransition": {"newStage": "Bogus", "adrLink": "adr/bogus"},
+        }
+
+        response: Response = await async_client.post("/technologies/GraphQL", json=update_data)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        graphql = await Technology.find_one(Technology.name == "GraphQL")
+        assert graphql is not None
+        assert graphql.stage == "Assess"
+        assert await StageTransitionRecord.count() == 0
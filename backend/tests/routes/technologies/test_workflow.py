@@ -50,7 +50,7 @@ class TestTechnologyWorkflow:
         tech_data = get_response.json()["technologies"][0]
         assert tech_data["category"] == "Data Management"
         assert tech_data["stage"] == "Trial"
-        assert len(tech_data["history"]["stageTransitions"]) == 1
+        assert tech_data["history"]["transitionCount"] == 1
 
         # 5. Delete technology
         delete_response: Response = await async_client.delete("/technologies/Lifecycle Test Tech")
@@ -101,9 +101,15 @@ class TestTechnologyWorkflow:
         tech_data = get_response.json()["technologies"][0]
 
         assert tech_data["stage"] == "Adopt"
-        assert len(tech_data["history"]["stageTransitions"]) == 2
+        assert tech_data["history"]["transitionCount"] == 2
+        assert tech_data["history"]["lastTransition"]["originalStage"] == "Trial"
 
-        # Verify transition history
-        transitions: list[dict[str, Any]] = tech_data["history"]["stageTransitions"]
-        assert transitions[0]["originalStage"] == "Assess"
-        assert transitions[1]["originalStage"] == "Trial"
+        # Verify transition history, newest first
+        history_response: Response = await async_client.get(
+            "/technologies/Stage Progression Tech/history"
+        )
+        transitions: list[dict[str, Any]] = history_response.json()["transitions"]
+        assert [(t["originalStage"], t["newStage"]) for t in transitions] == [
+            ("Trial", "Adopt"),
+            ("Assess", "Trial"),
+        ]
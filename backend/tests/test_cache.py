@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tech_radar.cache import SingleFlight, VersionedCache
+
+
+class TestVersionedCache:
+    """Test cases for the versioned LRU/TTL cache."""
+
+    def test_entries_are_returned_for_their_version(self) -> None:
+        cache: VersionedCache[str, int] = VersionedCache(max_entries=10, ttl_seconds=60)
+        cache.set(1, "key", 42)
+
+        assert cache.get(1, "key") == 42
+        assert cache.get(2, "key") is None
+        # The newer version dropped the old entries
+        assert cache.get(1, "key") is None
+        assert len(cache) == 0
+
+    def test_outdated_results_are_not_stored(self) -> None:
+        cache: VersionedCache[str, int] = VersionedCache(max_entries=10, ttl_seconds=60)
+        assert cache.get(2, "key") is None
+
+        cache.set(1, "key", 42)
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache: VersionedCache[str, int] = VersionedCache(max_entries=2, ttl_seconds=60)
+        cache.set(1, "a", 1)
+        cache.set(1, "b", 2)
+        cache.get(1, "a")
+        cache.set(1, "c", 3)
+
+        assert cache.get(1, "a") == 1
+        assert cache.get(1, "b") is None
+        assert cache.get(1, "c") == 3
+
+    def test_expired_entries_are_dropped(self, mocker: MockerFixture) -> None:
+        cache: VersionedCache[str, int] = VersionedCache(max_entries=10, ttl_seconds=60)
+        cache.set(1, "key", 42)
+
+        mocker.patch("tech_radar.cache.time.monotonic", return_value=time.monotonic() + 61)
+
+        assert cache.get(1, "key") is None
+
+
+class TestSingleFlight:
+    """Test cases for coalescing concurrent calls."""
+
+    async def test_concurrent_calls_share_one_task(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flights.run("key", call) for _ in range(10)))
+
+        assert results == [1] * 10
+        assert calls == 1
+        assert len(flights) == 0
+
+        # Done calls are not cached
+        assert await flights.run("key", call) == 2
+
+    async def test_different_keys_run_separately(self) -> None:
+        flights: SingleFlight[str, str] = SingleFlight()
+
+        async def call(value: str) -> str:
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            flights.run("a", lambda: call("a")), flights.run("b", lambda: call("b"))
+        )
+
+        assert list(results) == ["a", "b"]
+
+    async def test_exceptions_are_shared(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+
+        async def call() -> int:
+            await asyncio.sleep(0)
+            raise ValueError("failed")
+
+        results = await asyncio.gather(
+            flights.run("key", call), flights.run("key", call), return_exceptions=True
+        )
+
+        assert [str(result) for result in results] == ["failed", "failed"]
+        assert len(flights) == 0
+
+    async def test_cancelled_caller_does_not_cancel_the_others(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+
+        async def call() -> int:
+            await asyncio.sleep(0.01)
+            return 42
+
+        first = asyncio.create_task(flights.run("key", call))
+        second = asyncio.create_task(flights.run("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 42
+        with pytest.raises(asyncio.CancelledError):
+            await first
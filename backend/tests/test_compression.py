@@ -0,0 +1,147 @@
+import gzip
+
+import pytest
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pytest_mock import MockerFixture
+
+from tech_radar import compression
+from tech_radar.compression import CompressibleBody, compressor, negotiate_encoding
+from tech_radar.models import Technology
+
+
+class TestNegotiateEncoding:
+    """Test cases for picking the content encoding of responses."""
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected"),
+        [
+            (None, None),
+            ("identity", None),
+            ("gzip", "gzip"),
+            ("gzip, deflate, br, zstd", "br"),
+            ("gzip, zstd", "zstd"),
+            ("br;q=0.5, zstd;q=0.8, gzip;q=0.2", "zstd"),
+            ("*", "br"),
+            ("*, br;q=0", "zstd"),
+            ("gzip;q=0", None),
+        ],
+    )
+    def test_negotiate_encoding(self, accept_encoding: str | None, expected: str | None) -> None:
+        assert negotiate_encoding(accept_encoding) == expected
+
+    def test_bodies_are_compressed_once_per_encoding(self, mocker: MockerFixture) -> None:
+        compress = mocker.spy(compression, "compress")
+        body = CompressibleBody(b"technologies" * 100)
+
+        assert gzip.decompress(body.compressed("gzip")) == body.content
+        body.compressed("gzip")
+
+        assert compress.call_count == 1
+
+
+async def _get(async_client: AsyncClient, url: str, accept_encoding: str) -> Response:
+    response: Response = await async_client.get(url, headers={"Accept-Encoding": accept_encoding})
+    return response
+
+
+class TestCompressedResponses:
+    """Test cases for the compression of responses."""
+
+    @pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+    async def test_list_is_compressed(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        encoding: str,
+    ) -> None:
+        uncompressed = await _get(async_client, "/technologies/", "identity")
+
+        response = await _get(async_client, "/technologies/", encoding)
+
+        assert "content-encoding" not in uncompressed.headers
+        assert response.headers["content-encoding"] == encoding
+        assert int(response.headers["content-length"]) < len(uncompressed.content)
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == uncompressed.json()
+
+    async def test_compressed_variants_have_their_own_etag(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        uncompressed = await _get(async_client, "/technologies/", "identity")
+        gzipped = await _get(async_client, "/technologies/", "gzip")
+        brotli = await _get(async_client, "/technologies/", "br")
+
+        etags = {response.headers["etag"] for response in (uncompressed, gzipped, brotli)}
+        assert len(etags) == 3
+
+        revalidated: Response = await async_client.get(
+            "/technologies/",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": gzipped.headers["etag"]},
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == gzipped.headers["etag"]
+
+    async def test_cached_list_is_compressed_once(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        mocker: MockerFixture,
+    ) -> None:
+        compress = mocker.spy(compression, "compress")
+
+        for _ in range(3):
+            response = await _get(async_client, "/technologies/", "gzip")
+            assert response.headers["content-encoding"] == "gzip"
+
+        assert compress.call_count == 1
+
+    async def test_small_responses_are_not_compressed(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(compressor, "minimum_size", 1_000_000)
+
+        response = await _get(async_client, "/technologies/", "gzip")
+
+        assert "content-encoding" not in response.headers
+
+    async def test_other_responses_are_compressed_by_the_middleware(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(compressor, "minimum_size", 0)
+
+        response = await _get(async_client, "/analytics/", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json()["stuck_days"] == 180
+
+    async def test_streams_are_not_compressed(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(compressor, "minimum_size", 0)
+
+        response: Response = await async_client.get(
+            "/technologies/",
+            headers={"Accept": "application/x-ndjson", "Accept-Encoding": "gzip"},
+        )
+
+        assert "content-encoding" not in response.headers
+        assert len(response.text.splitlines()) == len(sample_technologies)
@@ -0,0 +1,30 @@
+from tech_radar.etags import encoded_etag, make_etag, matching_etag
+
+
+class TestETags:
+    """Test cases for ETag helpers."""
+
+    def test_etag_is_strong_and_deterministic(self) -> None:
+        etag = make_etag(3, "filters")
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag(3, "filters")
+        assert etag != make_etag(4, "filters")
+
+    def test_if_none_match_comparison(self) -> None:
+        etag = make_etag(1)
+
+        assert matching_etag(etag, etag) == etag
+        assert matching_etag(f'"other", W/{etag}', etag) == f"W/{etag}"
+        assert matching_etag("*", etag) == etag
+        assert matching_etag(None, etag) is None
+        assert matching_etag(make_etag(2), etag) is None
+
+    def test_encoded_etags_match_their_representation(self) -> None:
+        etag = make_etag(1)
+        gzip_etag = encoded_etag(etag, "gzip")
+
+        assert gzip_etag != etag
+        assert gzip_etag.startswith('"') and gzip_etag.endswith('-gzip"')
+        assert matching_etag(gzip_etag, etag) == gzip_etag
+        assert matching_etag(encoded_etag(make_etag(2), "gzip"), etag) is None
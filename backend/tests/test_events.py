@@ -0,0 +1,82 @@
+from httpx import AsyncClient
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.events import ChangeBroker, ChangeEvent, change_broker
+from tech_radar.models import Technology
+from tech_radar.routes.technologies import _event_stream
+
+
+def _event(version: int) -> ChangeEvent:
+    return ChangeEvent(type="upsert", names=["React"], version=version)
+
+
+class TestChangeBroker:
+    """Test cases for the fan-out of change events."""
+
+    async def test_events_are_fanned_out(self) -> None:
+        broker = ChangeBroker()
+        async with broker.subscribe() as first, broker.subscribe() as second:
+            broker.publish(_event(1))
+
+            assert await first.get(1) == _event(1)
+            assert await second.get(1) == _event(1)
+            assert await first.get(0.01) is None
+
+        assert len(broker) == 0
+
+    async def test_slow_subscribers_are_dropped(self) -> None:
+        broker = ChangeBroker(queue_size=2)
+        async with broker.subscribe() as slow, broker.subscribe() as fast:
+            for version in range(1, 4):
+                broker.publish(_event(version))
+                await fast.get(1)
+
+            assert slow.dropped
+            assert not fast.dropped
+            assert len(broker) == 1
+
+    async def test_event_stream(self) -> None:
+        broker = ChangeBroker(queue_size=1)
+        async with broker.subscribe() as subscription:
+            stream = _event_stream(subscription)
+            assert await anext(stream) == b"retry: 1000\n\n"
+
+            broker.publish(_event(7))
+            message = await anext(stream)
+            assert message.startswith(b"id: 7\nevent: upsert\ndata: {")
+
+            # The stream of a dropped subscriber ends
+            broker.publish(_event(8))
+            broker.publish(_event(9))
+            assert [message async for message in stream] == []
+
+
+class TestWriteEvents:
+    """Test cases for the events published by the write routes."""
+
+    async def test_writes_publish_events(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        async with change_broker.subscribe() as subscription:
+            await async_client.post(
+                "/technologies/bulk",
+                json=[
+                    {"name": name, "stageTransition": {"newStage": "Trial", "adrLink": "adr"}}
+                    for name in ["Rust", "GraphQL"]
+                ],
+            )
+            await async_client.delete("/technologies/React")
+
+            upsert = await subscription.get(1)
+            delete = await subscription.get(1)
+
+        assert upsert is not None
+        assert upsert.type == "upsert"
+        assert upsert.names == ["GraphQL", "Rust"]
+        assert delete is not None
+        assert delete.type == "delete"
+        assert delete.names == ["React"]
+        assert delete.version > upsert.version
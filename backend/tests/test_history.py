@@ -0,0 +1,79 @@
+from datetime import datetime
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
+
+from tech_radar.history import find_transitions, migrate_embedded_transitions
+from tech_radar.models import StageTransitionRecord, Technology
+
+
+class TestMigrateEmbeddedTransitions:
+    """Test cases for moving embedded stage transitions to their own collection."""
+
+    async def test_transitions_are_moved(self, mock_db: AsyncIOMotorDatabase[Technology]) -> None:
+        collection = Technology.get_pymongo_collection()
+        await collection.insert_one(
+            {
+                "name": "Legacy",
+                "category": "Frameworks",
+                "stage": "Adopt",
+                "tags": [],
+                "detailsPage": None,
+                "history": {
+                    "discoveryDate": datetime(2020, 1, 1),
+                    "stageTransitions": [
+                        {
+                            "originalStage": "Trial",
+                            "transitionDate": datetime(2021, 1, 1),
+                            "adrLink": "adr/2",
+                        },
+                        {
+                            "originalStage": "Assess",
+                            "transitionDate": datetime(2020, 6, 1),
+                            "adrLink": "adr/1",
+                        },
+                    ],
+                },
+            }
+        )
+
+        # Running the migration again changes nothing
+        await migrate_embedded_transitions()
+        await migrate_embedded_transitions()
+
+        legacy = await Technology.find_one(Technology.name == "Legacy")
+        assert legacy is not None
+        assert legacy.history.transitionCount == 2
+        assert legacy.history.lastTransition is not None
+        assert legacy.history.lastTransition.adrLink == "adr/2"
+        document = await collection.find_one({"name": "Legacy"})
+        assert document is not None
+        assert "stageTransitions" not in document["history"]
+
+        records = (
+            await StageTransitionRecord.find({"technology": "Legacy"}).sort("sequence").to_list()
+        )
+        assert [record.adrLink for record in records] == ["adr/1", "adr/2"]
+        assert [record.sequence for record in records] == [1, 2]
+
+        page = await find_transitions("Legacy", limit=10)
+        assert [(t.originalStage, t.newStage) for t in page.transitions] == [
+            ("Trial", "Adopt"),
+            ("Assess", "Trial"),
+        ]
+
+    async def test_transitions_are_unique_per_date(
+        self, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        transition = {
+            "technology": "Legacy",
+            "originalStage": "Assess",
+            "newStage": "Trial",
+            "transitionDate": datetime(2020, 6, 1),
+            "adrLink": "adr/1",
+        }
+        await StageTransitionRecord.get_pymongo_collection().insert_one(dict(transition))
+
+        with pytest.raises(DuplicateKeyError):
+            await StageTransitionRecord.get_pymongo_collection().insert_one(dict(transition))
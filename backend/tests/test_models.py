@@ -27,7 +27,7 @@ class TestTechnologyModels:
                 stage="Adopt",
                 tags=["test"],
                 detailsPage=None,
-                history=History(discoveryDate=datetime.now(), stageTransitions=[]),
+                history=History(discoveryDate=datetime.now()),
             )
             assert tech.category == category
 
@@ -39,7 +39,7 @@ class TestTechnologyModels:
                 stage="Adopt",
                 tags=["test"],
                 detailsPage=None,
-                history=History(discoveryDate=datetime.now(), stageTransitions=[]),
+                history=History(discoveryDate=datetime.now()),
             )
 
     def test_valid_stage_validation_are_accepted(
@@ -54,7 +54,7 @@ class TestTechnologyModels:
                 stage=stage,
                 tags=["test"],
                 detailsPage=None,
-                history=History(discoveryDate=datetime.now(), stageTransitions=[]),
+                history=History(discoveryDate=datetime.now()),
             )
             assert tech.stage == stage
 
@@ -66,5 +66,5 @@ class TestTechnologyModels:
                 stage="InvalidStage",
                 tags=["test"],
                 detailsPage=None,
-                history=History(discoveryDate=datetime.now(), stageTransitions=[]),
+                history=History(discoveryDate=datetime.now()),
             )
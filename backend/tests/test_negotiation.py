@@ -0,0 +1,21 @@
+import pytest
+
+from tech_radar.negotiation import accepted_values, quality
+
+
+class TestNegotiation:
+    """Test cases for parsing Accept-style headers."""
+
+    @pytest.mark.parametrize(
+        ("parameters", "expected"),
+        [("", 1), (" q=0.5", 0.5), ("level=1; Q=0", 0), ("q=high", 0)],
+    )
+    def test_quality(self, parameters: str, expected: float) -> None:
+        assert quality(parameters) == expected
+
+    def test_accepted_values(self) -> None:
+        assert accepted_values("Application/JSON;q=0.5, application/cbor") == [
+            ("application/json", 0.5),
+            ("application/cbor", 1),
+        ]
+        assert accepted_values(None) == [("", 1)]
@@ -0,0 +1,43 @@
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import Technology
+from tech_radar.queries import TechnologyFilters, find_technologies
+
+
+class TestTechnologyFilters:
+    """Test cases for the list query filters normalization."""
+
+    def test_empty_values_are_dropped(self) -> None:
+        filters = TechnologyFilters.from_query("", [""], ["", "Adopt"], None)
+
+        assert filters == TechnologyFilters(stages=("Adopt",))
+        assert filters.to_mongo() == {"stage": {"$in": ["Adopt"]}}
+
+    def test_equivalent_queries_are_equal(self) -> None:
+        first = TechnologyFilters.from_query("x", ["b", "a"], None, ["t", "t"])
+        second = TechnologyFilters.from_query("x", ["a", "b", "a"], [], ["t"])
+
+        assert first == second
+        assert hash(first) == hash(second)
+
+
+class TestFindTechnologies:
+    """Test cases for the single round trip list query."""
+
+    async def test_counts_are_returned_per_value(
+        self,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        result = await find_technologies(TechnologyFilters(categories=("Frameworks",)))
+
+        assert {tech.name for tech in result.technologies} == {"React", "GraphQL", "Rust"}
+        assert result.total_count == 3
+        assert result.category_counts == {"Frameworks": 3}
+        assert result.stage_counts == {"Adopt": 1, "Assess": 1, "Hold": 1}
+        assert result.category_stage_counts == {"Frameworks": {"Adopt": 1, "Assess": 1, "Hold": 1}}
+        assert result.tag_counts["ui"] == 1
+        assert "devops" not in result.tag_counts
+        # Available tags are taken from the whole collection
+        assert "devops" in result.available_tags
+        assert result.available_tags == sorted(result.available_tags)
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import History, Technology
+from tech_radar.search import MAX_PREFIX_LENGTH, query_terms, search_terms
+
+
+class TestSearchTerms:
+    """Test cases for the search terms normalization."""
+
+    def test_terms_are_lowercase_word_prefixes(self) -> None:
+        terms = search_terms("Vue.js", "Frameworks", ["query-language"])
+
+        assert {"v", "vu", "vue", "js", "fr", "frameworks", "query", "lang"} <= set(terms)
+        assert "vue.js" not in terms
+        assert "ue" not in terms
+
+    def test_long_words_are_truncated(self) -> None:
+        terms = search_terms("a" * 50, "Frameworks", [])
+
+        assert max(len(term) for term in terms) == MAX_PREFIX_LENGTH
+        assert query_terms("a" * 50) == ["a" * MAX_PREFIX_LENGTH]
+
+    def test_query_terms_ignore_punctuation(self) -> None:
+        assert query_terms("  Dev-Ops, dev ") == ["dev", "ops"]
+        assert query_terms("++") == []
+
+    async def test_terms_are_stored_and_backfilled(
+        self, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        technology = Technology(
+            name="Grafana",
+            category="Observability",
+            stage="Adopt",
+            tags=["dashboards"],
+            detailsPage=None,
+            history=History(discoveryDate=datetime(2023, 1, 1)),
+        )
+        await technology.save()
+        collection = Technology.get_pymongo_collection()
+        stored = await collection.find_one({"name": "Grafana"})
+        assert stored is not None
+        assert "graf" in stored["searchTerms"]
+
+        await collection.update_one(
+            {"name": "Grafana"}, {"$unset": {"searchTerms": "", "nameSearchTerms": ""}}
+        )
+        await Technology.backfill_search_terms()
+
+        stored = await collection.find_one({"name": "Grafana"})
+        assert stored is not None
+        assert "dash" in stored["searchTerms"]
+        assert stored["nameSearchTerms"] == ["g", "gr", "gra", "graf", "grafa", "grafan", "grafana"]
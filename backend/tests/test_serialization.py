@@ -0,0 +1,224 @@
+import json
+from datetime import datetime
+from typing import Any
+
+import cbor2
+import msgpack
+import pytest
+from httpx import AsyncClient, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from tech_radar.models import Technology, TechnologySummary
+from tech_radar.queries import View
+from tech_radar.routes.technologies import list_cache
+from tech_radar.serialization import (
+    CBOR_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    dumps,
+    negotiate_media_type,
+    response_serializer,
+    technology_json,
+)
+from tech_radar.snapshot import radar_snapshot
+
+# A document of a technology that was stored before the history summary and updatedAt existed
+LEGACY_DOCUMENT: dict[str, Any] = {
+    "name": "Legacy",
+    "category": "Frameworks",
+    "stage": "Hold",
+    "tags": ["old"],
+    "detailsPage": None,
+    "history": {"discoveryDate": datetime(2020, 1, 1, 12, 30, 15, 123000)},
+}
+
+TRANSITIONED_DOCUMENT: dict[str, Any] = {
+    "name": "Transitioned",
+    "category": "Observability",
+    "stage": "Adopt",
+    "tags": [],
+    "detailsPage": "https://example.com",
+    "history": {
+        "discoveryDate": datetime(2021, 1, 1),
+        "lastTransition": {
+            "originalStage": "Trial",
+            "transitionDate": datetime(2022, 1, 1),
+            "adrLink": "adr/1",
+        },
+        "transitionCount": 3,
+    },
+    "updatedAt": datetime(2022, 1, 1, 0, 0, 1),
+    "revision": 4,
+    "syncVersion": 7,
+}
+
+
+class TestTechnologyJson:
+    """Test cases for shaping raw documents like the serialized models."""
+
+    @pytest.mark.parametrize("document", [LEGACY_DOCUMENT, TRANSITIONED_DOCUMENT])
+    @pytest.mark.parametrize("view", ["full", "summary"])
+    async def test_same_json_as_models(
+        self,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        document: dict[str, Any],
+        view: View,
+    ) -> None:
+        collection = Technology.get_pymongo_collection()
+        await collection.insert_one(dict(document))
+        stored = await collection.find_one({"name": document["name"]})
+        assert stored is not None
+
+        model = Technology if view == "full" else TechnologySummary
+        expected = model.model_validate(stored).model_dump_json(by_alias=True)
+
+        assert json.loads(dumps(technology_json(stored, view))) == json.loads(expected)
+
+
+class TestResponseSerializer:
+    """Test cases for the fast serialization path of the technologies list."""
+
+    @pytest.mark.parametrize("params", [{}, {"view": "summary"}, {"search": "dock", "limit": 1}])
+    async def test_both_paths_return_the_same_response(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        monkeypatch: pytest.MonkeyPatch,
+        params: dict[str, Any],
+    ) -> None:
+        bodies = []
+        for fast in [True, False]:
+            monkeypatch.setattr(response_serializer, "fast", fast)
+            # Without the cache, so each path serializes the response itself
+            monkeypatch.setattr(list_cache, "max_entries", 0)
+            response: Response = await async_client.get("/technologies/", params=params)
+            bodies.append(response.json())
+
+        assert bodies[0] == bodies[1]
+        assert bodies[0]["technologies"]
+
+    @pytest.mark.parametrize("params", [{}, {"as_of": "2023-03-15"}])
+    async def test_both_paths_stream_the_same_technologies(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        monkeypatch: pytest.MonkeyPatch,
+        params: dict[str, Any],
+    ) -> None:
+        streams = []
+        for fast in [True, False]:
+            monkeypatch.setattr(response_serializer, "fast", fast)
+            response: Response = await async_client.get(
+                "/technologies/", params=params, headers={"Accept": "application/x-ndjson"}
+            )
+            streams.append([json.loads(line) for line in response.text.splitlines()])
+
+        assert streams[0] == streams[1]
+        assert streams[0]
+
+    async def test_both_paths_return_the_same_response_from_memory(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        await radar_snapshot.load()
+        bodies = []
+        for fast in [True, False]:
+            monkeypatch.setattr(response_serializer, "fast", fast)
+            monkeypatch.setattr(list_cache, "max_entries", 0)
+            response: Response = await async_client.get("/technologies/", params={"search": "r"})
+            bodies.append(response.json())
+
+        assert bodies[0] == bodies[1]
+
+
+def _decode(response: Response) -> Any:
+    """Decode a binary response, with its dates as ISO strings like in JSON responses."""
+    if response.headers["content-type"] == MSGPACK_MEDIA_TYPE:
+        value = msgpack.unpackb(response.content, timestamp=3)
+    else:
+        value = cbor2.loads(response.content)
+    # The binary formats carry absolute timestamps, the JSON ones are the stored local times
+    return json.loads(
+        json.dumps(value, default=lambda date: date.astimezone().replace(tzinfo=None).isoformat())
+    )
+
+
+class TestContentNegotiation:
+    """Test cases for the MessagePack and CBOR responses."""
+
+    @pytest.mark.parametrize(
+        ("accept", "expected"),
+        [
+            (None, JSON_MEDIA_TYPE),
+            ("*/*", JSON_MEDIA_TYPE),
+            ("text/html", JSON_MEDIA_TYPE),
+            ("application/msgpack", MSGPACK_MEDIA_TYPE),
+            ("application/x-msgpack", MSGPACK_MEDIA_TYPE),
+            ("application/cbor, application/msgpack", CBOR_MEDIA_TYPE),
+            ("application/json;q=0.5, application/cbor", CBOR_MEDIA_TYPE),
+            ("application/cbor;q=0.2, */*;q=0.8", JSON_MEDIA_TYPE),
+            ("application/msgpack;q=0", JSON_MEDIA_TYPE),
+        ],
+    )
+    def test_negotiate_media_type(self, accept: str | None, expected: str) -> None:
+        assert negotiate_media_type(accept) == expected
+
+    @pytest.mark.parametrize("media_type", [MSGPACK_MEDIA_TYPE, CBOR_MEDIA_TYPE])
+    @pytest.mark.parametrize("fast", [True, False])
+    async def test_same_list_as_json(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        monkeypatch: pytest.MonkeyPatch,
+        media_type: str,
+        fast: bool,
+    ) -> None:
+        monkeypatch.setattr(response_serializer, "fast", fast)
+        expected = (await async_client.get("/technologies/")).json()
+
+        response: Response = await async_client.get(
+            "/technologies/", headers={"Accept": media_type}
+        )
+
+        assert response.headers["content-type"] == media_type
+        assert _decode(response) == expected
+
+    @pytest.mark.parametrize("media_type", [MSGPACK_MEDIA_TYPE, CBOR_MEDIA_TYPE])
+    async def test_same_technology_as_json(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        media_type: str,
+    ) -> None:
+        expected: Response = await async_client.get("/technologies/React")
+
+        response: Response = await async_client.get(
+            "/technologies/React", headers={"Accept": media_type}
+        )
+
+        assert response.headers["content-type"] == media_type
+        assert response.headers["etag"] != expected.headers["etag"]
+        assert _decode(response) == expected.json()
+
+    async def test_dates_decode_as_datetimes(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        response: Response = await async_client.get(
+            "/technologies/batch",
+            params={"names": ["React", "Missing"]},
+            headers={"Accept": MSGPACK_MEDIA_TYPE},
+        )
+        data = msgpack.unpackb(response.content, timestamp=3)
+
+        assert data["not_found"] == ["Missing"]
+        assert isinstance(data["technologies"][0]["history"]["discoveryDate"], datetime)
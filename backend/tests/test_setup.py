@@ -1,8 +1,15 @@
 """Basic setup and configuration tests."""
 
+from datetime import datetime
+from typing import Any
+
+import pytest
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from tech_radar.models import History, Technology
+from tech_radar.database import NAME_INDEX, DuplicateNamesError, make_name_index_unique
+from tech_radar.history import find_transitions
+from tech_radar.main import migrate_database
+from tech_radar.models import History, StageTransitionRecord, Technology
 from tech_radar.routes.technologies import TechnologyMetadata, TechnologyResponse
 
 
@@ -31,3 +38,80 @@ class TestBasicSetup:
         received_names: set[str] = {tech.name for tech in technologies}
         expected_names: set[str] = {tech.name for tech in sample_technologies}
         assert received_names == expected_names
+
+
+class TestMigrateDatabase:
+    """Test the startup migrations of databases written by earlier versions."""
+
+    async def test_baseline_documents_keep_their_history(
+        self, mock_db: AsyncIOMotorDatabase[Technology]
+    ) -> None:
+        """Test that a document without any of the newer fields is fully migrated."""
+        collection = Technology.get_pymongo_collection()
+        await collection.insert_one(
+            {
+                "name": "Legacy Framework",
+                "category": "Frameworks",
+                "stage": "Trial",
+                "tags": ["web"],
+                "detailsPage": None,
+                "history": {
+                    "discoveryDate": datetime(2020, 1, 1),
+                    "stageTransitions": [
+                        {
+                            "originalStage": "Assess",
+                            "transitionDate": datetime(2021, 1, 1),
+                            "adrLink": "adr/1",
+                        }
+                    ],
+                },
+            }
+        )
+
+        await migrate_database()
+
+        document = await collection.find_one({"name": "Legacy Framework"})
+        assert document is not None
+        assert document["history"]["transitionCount"] == 1
+        assert document["history"]["lastTransition"]["adrLink"] == "adr/1"
+        assert "legacy" in document["searchTerms"]
+        assert "web" in document["searchTerms"]
+        assert document["nameSearchTerms"]
+        assert await StageTransitionRecord.find({"technology": "Legacy Framework"}).count() == 1
+        page = await find_transitions("Legacy Framework", limit=10)
+        assert [(t.originalStage, t.newStage) for t in page.transitions] == [("Assess", "Trial")]
+
+    async def test_non_unique_name_index_is_dropped(
+        self, mock_db: AsyncIOMotorDatabase[Any]
+    ) -> None:
+        """Test that the name index of an older database is dropped to be created again."""
+        collection = mock_db.get_collection("LegacyTechnology")
+        await collection.create_index("name")
+        await collection.insert_many([{"name": "React"}, {"name": "Vue"}])
+
+        await make_name_index_unique(collection)
+
+        assert NAME_INDEX not in await collection.index_information()
+
+    async def test_unique_name_index_is_kept(self, mock_db: AsyncIOMotorDatabase[Any]) -> None:
+        """Test that the migration does nothing once the name index is unique."""
+        collection = mock_db.get_collection("LegacyTechnology")
+        await collection.create_index("name", unique=True)
+
+        await make_name_index_unique(collection)
+
+        assert NAME_INDEX in await collection.index_information()
+
+    async def test_duplicate_names_are_reported(self, mock_db: AsyncIOMotorDatabase[Any]) -> None:
+        """Test that duplicated names keep the index and are reported."""
+        collection = mock_db.get_collection("LegacyTechnology")
+        await collection.create_index("name")
+        await collection.insert_many(
+            [{"name": "React"}, {"name": "Vue"}, {"name": "React"}, {"name": "Vue"}, {"name": "Go"}]
+        )
+
+        with pytest.raises(DuplicateNamesError) as error:
+            await make_name_index_unique(collection)
+
+        assert error.value.names == ["React", "Vue"]
+        assert NAME_INDEX in await collection.index_information()
@@ -0,0 +1,171 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pytest_mock import MockerFixture
+
+import tech_radar.routes.technologies as technologies_routes
+from tech_radar.models import History, Technology
+from tech_radar.queries import Page, TechnologyFilters, find_technologies
+from tech_radar.snapshot import RadarSnapshot, radar_snapshot
+from tech_radar.versions import bump_version
+
+
+class TestRadarSnapshot:
+    """Test cases for the in-memory replica of the radar."""
+
+    # Results are compared as serialized for clients, the snapshot keeps the internal search
+    # terms of the technologies it indexes
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            TechnologyFilters(),
+            TechnologyFilters(categories=("Frameworks",)),
+            TechnologyFilters(stages=("Adopt", "Hold"), tags=("devops", "ui")),
+            TechnologyFilters(search="rea"),
+            TechnologyFilters(search="dev ops"),
+            TechnologyFilters(search="ER", search_mode="substring"),
+            TechnologyFilters(search="nothing"),
+        ],
+    )
+    async def test_matches_database_results(
+        self,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        filters: TechnologyFilters,
+    ) -> None:
+        snapshot = RadarSnapshot()
+        await snapshot.load()
+
+        for page in [Page(), Page(limit=2)]:
+            expected = await find_technologies(filters, page)
+            assert snapshot.find_technologies(filters, page).model_dump() == expected.model_dump()
+
+            # Following the pages gives the same results too
+            while expected.next_cursor is not None:
+                page = Page.from_query(2, expected.next_cursor)
+                expected = await find_technologies(filters, page)
+                assert (
+                    snapshot.find_technologies(filters, page).model_dump() == expected.model_dump()
+                )
+
+    async def test_summary_view(
+        self,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        snapshot = RadarSnapshot()
+        await snapshot.load()
+
+        filters = TechnologyFilters(stages=("Adopt",))
+        expected = await find_technologies(filters, view="summary")
+        assert snapshot.find_technologies(filters, view="summary").model_dump() == (
+            expected.model_dump()
+        )
+
+    async def test_raw_documents(
+        self,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        snapshot = RadarSnapshot()
+        await snapshot.load()
+
+        filters = TechnologyFilters(search="dev")
+        expected = await find_technologies(filters)
+        result = snapshot.find_technologies(filters, hydrate=False)
+
+        assert result.technologies == []
+        assert [document["name"] for document in result.documents] == [
+            tech.name for tech in expected.technologies
+        ]
+        # The search terms are only held by the indexes
+        assert all("searchTerms" not in document for document in result.documents)
+        assert result.total_count == expected.total_count
+
+    async def test_upsert_and_remove_keep_indexes_current(
+        self,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        snapshot = RadarSnapshot()
+        await snapshot.load()
+
+        rust = await Technology.get_pymongo_collection().find_one({"name": "Rust"})
+        assert rust is not None
+        snapshot.upsert({**rust, "stage": "Adopt", "tags": ["fast"]})
+        snapshot.remove("React")
+
+        result = snapshot.find_technologies(TechnologyFilters(stages=("Adopt",)))
+        assert [tech.name for tech in result.technologies] == ["Docker", "Rust"]
+        assert "performance" not in result.available_tags
+        assert snapshot.find_technologies(TechnologyFilters(tags=("ui",))).total_count == 0
+        assert len(snapshot) == len(sample_technologies) - 1
+
+    async def test_reload_picks_up_writes(
+        self,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        snapshot = RadarSnapshot()
+        await snapshot.load()
+
+        await Technology(
+            name="Zig",
+            category="Frameworks",
+            stage="Assess",
+            tags=["systems"],
+            detailsPage=None,
+            history=History(discoveryDate=datetime(2024, 1, 1)),
+        ).insert()
+        version = await bump_version(Technology)
+        await snapshot.load()
+
+        assert snapshot.version == version
+        result = snapshot.find_technologies(TechnologyFilters(search="zig"))
+        assert [tech.name for tech in result.technologies] == ["Zig"]
+
+    async def test_polling_follows_writes(
+        self,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+    ) -> None:
+        snapshot = RadarSnapshot()
+        await snapshot.load()
+        follow_task = asyncio.create_task(snapshot.follow(poll_interval_seconds=0.01))
+        try:
+            await Technology.find_one(Technology.name == "React").delete()
+            version = await bump_version(Technology)
+            for _ in range(100):
+                if snapshot.version == version:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            follow_task.cancel()
+
+        assert snapshot.version == version
+        assert snapshot.find_technologies(TechnologyFilters()).total_count == 4
+
+
+class TestMemoryReadMode:
+    """Test cases for the list endpoint answered from the radar snapshot."""
+
+    async def test_list_is_answered_from_memory(
+        self,
+        async_client: AsyncClient,
+        mock_db: AsyncIOMotorDatabase[Technology],
+        sample_technologies: list[Technology],
+        mocker: MockerFixture,
+    ) -> None:
+        await radar_snapshot.load()
+        find_spy = mocker.spy(technologies_routes, "find_technologies")
+        version_spy = mocker.spy(technologies_routes, "get_version")
+
+        response = await async_client.get("/technologies/", params={"stages": "Adopt"})
+
+        assert [tech["name"] for tech in response.json()["technologies"]] == ["Docker", "React"]
+        assert find_spy.call_count == 0
+        assert version_spy.call_count == 0
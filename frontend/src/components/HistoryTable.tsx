@@ -1,38 +1,49 @@
 import { ArrowRightOutlined } from '@ant-design/icons';
+import { useQuery } from '@tanstack/react-query';
 import { Table, type TableProps } from 'antd';
 import type { ExpandableConfig } from 'antd/es/table/interface';
-import type { Stage, StageTransition, Technology } from '../hooks/useTechnologies';
+import type { Stage, Technology } from '../hooks/useTechnologies';
+import { getTechnologyHistory, type RecordedStageTransition } from '../libraries/api/technologies';
 import type { NullableBy, ReplaceProperty } from '../libraries/typesUtilities';
+import ErrorBox from './ErrorBox';
 
 type StageView = Stage | 'Off Radar';
 type StageTransitionView = NullableBy<
-	ReplaceProperty<StageTransition, 'originalStage', StageView>,
+	ReplaceProperty<RecordedStageTransition, 'originalStage', StageView>,
 	'adrLink'
 >;
 
-const HistoryTable: ExpandableConfig<Technology>['expandedRowRender'] = (tech) => {
+const TechnologyHistory = ({ tech }: { tech: Technology }) => {
+	// The transition count is part of the key, so the history is fetched again after a transition
+	const { data, isPending, error } = useQuery({
+		queryKey: ['technology-history', tech.name, tech.history.transitionCount],
+		queryFn: () => getTechnologyHistory(tech.name),
+	});
+
+	if (error) {
+		return <ErrorBox errorMessage={`Failed to fetch the history of ${tech.name}`} error={error} />;
+	}
+
+	// Transitions are returned newest first, the technology was discovered before the oldest one
+	const recordedTransitions = data ?? [];
 	const transitions: StageTransitionView[] = [
+		...recordedTransitions,
 		{
 			originalStage: 'Off Radar',
+			newStage: recordedTransitions.at(-1)?.originalStage ?? tech.stage,
 			transitionDate: tech.history.discoveryDate,
 			adrLink: null,
 		},
-		...tech.history.stageTransitions,
 	];
-	const sortedTransitions: StageTransitionView[] = transitions.sort(
-		(t1, t2) => t2.transitionDate.getTime() - t1.transitionDate.getTime(),
-	);
 	const columns: TableProps<StageTransitionView>['columns'] = [
 		{
 			title: 'Transitions',
 			dataIndex: 'originalStage',
 			key: 'transitions',
-			render: (originalStage: StageView, entry, index) => {
-				const nextStage =
-					index === transitions.length - 1 ? tech.stage : transitions[index + 1]?.originalStage;
+			render: (originalStage: StageView, entry) => {
 				const TransitionContent = () => (
 					<>
-						{originalStage} <ArrowRightOutlined /> {nextStage}
+						{originalStage} <ArrowRightOutlined /> {entry.newStage}
 					</>
 				);
 				if (entry.adrLink !== null && entry.adrLink !== undefined) {
@@ -70,7 +81,8 @@ const HistoryTable: ExpandableConfig<Technology>['expandedRowRender'] = (tech) =
 	return (
 		<Table<StageTransitionView>
 			columns={columns}
-			dataSource={sortedTransitions}
+			dataSource={isPending ? [] : transitions}
+			loading={isPending}
 			size="small"
 			rowKey={'transitionDate'}
 			pagination={false}
@@ -78,4 +90,8 @@ const HistoryTable: ExpandableConfig<Technology>['expandedRowRender'] = (tech) =
 	);
 };
 
+const HistoryTable: ExpandableConfig<Technology>['expandedRowRender'] = (tech) => (
+	<TechnologyHistory tech={tech} />
+);
+
 export default HistoryTable;
@@ -46,10 +46,8 @@ const createNewTechnologyDocument = (
 		stage: editValues.stageTransition ? editValues.stageTransition.newStage : original.stage,
 		history: {
 			discoveryDate: original.history.discoveryDate,
-			stageTransitions: [
-				...original.history.stageTransitions,
-				...(stageTransition ? [stageTransition] : []),
-			],
+			lastTransition: stageTransition ?? original.history.lastTransition,
+			transitionCount: original.history.transitionCount + (stageTransition ? 1 : 0),
 		},
 	};
 };
@@ -64,7 +62,7 @@ export const useTechnologiesStore = create<TechnologyStoreState & TechnologyStor
 					...state.technologies,
 					{
 						...technology,
-						history: { stageTransitions: [], discoveryDate: new Date() },
+						history: { discoveryDate: new Date(), lastTransition: null, transitionCount: 0 },
 					},
 				],
 				previous_state: state.technologies,
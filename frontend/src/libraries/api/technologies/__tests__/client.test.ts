@@ -25,8 +25,9 @@ describe('Technologies API Client', () => {
 						tags: ['frontend'],
 						detailsPage: 'https://react.dev',
 						history: {
-							stageTransitions: [],
 							discoveryDate: '2024-01-01T00:00:00Z',
+							lastTransition: null,
+							transitionCount: 0,
 						},
 					},
 				],
@@ -46,6 +47,7 @@ describe('Technologies API Client', () => {
 			const result = await getTechnologies();
 			expect(result).toEqual({
 				...mockResponse,
+				metadata: { ...mockResponse.metadata, next_cursor: null },
 				technologies: [
 					{
 						...mockResponse.technologies[0],
@@ -56,7 +58,54 @@ describe('Technologies API Client', () => {
 					},
 				],
 			});
-			expect(mockFetch).toHaveBeenCalledWith('http://localhost:8000/technologies');
+			expect(mockFetch).toHaveBeenCalledWith('http://localhost:8000/technologies?limit=1000');
+		});
+
+		it('should fetch all the pages', async () => {
+			const technology = (name: string) => ({
+				name,
+				category: 'Frameworks',
+				stage: 'Adopt',
+				tags: [],
+				detailsPage: null,
+				history: {
+					discoveryDate: '2024-01-01T00:00:00Z',
+					lastTransition: null,
+					transitionCount: 0,
+				},
+			});
+			const metadata = {
+				total_count: 2,
+				categories: ['Frameworks'],
+				stages: ['Adopt'],
+				available_tags: [],
+			};
+
+			mockFetch
+				.mockResolvedValueOnce({
+					ok: true,
+					json: () =>
+						Promise.resolve({
+							technologies: [technology('Angular')],
+							metadata: { ...metadata, next_cursor: 'cursor' },
+						}),
+				})
+				.mockResolvedValueOnce({
+					ok: true,
+					json: () =>
+						Promise.resolve({
+							technologies: [technology('React')],
+							metadata: { ...metadata, next_cursor: null },
+						}),
+				});
+
+			const result = await getTechnologies();
+
+			expect(result.technologies.map((tech) => tech.name)).toEqual(['Angular', 'React']);
+			expect(result.metadata.total_count).toBe(2);
+			expect(mockFetch).toHaveBeenLastCalledWith(
+				'http://localhost:8000/technologies?limit=1000&after=cursor',
+			);
 		});
 
 		it('should handle query parameters correctly', async () => {
@@ -83,6 +132,7 @@ describe('Technologies API Client', () => {
 			});
 
 			const expectedUrl = new URL('http://localhost:8000/technologies');
+			expectedUrl.searchParams.set('limit', '1000');
 			expectedUrl.searchParams.set('search', 'react');
 			expectedUrl.searchParams.append('categories', 'Frameworks');
 			expectedUrl.searchParams.append('categories', 'Development Tools');
@@ -118,8 +168,9 @@ describe('Technologies API Client', () => {
 						tags: ['frontend'],
 						detailsPage: 'https://react.dev',
 						history: {
-							stageTransitions: [],
 							discoveryDate: '2024-01-01T00:00:00Z',
+							lastTransition: null,
+							transitionCount: 0,
 						},
 					},
 				],
@@ -6,6 +6,7 @@ import {
 	NewStageTransitionSchema,
 	STAGES,
 	StageTransitionSchema,
+	TechnologyHistoryPageSchema,
 	TechnologyHistorySchema,
 	TechnologyMetadataSchema,
 	TechnologySchema,
@@ -67,28 +68,28 @@ describe('Technologies Schemas', () => {
 	describe('TechnologyHistorySchema', () => {
 		it('should validate valid technology history', () => {
 			const validHistory = {
-				stageTransitions: [
-					{
-						originalStage: 'Hold',
-						transitionDate: '2024-01-15T10:30:00Z',
-						adrLink: 'https://example.com/adr/123',
-					},
-				],
 				discoveryDate: '2024-01-01T00:00:00Z',
+				lastTransition: {
+					originalStage: 'Hold',
+					transitionDate: '2024-01-15T10:30:00Z',
+					adrLink: 'https://example.com/adr/123',
+				},
+				transitionCount: 1,
 			};
 
 			const result = TechnologyHistorySchema.safeParse(validHistory);
 			expect(result.success).toBe(true);
 			if (result.success) {
-				expect(result.data.stageTransitions).toHaveLength(1);
+				expect(result.data.lastTransition?.transitionDate).toBeInstanceOf(Date);
 				expect(result.data.discoveryDate).toBeInstanceOf(Date);
 			}
 		});
 
 		it('should validate empty stage transitions', () => {
 			const validHistory = {
-				stageTransitions: [],
 				discoveryDate: '2024-01-01T00:00:00Z',
+				lastTransition: null,
+				transitionCount: 0,
 			};
 
 			const result = TechnologyHistorySchema.safeParse(validHistory);
@@ -96,6 +97,41 @@ describe('Technologies Schemas', () => {
 		});
 	});
 
+	describe('TechnologyHistoryPageSchema', () => {
+		it('should validate a page of transitions', () => {
+			const validPage = {
+				transitions: [
+					{
+						originalStage: 'Assess',
+						newStage: 'Trial',
+						transitionDate: '2024-01-15T10:30:00Z',
+						adrLink: 'https://example.com/adr/123',
+					},
+				],
+				next_cursor: null,
+			};
+
+			const result = TechnologyHistoryPageSchema.safeParse(validPage);
+			expect(result.success).toBe(true);
+		});
+
+		it('should reject a transition without its new stage', () => {
+			const invalidPage = {
+				transitions: [
+					{
+						originalStage: 'Assess',
+						transitionDate: '2024-01-15T10:30:00Z',
+						adrLink: 'https://example.com/adr/123',
+					},
+				],
+				next_cursor: 'cursor',
+			};
+
+			const result = TechnologyHistoryPageSchema.safeParse(invalidPage);
+			expect(result.success).toBe(false);
+		});
+	});
+
 	describe('TechnologySchema', () => {
 		it('should validate a complete technology object', () => {
 			const validTechnology = {
@@ -105,14 +141,13 @@ describe('Technologies Schemas', () => {
 				tags: ['frontend', 'javascript'],
 				detailsPage: 'https://react.dev',
 				history: {
-					stageTransitions: [
-						{
-							originalStage: 'Trial',
-							transitionDate: '2024-01-15T10:30:00Z',
-							adrLink: 'https://example.com/adr/123',
-						},
-					],
 					discoveryDate: '2024-01-01T00:00:00Z',
+					lastTransition: {
+						originalStage: 'Trial',
+						transitionDate: '2024-01-15T10:30:00Z',
+						adrLink: 'https://example.com/adr/123',
+					},
+					transitionCount: 3,
 				},
 			};
 
@@ -128,8 +163,9 @@ describe('Technologies Schemas', () => {
 				tags: ['frontend', 'javascript'],
 				detailsPage: null,
 				history: {
-					stageTransitions: [],
 					discoveryDate: '2024-01-01T00:00:00Z',
+					lastTransition: null,
+					transitionCount: 0,
 				},
 			};
 
@@ -145,8 +181,9 @@ describe('Technologies Schemas', () => {
 				tags: [],
 				detailsPage: null,
 				history: {
-					stageTransitions: [],
 					discoveryDate: '2024-01-01T00:00:00Z',
+					lastTransition: null,
+					transitionCount: 0,
 				},
 			};
 
@@ -162,8 +199,9 @@ describe('Technologies Schemas', () => {
 				tags: [],
 				detailsPage: null,
 				history: {
-					stageTransitions: [],
 					discoveryDate: '2024-01-01T00:00:00Z',
+					lastTransition: null,
+					transitionCount: 0,
 				},
 			};
 
@@ -179,8 +217,9 @@ describe('Technologies Schemas', () => {
 				tags: [],
 				detailsPage: null,
 				history: {
-					stageTransitions: [],
 					discoveryDate: '2024-01-01T00:00:00Z',
+					lastTransition: null,
+					transitionCount: 0,
 				},
 			};
 
@@ -196,8 +235,9 @@ describe('Technologies Schemas', () => {
 				tags: [],
 				detailsPage: 'not-a-url',
 				history: {
-					stageTransitions: [],
 					discoveryDate: '2024-01-01T00:00:00Z',
+					lastTransition: null,
+					transitionCount: 0,
 				},
 			};
 
@@ -255,8 +295,9 @@ describe('Technologies Schemas', () => {
 						tags: ['frontend'],
 						detailsPage: 'https://react.dev',
 						history: {
-							stageTransitions: [],
 							discoveryDate: '2024-01-01T00:00:00Z',
+							lastTransition: null,
+							transitionCount: 0,
 						},
 					},
 				],
@@ -2,15 +2,19 @@ import { handleResponse, handleVoidResponse } from '../errors';
 import {
 	AddTechnologyRequestSchema,
 	GetTechnologiesResponseSchema,
+	TechnologyHistoryPageSchema,
 	UpdateTechnologyRequestSchema,
 	type AddTechnologyRequest,
 	type GetTechnologiesResponse,
+	type RecordedStageTransition,
 	type UpdateTechnologyRequest,
 } from './schemas';
 
 const HOST = 'http://localhost:8000';
 
 // API client functions
+
+// Fetches all the matching technologies, page by page. The metadata describes all of them.
 export async function getTechnologies(params?: {
 	search?: string;
 	categories?: string[];
@@ -18,6 +22,7 @@ export async function getTechnologies(params?: {
 	tags?: string[];
 }): Promise<GetTechnologiesResponse> {
 	const url = new URL(`${HOST}/technologies`);
+	url.searchParams.set('limit', '1000');
 
 	if (params) {
 		if (params.search) {
@@ -40,8 +45,39 @@ export async function getTechnologies(params?: {
 		}
 	}
 
-	const response = await fetch(url.toString());
-	return handleResponse(response, GetTechnologiesResponseSchema);
+	let response = await fetch(url.toString());
+	const result = await handleResponse(response, GetTechnologiesResponseSchema);
+	let cursor = result.metadata.next_cursor ?? null;
+	while (cursor !== null) {
+		url.searchParams.set('after', cursor);
+		response = await fetch(url.toString());
+		const page = await handleResponse(response, GetTechnologiesResponseSchema);
+		result.technologies.push(...page.technologies);
+		cursor = page.metadata.next_cursor ?? null;
+	}
+	result.metadata.next_cursor = null;
+
+	return result;
+}
+
+// Fetches all the stage transitions of a technology, newest first
+export async function getTechnologyHistory(name: string): Promise<RecordedStageTransition[]> {
+	const transitions: RecordedStageTransition[] = [];
+	let cursor: string | null = null;
+	do {
+		const url = new URL(`${HOST}/technologies/${encodeURIComponent(name)}/history`);
+		url.searchParams.set('limit', '1000');
+		if (cursor !== null) {
+			url.searchParams.set('after', cursor);
+		}
+
+		const response = await fetch(url.toString());
+		const page = await handleResponse(response, TechnologyHistoryPageSchema);
+		transitions.push(...page.transitions);
+		cursor = page.next_cursor;
+	} while (cursor !== null);
+
+	return transitions;
 }
 
 export async function addTechnology(request: AddTechnologyRequest): Promise<void> {
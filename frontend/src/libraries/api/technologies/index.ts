@@ -1,10 +1,17 @@
-export { addTechnology, deleteTechnology, getTechnologies, updateTechnology } from './client';
+export {
+	addTechnology,
+	deleteTechnology,
+	getTechnologies,
+	getTechnologyHistory,
+	updateTechnology,
+} from './client';
 
 export type {
 	AddTechnologyRequest,
 	Category,
 	GetTechnologiesResponse,
 	NewStageTransition,
+	RecordedStageTransition,
 	Stage,
 	StageTransition,
 	Technology,
@@ -24,9 +24,20 @@ export const StageTransitionSchema = z.object({
 	adrLink: z.url({ error: 'ADR link must be a valid URL' }),
 });
 
+// The full list of transitions is fetched separately, see TechnologyHistoryPageSchema
 export const TechnologyHistorySchema = z.object({
-	stageTransitions: z.array(StageTransitionSchema),
 	discoveryDate: isoDateFormat,
+	lastTransition: StageTransitionSchema.nullable(),
+	transitionCount: z.number().int().min(0),
+});
+
+export const RecordedStageTransitionSchema = StageTransitionSchema.extend({
+	newStage: z.enum(STAGES),
+});
+
+export const TechnologyHistoryPageSchema = z.object({
+	transitions: z.array(RecordedStageTransitionSchema),
+	next_cursor: z.string().nullable(),
 });
 
 export const TechnologySchema = z.object({
@@ -40,6 +51,7 @@ export const TechnologySchema = z.object({
 
 export const TechnologyMetadataSchema = z.object({
 	total_count: z.number().int().min(0),
+	next_cursor: z.string().nullish(),
 	categories: z.array(z.string()),
 	stages: z.array(z.string()),
 	available_tags: z.array(z.string()),
@@ -76,6 +88,8 @@ export const UpdateTechnologyRequestSchema = z.object({
 export type Technology = z.infer<typeof TechnologySchema>;
 export type TechnologyHistory = z.infer<typeof TechnologyHistorySchema>;
 export type StageTransition = z.infer<typeof StageTransitionSchema>;
+export type RecordedStageTransition = z.infer<typeof RecordedStageTransitionSchema>;
+export type TechnologyHistoryPage = z.infer<typeof TechnologyHistoryPageSchema>;
 export type TechnologyMetadata = z.infer<typeof TechnologyMetadataSchema>;
 export type GetTechnologiesResponse = z.infer<typeof GetTechnologiesResponseSchema>;
 export type AddTechnologyRequest = z.infer<typeof AddTechnologyRequestSchema>;
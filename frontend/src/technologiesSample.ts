@@ -8,8 +8,9 @@ export const technologiesSample: Technology[] = [
 		tags: ['Logs'],
 		detailsPage: null,
 		history: {
-			stageTransitions: [],
 			discoveryDate: new Date(),
+			lastTransition: null,
+			transitionCount: 0,
 		},
 	},
 	{
@@ -19,8 +20,9 @@ export const technologiesSample: Technology[] = [
 		tags: ['Logs'],
 		detailsPage: null,
 		history: {
-			stageTransitions: [],
 			discoveryDate: new Date(),
+			lastTransition: null,
+			transitionCount: 0,
 		},
 	},
 	{
@@ -30,14 +32,13 @@ export const technologiesSample: Technology[] = [
 		tags: ['Monitoring'],
 		detailsPage: null,
 		history: {
-			stageTransitions: [
-				{
-					adrLink: 'https://www.google.com/',
-					transitionDate: new Date(),
-					originalStage: 'Assess',
-				},
-			],
 			discoveryDate: new Date(),
+			lastTransition: {
+				adrLink: 'https://www.google.com/',
+				transitionDate: new Date(),
+				originalStage: 'Assess',
+			},
+			transitionCount: 1,
 		},
 	},
 	{
@@ -47,8 +48,9 @@ export const technologiesSample: Technology[] = [
 		tags: ['Monitoring'],
 		detailsPage: null,
 		history: {
-			stageTransitions: [],
 			discoveryDate: new Date(),
+			lastTransition: null,
+			transitionCount: 0,
 		},
 	},
 ];